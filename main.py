@@ -1,38 +1,325 @@
-import pygame
+import time
+
+STARTUP_T0 = time.perf_counter()    # 시작 시간 측정 기준 (import 시간까지 포함하려고 제일 먼저)
+
+import argparse
+import os
+import random
 import sys
 
+import pygame
+
+from modules.assets import AssetPreloader
+from modules.controls import InputLog, InputRecorder, KeyboardInput, ReplayInput, ScriptedInput
+from modules.events import LogSink
+from modules.gameloop import FixedTimestepLoop, SIM_DT
+from modules.lighting import LightingLayer
+from modules.map_format import content_hash
+from modules.profiler import PROFILER, draw_overlay
+from modules.render import EntityLayer, TileMapRenderer
+from modules.simulation import build_demo_world, run_headless
+from modules.snapshot import AUTOSAVE_SECONDS, Autosaver, load_world, read_snapshot, save_world, write_snapshot
+from modules.startup import STARTUP_MANIFEST, StartupTimer, init_pygame, run_loading_screen
+
 # -------------------------------
 # 기본 설정
 # -------------------------------
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-FPS = 60
+FPS = 60                      # 렌더 프레임 상한 (시뮬레이션은 SIM_DT 고정 틱)
 GAME_TITLE = "Hollow Escape"
+MONSTER_LAYER = 0             # 엔티티 그리기 순서 (높을수록 위)
+PLAYER_LAYER = 1
+
+# 헤드리스(창 없는) 시뮬레이션 기본값
+HEADLESS_DT = 1 / 60          # 고정 틱 간격 (초)
+HEADLESS_TICKS = 3600         # 기본 틱 수 (60초 분량)
+HEADLESS_SCRIPT = "RIGHT:40,DOWN:50,RIGHT+LSHIFT:30,UP:40,NONE:30,LEFT:60,DOWN:40"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=GAME_TITLE)
+    parser.add_argument("--headless", action="store_true", help="창 없이 렌더링을 건너뛰고 최대 속도로 시뮬레이션")
+    parser.add_argument("--ticks", type=int, default=HEADLESS_TICKS, help="헤드리스 모드에서 진행할 틱 수")
+    parser.add_argument("--dt", type=float, default=HEADLESS_DT, help="헤드리스 모드 고정 틱 간격 (초)")
+    parser.add_argument("--script", default=HEADLESS_SCRIPT, help="플레이어 입력 스크립트 (예: RIGHT:60,DOWN+LSHIFT:30)")
+    parser.add_argument("--monsters", type=int, default=2, help="몬스터 수")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+    parser.add_argument("--fps", type=int, default=FPS, help="창 모드 렌더 프레임 상한 (0 이면 제한 없음)")
+    parser.add_argument("--no-lighting", action="store_true", help="창 모드에서 어둠/조명 끄기")
+    parser.add_argument("--profile", metavar="PATH", default=None,
+                        help="헤드리스 모드에서 구간별 시간을 재서 PATH 로 저장 (.csv 또는 .json)")
+    parser.add_argument("--swarm", action="store_true", help="헤드리스 모드에서 몬스터를 MonsterSwarm 배열로 일괄 갱신")
+    parser.add_argument("--lod", action="store_true", help="플레이어 방 밖의 몬스터는 방 그래프만 따라가는 거친 모델로 갱신")
+    parser.add_argument("--record", metavar="PATH", default=None, help="틱마다 입력을 기록해서 PATH 로 저장")
+    parser.add_argument("--replay", metavar="PATH", default=None,
+                        help="기록한 입력을 헤드리스로 최대 속도 재생 (시드/dt/몬스터 수/미로/레벨은 기록에서)")
+    parser.add_argument("--startup-report", action="store_true", help="창 모드 시작 단계별 시간 (첫 프레임까지) 출력")
+    parser.add_argument("--level", metavar="PATH", default=None,
+                        help="데모 맵 대신 텍스트(.txt)/CSV(.csv) 레이아웃 로드 (재생은 기록된 레벨을 쓴다)")
+    parser.add_argument("--event-log", metavar="PATH", default=None,
+                        help="게임 이벤트 (상태 전이 / 방 이동 / 숨기 / 탈진) 로그를 PATH 로 ('-' = 콘솔, 창 모드 기본값)")
+    parser.add_argument("--maze", metavar="WxH", type=maze_size, default=None,
+                        help="데모 맵 대신 시드로 만든 WxH 미로 (예: 201x201, 재생은 기록된 크기를 쓴다)")
+    parser.add_argument("--load-snapshot", metavar="PATH", default=None,
+                        help="스냅샷 상태에서 시작 (시드 / 몬스터 수 / 레벨은 저장할 때와 같게 줄 것)")
+    parser.add_argument("--save-snapshot", metavar="PATH", default=None, help="끝날 때 스냅샷을 PATH 로 저장")
+    parser.add_argument("--autosave", metavar="PATH", default=None, help="주기적으로 스냅샷을 PATH 로 저장 (백그라운드 쓰기)")
+    parser.add_argument("--autosave-every", metavar="SECONDS", type=float, default=AUTOSAVE_SECONDS,
+                        help="자동 저장 간격 (시뮬레이션 초)")
+    args = parser.parse_args(argv)
+    # 입력 기록 헤더에 부호 없는 64비트로 들어간다 - 세션이 다 끝나고 저장할 때 터지지 않게 미리 막는다
+    if args.seed is not None and not 0 <= args.seed < 1 << 64:
+        parser.error(f"--seed 는 0 .. 2**64-1 만 가능: {args.seed}")
+    return args
+
+
+def maze_size(text):
+    """'201x151' -> (201, 151)"""
+    try:
+        width, height = (int(v) for v in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"WxH 형식이어야 함: {text}")
+    return width, height
+
+
+def open_event_log(path, events):
+    """이벤트 로그 싱크 (백그라운드 스레드에서 씀) - path 가 None 이면 None"""
+    if path is None:
+        return None
+    sink = LogSink() if path == "-" else LogSink(path=path)
+    return sink.attach(events)
+
+
+def open_snapshots(args, world, dt):
+    """--load-snapshot 을 world 에 덮어쓰고 --autosave 가 있으면 Autosaver 를 돌려준다
+
+    --autosave-every 는 시뮬레이션 초 - 틱 간격 dt 로 틱 수로 바꿔서 센다
+    """
+    if args.load_snapshot:
+        load_world(world, read_snapshot(args.load_snapshot))
+        print(f"snapshot: {args.load_snapshot} (tick {world.tick})")
+    if not args.autosave:
+        return None
+    return Autosaver(args.autosave, round(args.autosave_every / dt), start=world.tick)
+
+
+def close_snapshots(args, world, autosave):
+    if autosave is not None:
+        autosave.close()
+    if args.save_snapshot:
+        write_snapshot(args.save_snapshot, save_world(world))
+        print(f"snapshot: {args.save_snapshot} (tick {world.tick})")
+
+
+def replay_layout(args, replay):
+    """기록에 저장된 (레벨 경로, 미로 크기) - 명령줄의 --level / --maze 가 기록과 다르면 종료
+
+    레벨은 경로가 아니라 내용 해시로 비교한다 (--level 을 주면 그 파일, 안 주면 기록된 경로)
+    """
+    if args.maze is not None and args.maze != replay.maze:
+        recorded = "미로 없음" if replay.maze is None else "%dx%d" % replay.maze
+        sys.exit(f"--maze {args.maze[0]}x{args.maze[1]} 가 기록 ({recorded}) 과 다름: {args.replay}")
+
+    level = args.level if args.level is not None else replay.level
+    if level is None:
+        return None, replay.maze
+    if replay.level is None:
+        sys.exit(f"기록은 데모 맵 / 미로인데 --level {level} 을 줌: {args.replay}")
+    try:
+        same = content_hash(level).encode() == replay.level_hash
+    except OSError as e:
+        sys.exit(f"기록한 레벨을 읽을 수 없음 ({e}): {args.replay}")
+    if not same:
+        sys.exit(f"레벨 {level} 이 기록 때 ({replay.level}) 와 내용이 다름: {args.replay}")
+    return level, replay.maze
+
+
+def resolve_seed(seed):
+    """시드를 안 주면 하나 골라서 (기록/재현할 수 있게) 돌려준다"""
+    return seed if seed is not None else random.randrange(1 << 63)
+
 
 # -------------------------------
-# 초기화
+# 헤드리스 모드 (CI / 부하 테스트용)
 # -------------------------------
-pygame.init()
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption(GAME_TITLE)
-clock = pygame.time.Clock()
+def run_headless_mode(args):
+    # 화면 없는 SDL 드라이버 (convert_alpha 때문에 1x1 디스플레이는 만들어 둔다)
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    init_pygame(headless=True)
+    pygame.display.set_mode((1, 1))
+
+    log = None
+    if args.replay:
+        # 기록 재생 - 월드 설정도 기록에서 가져온다
+        replay = InputLog.load(args.replay)
+        controls = ReplayInput(replay)
+        seed, dt, ticks, monsters, swarm = replay.seed, replay.dt, len(replay), replay.monster_count, replay.swarm
+        lod = replay.lod
+        level, maze = replay_layout(args, replay)
+    else:
+        controls = ScriptedInput.parse(args.script)
+        seed, dt, ticks, monsters, swarm = resolve_seed(args.seed), args.dt, args.ticks, args.monsters, args.swarm
+        lod, level, maze = args.lod, args.level, args.maze
+        if args.record:
+            log = InputLog(seed, dt, monsters, swarm, lod=lod, maze=maze, level=level)
+            controls = InputRecorder(controls, log)
+
+    world = build_demo_world(controls=controls, monster_count=monsters, seed=seed, swarm=swarm, level=level,
+                             lod=lod, maze=maze)
+    autosave = open_snapshots(args, world, dt)
+    if args.replay:
+        ticks -= world.tick       # 스냅샷부터 기록 끝까지
+    event_log = open_event_log(args.event_log, world.events)
+    if args.profile:
+        world.profile(PROFILER)
+        PROFILER.enable()
+    result = run_headless(world, ticks, dt, PROFILER if args.profile else None, autosave)
+    if event_log is not None:
+        event_log.close()
+    close_snapshots(args, world, autosave)
+
+    print(f"ticks: {result['ticks']}  elapsed: {result['elapsed']:.3f}s  "
+          f"ticks/sec: {result['ticks_per_sec']:.0f}")
+    print(f"seed: {seed}  caught at tick: {result['caught_tick']}  monsters: {result['monster_states']}  "
+          f"player tile: {result['player_tile']}")
+    if log is not None:
+        log.save(args.record)
+        print(f"input log: {args.record} ({len(log)} ticks)")
+    if args.profile:
+        PROFILER.export(args.profile)
+        print(f"profile: {args.profile}")
+
+    pygame.quit()
+
 
 # -------------------------------
-# 게임 루프
+# 일반 모드 (창 + 렌더링)
 # -------------------------------
-running = True
-while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
+def run_windowed(args):
+    startup = StartupTimer(STARTUP_T0)
+    startup.mark("import")
+
+    # 쓰는 서브시스템(디스플레이 / 폰트)만 켠다
+    init_pygame()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption(GAME_TITLE)
+    clock = pygame.time.Clock()
+    startup.mark("display")
+
+    # 입력 기록 (--record) - 나중에 --replay 로 헤드리스 재현
+    seed = resolve_seed(args.seed)
+    controls = KeyboardInput()
+    log = None
+    if args.record:
+        log = InputLog(seed, SIM_DT, args.monsters, lod=args.lod, maze=args.maze, level=args.level)
+        controls = InputRecorder(controls, log)
+
+    # 로딩 화면을 그리는 동안 이미지는 백그라운드 스레드에서 디코딩,
+    # 끝나면 월드를 만들고 시작 방 청크를 미리 그린다
+    loaded = {}
+
+    def loading_steps():
+        preloader = AssetPreloader(STARTUP_MANIFEST).start()
+        while not preloader.done:
+            yield preloader.progress * 0.5
+        preloader.finish()
+        startup.mark("assets")
+
+        world = loaded["world"] = build_demo_world(controls=controls, monster_count=args.monsters,
+                                                   seed=seed, level=args.level, lod=args.lod,
+                                                   maze=args.maze)
+        renderer = loaded["renderer"] = TileMapRenderer(world.map_manager)
+        startup.mark("world")
+        for progress in renderer.warm(world.player_map):
+            yield 0.5 + progress * 0.5
+        startup.mark("map chunks")
+
+    if not run_loading_screen(screen, clock, loading_steps()):
+        pygame.quit()
+        return
+
+    world = loaded["world"]
+    renderer = loaded["renderer"]
+    player = world.player
+    autosave = open_snapshots(args, world, SIM_DT)
+    lighting = None if args.no_lighting else LightingLayer(world.map_manager, world.player_map)
+    scene = None if lighting is None else pygame.Surface(screen.get_size()).convert()   # 조명 전 화면
+    loop = FixedTimestepLoop(world.step, SIM_DT)   # 시뮬레이션은 프레임 속도와 상관없이 고정 틱
+    event_log = open_event_log(args.event_log if args.event_log is not None else "-", world.events)
+
+    # 엔티티는 카메라 안에 있는 것만 (몬스터는 위치 색인으로 후보를 고른다) blits 한 번
+    entities = EntityLayer(world.monster_index)
+    for monster in world.monsters:
+        entities.add(monster, MONSTER_LAYER, indexed=True)
+    entities.add(player, PLAYER_LAYER)
+
+    # 프로파일러 (F3 로 켜고 끄기 - 꺼져 있을 때는 계측 비용 없음)
+    world.profile(PROFILER)
+    PROFILER.watch(renderer, {"begin": "render.map", "present": "render.present"})
+    overlay_font = None       # 시스템 폰트 검색이 느려서 오버레이를 처음 켤 때 만든다
+
+    running = True
+    first_frame = True
+    while running:
+        frame_time = clock.tick(args.fps) / 1000   # 초 단위
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                PROFILER.toggle()
+
+        with PROFILER.section("sim"):
+            alpha = loop.advance(frame_time)
+        world.events.dispatch()   # 이번 프레임 틱들에서 쌓인 이벤트 (로그는 스레드가 쓴다)
+        if autosave is not None:
+            autosave.update(world)
+
+        # 카메라 (보간된 플레이어 위치 중심)
+        player_rect = world.render_rect(player, world.player_map, alpha)
+        camera_offset = (player_rect.centerx - SCREEN_WIDTH // 2,
+                         player_rect.centery - SCREEN_HEIGHT // 2)
+
+        # 맵은 미리 그려 둔 청크 중 보이는 것만, 카메라가 멈춰 있으면 바뀐 곳만 갱신
+        # (조명을 켜면 조명 전 화면 scene 에 그리고, 바뀐 곳만 마스크를 곱해 화면으로 - 마스크가 바뀌면 전체)
+        relight = False
+        if lighting is not None:
+            lighting.map_name = world.player_map
+            with PROFILER.section("render.lighting"):
+                relight = lighting.prepare(screen.get_size(), player, camera_offset, player_rect)
+        renderer.begin(screen if scene is None else scene, world.player_map, camera_offset, full=relight)
+        with PROFILER.section("render.sprite"):
+            entities.draw(renderer, world.player_map, pygame.time.get_ticks() / 1000,
+                          lambda sprite: world.render_rect(sprite, world.player_map, alpha))
+        if lighting is not None:
+            with PROFILER.section("render.lighting"):
+                lighting.compose(screen, scene, None if renderer.full_redraw else renderer.dirty)
+        if PROFILER.enabled:
+            if overlay_font is None:
+                overlay_font = pygame.font.SysFont("monospace", 14)
+            renderer.mark(draw_overlay(screen, PROFILER, overlay_font))
+        renderer.present()
+        PROFILER.end_frame()
 
-    # 화면 색상 채우기 (검은색)
-    screen.fill((0, 0, 0))
+        if first_frame:
+            first_frame = False
+            startup.mark("first frame")
+            if args.startup_report:
+                print(startup.report())
 
-    # TODO: 여기서 플레이어, 괴물, 맵, UI 등을 그릴 예정
+    if log is not None:
+        log.save(args.record)
+        print(f"input log: {args.record} ({len(log)} ticks, seed {seed})")
+    event_log.close()
+    close_snapshots(args, world, autosave)
+    pygame.quit()
 
-    pygame.display.flip()
-    clock.tick(FPS)
 
-pygame.quit()
-sys.exit()
\ No newline at end of file
+if __name__ == "__main__":
+    args = parse_args()
+    if args.headless or args.replay:
+        run_headless_mode(args)
+    else:
+        run_windowed(args)
+    sys.exit()
@@ -0,0 +1,197 @@
+# modules/assets.py
+
+import threading
+from collections import OrderedDict
+
+import pygame
+
+MAX_CACHE_BYTES = 64 * 1024 * 1024    # 캐시에 들고 있을 Surface 픽셀 메모리 상한 (바이트)
+ANIMATION_FPS = 6                     # 걷기 애니메이션 초당 프레임 수
+
+
+class AssetCache:
+    """이미지 Surface 공유 캐시 - (경로, 크기, 좌우반전, 알파) 하나당 Surface 하나
+
+    같은 PNG 는 디스크에서 한 번만 읽고, 크기 조정/반전 결과도 한 번만 만든다.
+    메모리 상한을 넘으면 가장 오래 안 쓴 항목부터 버린다 (LRU).
+    돌려준 Surface 는 여러 객체가 같이 쓰므로 직접 그리거나 fill 하면 안 된다.
+    """
+
+    def __init__(self, max_bytes=MAX_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()   # 키 -> Surface (오래 안 쓴 것이 앞)
+        self.bytes = 0
+        self.missing = set()           # 없는 파일 경로 (매번 디스크를 다시 뒤지지 않도록)
+        self.decoded = {}              # 경로 -> 미리 디코딩만 해 둔 Surface (AssetPreloader 가 채움, 아직 convert 전)
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    # -------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------
+    def image(self, path, size=None, flip=False, alpha=True):
+        """path 이미지를 size 로 맞추고 flip 이면 좌우반전한 Surface
+
+        파일이 없으면 FileNotFoundError (pygame.image.load 와 같음)
+        """
+        key = ("image", path, tuple(size) if size is not None else None, flip, alpha)
+        surface = self._get(key)
+        if surface is not None:
+            return surface
+
+        if flip:
+            surface = pygame.transform.flip(self.image(path, size, False, alpha), True, False)
+        elif size is not None:
+            surface = pygame.transform.scale(self.image(path, None, False, alpha), size)
+        else:
+            surface = self._load(path, alpha)
+        return self._put(key, surface)
+
+    def solid(self, size, color):
+        """이미지가 없을 때 쓰는 단색 Surface"""
+        key = ("solid", tuple(size), tuple(color))
+        surface = self._get(key)
+        if surface is not None:
+            return surface
+
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        return self._put(key, surface)
+
+    def clear(self):
+        self.entries.clear()
+        self.missing.clear()
+        self.decoded.clear()
+        self.bytes = 0
+
+    # -------------------------------------------------------
+    # 내부
+    # -------------------------------------------------------
+    def _load(self, path, alpha):
+        if path in self.missing:
+            raise FileNotFoundError(path)
+        surface = self.decoded.pop(path, None)
+        if surface is None:
+            try:
+                surface = pygame.image.load(path)
+            except FileNotFoundError:
+                self.missing.add(path)
+                raise
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def _get(self, key):
+        surface = self.entries.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return surface
+
+    def _put(self, key, surface):
+        self.entries[key] = surface
+        self.bytes += surface_bytes(surface)
+
+        # 상한을 넘으면 오래 안 쓴 것부터 버린다 (방금 넣은 것은 남긴다)
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            _, old = self.entries.popitem(last=False)
+            self.bytes -= surface_bytes(old)
+        return surface
+
+
+class AssetPreloader:
+    """매니페스트 [(경로, 크기, 좌우반전), ...] 의 이미지를 백그라운드 스레드에서 미리 디코딩
+
+    스레드는 파일 읽기 + 디코딩 (pygame.image.load) 만 한다.
+    convert / 크기 조정 / 반전은 디스플레이를 쓰므로 메인 스레드의 finish() 에서 캐시에 넣는다.
+    로딩 화면은 done 이 될 때까지 progress 를 그리면 된다.
+    """
+
+    def __init__(self, manifest, cache=None):
+        self.manifest = list(manifest)
+        self.cache = cache if cache is not None else ASSET_CACHE
+        self.paths = list(dict.fromkeys(entry[0] for entry in self.manifest))
+        self.loaded = 0
+        self.results = {}         # 경로 -> Surface 또는 None (파일 없음)
+        self.thread = threading.Thread(target=self._run, name="asset-preload", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    @property
+    def done(self):
+        return not self.thread.is_alive()
+
+    @property
+    def progress(self):
+        """0.0 ~ 1.0"""
+        return self.loaded / len(self.paths) if self.paths else 1.0
+
+    def _run(self):
+        for path in self.paths:
+            try:
+                self.results[path] = pygame.image.load(path)
+            except (FileNotFoundError, pygame.error):
+                self.results[path] = None
+            self.loaded += 1
+
+    def finish(self):
+        """스레드를 기다린 뒤 매니페스트의 모든 변형을 캐시에 만들어 둔다 (메인 스레드에서 호출)"""
+        self.thread.join()
+        for path, surface in self.results.items():
+            if surface is None:
+                self.cache.missing.add(path)
+            else:
+                self.cache.decoded[path] = surface
+        for path, size, flip in self.manifest:
+            try:
+                self.cache.image(path, size, flip)
+            except FileNotFoundError:
+                pass    # 엔티티가 단색 Surface 로 대신한다
+
+
+def surface_bytes(surface):
+    return surface.get_pitch() * surface.get_height()
+
+
+# 게임 전체가 같이 쓰는 기본 캐시
+ASSET_CACHE = AssetCache()
+
+
+def load_image(path, size=None, flip=False, alpha=True):
+    return ASSET_CACHE.image(path, size, flip, alpha)
+
+
+def solid_surface(size, color):
+    return ASSET_CACHE.solid(size, color)
+
+
+class SpriteFrames:
+    """애니메이션 프레임 - 왼쪽 / 오른쪽을 보는 프레임 리스트를 미리 만들어 두고 시간으로 고른다 (그릴 때 뒤집기 없음)"""
+
+    def __init__(self, left, right, fps=ANIMATION_FPS):
+        self.left = list(left)
+        self.right = list(right)
+        self.fps = fps
+
+    def frame(self, t, right=False, moving=True):
+        """t 초 시점 프레임 (멈춰 있으면 첫 프레임)"""
+        frames = self.right if right else self.left
+        if not moving:
+            return frames[0]
+        return frames[int(t * self.fps) % len(frames)]
+
+
+def load_frames(paths, size, fallback_color, fps=ANIMATION_FPS):
+    """왼쪽을 보는 이미지들 -> SpriteFrames (오른쪽은 캐시가 한 번 뒤집어 둔 것). 파일이 없으면 단색 한 장"""
+    try:
+        left = [load_image(path, size) for path in paths]
+        right = [load_image(path, size, flip=True) for path in paths]
+    except FileNotFoundError:
+        left = right = [solid_surface(size, fallback_color)]
+    return SpriteFrames(left, right, fps)
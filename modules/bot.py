@@ -0,0 +1,116 @@
+# modules/bot.py
+
+import random
+
+import pygame
+
+from modules.controls import KeyState
+from modules.map_manager import TILE_SIZE
+from modules.pathfinding import FlowField
+
+FLEE_TILES = 5            # 이 안에 몬스터가 있으면 도망친다 (타일)
+RUN_STAMINA = 30.0        # 스테미너가 이보다 많을 때만 달린다
+RUN_STEP_PX = 8           # 달리기 한 틱 이동량 (이보다 가까우면 걸어서 정확히 맞춘다)
+
+
+class BotInput:
+    """헤드리스 플레이어 봇 (입력 장치) - 쫓아오는 몬스터가 가까우면 도망치고, 아니면 무작위 목적지로 걷는다
+
+    ScriptedInput 처럼 get_pressed() / advance() 만 있으면 되므로 Player 에 그대로 꽂는다.
+    월드를 만든 뒤 attach(world) 해야 움직인다. 같은 seed 면 같은 결정을 한다.
+    """
+
+    def __init__(self, seed=None, flee_tiles=FLEE_TILES):
+        self.rng = random.Random(seed)
+        self.flee_tiles = flee_tiles
+        self.world = None
+        self.goal = None
+        self.field = None         # 목적지까지 흐름장
+        self.flee_to = None       # 도망칠 이웃 타일 (도착할 때까지 바꾸지 않는다 - 두 칸 사이 왕복 방지)
+        self.keys = None          # 이번 틱 입력 (get_pressed 가 틱당 여러 번 불려서 한 번만 계산)
+
+    def attach(self, world):
+        self.world = world
+
+    def get_pressed(self):
+        if self.keys is None:
+            self.keys = self._decide()
+        return self.keys
+
+    def advance(self):
+        self.keys = None
+
+    # -------------------------------------------------------
+    # 결정
+    # -------------------------------------------------------
+    def _decide(self):
+        world = self.world
+        if world is None:
+            return KeyState()
+        player = world.player
+        tile = (player.tile_x, player.tile_y)
+
+        # 쫓아오는 몬스터만 피한다 (순찰 중인 몬스터 옆에서 얼어붙지 않게), 막다른 곳이면 그냥 이동
+        near = [m for m in world.monsters_near(self.flee_tiles) if m.state == "CHASE"]
+        if self.flee_to == tile or not near:
+            self.flee_to = None
+        if near and self.flee_to is None:
+            self.flee_to = self._flee_step(tile, near)
+        step = self.flee_to
+        run = step is not None and player.current_stamina > RUN_STAMINA
+        if step is None:
+            step = self._wander_step(tile)
+        if step is None:
+            return KeyState()
+
+        keys, fine = self._keys_towards(player.rect.center, step)
+        if run and keys and not fine:
+            keys.append(pygame.K_LSHIFT)
+        return KeyState(keys)
+
+    def _flee_step(self, tile, monsters):
+        """몬스터들과의 최소 맨해튼 거리가 가장 커지는 이웃 (더 멀어질 곳이 없으면 None)"""
+        mm = self.world.map_manager
+        name = self.world.player_map
+        x, y = tile
+
+        def score(t):
+            return min(abs(m.tile_x - t[0]) + abs(m.tile_y - t[1]) for m in monsters)
+
+        best, best_score = tile, score(tile)
+        for t in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if mm.is_walkable(t[0], t[1], name) and not mm.is_entrance(t[0], t[1], name):
+                s = score(t)
+                if s > best_score:
+                    best, best_score = t, s
+        return None if best == tile else best
+
+    def _wander_step(self, tile):
+        mm = self.world.map_manager
+        name = self.world.player_map
+        if self.goal is None or self.goal == tile or self.field is None or self.field.distance(*tile) < 0:
+            self.goal = mm.random_walkable_tile(name, self.rng)
+            if self.goal is None:
+                return None
+            self.field = FlowField(mm.rooms[name], self.goal)
+        return self.field.next_step(tile[0], tile[1]) or self.goal
+
+    @staticmethod
+    def _keys_towards(center, step):
+        """타일 step 중앙으로 가는 방향키, 달리면 지나치는지 여부
+
+        플레이어 rect 가 타일 한 칸 크기라 조금만 어긋나도 통로 벽에 걸리므로 두 축을 정확히 맞춘다
+        """
+        dx = step[0] * TILE_SIZE + TILE_SIZE // 2 - center[0]
+        dy = step[1] * TILE_SIZE + TILE_SIZE // 2 - center[1]
+        keys = []
+        if dx > 0:
+            keys.append(pygame.K_RIGHT)
+        elif dx < 0:
+            keys.append(pygame.K_LEFT)
+        if dy > 0:
+            keys.append(pygame.K_DOWN)
+        elif dy < 0:
+            keys.append(pygame.K_UP)
+        fine = 0 < abs(dx) < RUN_STEP_PX or 0 < abs(dy) < RUN_STEP_PX
+        return keys, fine
@@ -0,0 +1,194 @@
+# modules/collision.py
+
+import pygame
+
+CELL_SIZE = 64    # 공간 격자 한 칸 크기 (픽셀)
+
+
+class WallIndex:
+    """고정된 벽 Rect 들을 균일 격자에 나눠 담은 충돌 후보 색인
+
+    벽은 원래 리스트 순서(인덱스)를 그대로 기억해서,
+    후보만 돌아도 리스트 전체를 도는 것과 같은 순서로 충돌 처리가 된다
+    """
+
+    def __init__(self, walls, cell_size=CELL_SIZE):
+        self.walls = [pygame.Rect(wall) for wall in walls]
+        self.cell_size = cell_size
+        self.cells = {}           # (cx, cy) -> 벽 인덱스 리스트 (오름차순)
+
+        for i, wall in enumerate(self.walls):
+            for key in self._cells_for(wall):
+                self.cells.setdefault(key, []).append(i)
+
+    def __len__(self):
+        return len(self.walls)
+
+    def __iter__(self):
+        return iter(self.walls)
+
+    def _cells_for(self, rect):
+        size = self.cell_size
+        x0 = rect.left // size
+        y0 = rect.top // size
+        # right/bottom 은 rect 밖이므로 -1 (크기 0 인 rect 도 자기 칸 하나는 차지)
+        x1 = max(rect.left, rect.right - 1) // size
+        y1 = max(rect.top, rect.bottom - 1) // size
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                yield cx, cy
+
+    def query(self, rect):
+        """rect 가 걸친 칸에 들어있는 벽 인덱스 (원래 순서대로)"""
+        cells = self.cells
+        found = set()
+        for key in self._cells_for(rect):
+            bucket = cells.get(key)
+            if bucket:
+                found.update(bucket)
+        return sorted(found)
+
+    def colliding(self, rect):
+        """rect 와 겹치는 벽을 원래 리스트 순서대로 하나씩 돌려준다
+
+        호출하는 쪽이 충돌 처리로 rect 를 옮겨도 된다.
+        옮겨진 rect 가 처음 조회한 영역을 벗어나면 그 벽 이후 인덱스만 다시 조회하므로
+        'for wall in walls: if rect.colliderect(wall)' 와 결과가 완전히 같다
+        """
+        walls = self.walls
+        area = rect.copy()
+        candidates = self.query(area)
+        pos = 0
+
+        while pos < len(candidates):
+            i = candidates[pos]
+            pos += 1
+            wall = walls[i]
+            if not rect.colliderect(wall):
+                continue
+
+            yield wall
+
+            if not area.contains(rect):
+                area.union_ip(rect)
+                candidates = [j for j in self.query(area) if j > i]
+                pos = 0
+
+
+class EntityIndex:
+    """움직이는 엔티티(몬스터, 플레이어 등) 를 방별 타일 버킷에 나눠 담은 색인
+
+    엔티티는 tile_x / tile_y / rect 를 가진 객체. update() 는 매 틱 불러도 되고,
+    타일이 그대로면 비교 한 번으로 끝난다 (버킷을 옮기는 건 타일이 바뀔 때만).
+    거리는 타일 단위 체비셰프 거리 (Monster.in_chase_range 와 같은 정사각형 범위).
+    """
+
+    def __init__(self, bucket_tiles=4):
+        self.bucket_tiles = bucket_tiles
+        self.buckets = {}         # (방 이름, bx, by) -> 엔티티 set
+        self.where = {}           # 엔티티 -> (방 이름, tile_x, tile_y, 버킷 키)
+
+    def __len__(self):
+        return len(self.where)
+
+    def __contains__(self, entity):
+        return entity in self.where
+
+    # -------------------------------------------------------
+    # 갱신
+    # -------------------------------------------------------
+    def update(self, entity, map_name):
+        tx, ty = entity.tile_x, entity.tile_y
+        old = self.where.get(entity)
+        if old is not None and old[0] == map_name and old[1] == tx and old[2] == ty:
+            return
+
+        size = self.bucket_tiles
+        key = (map_name, tx // size, ty // size)
+        if old is None or old[3] != key:
+            if old is not None:
+                self._discard(old[3], entity)
+            self.buckets.setdefault(key, set()).add(entity)
+        self.where[entity] = (map_name, tx, ty, key)
+
+    def remove(self, entity):
+        old = self.where.pop(entity, None)
+        if old is not None:
+            self._discard(old[3], entity)
+
+    def _discard(self, key, entity):
+        bucket = self.buckets[key]
+        bucket.discard(entity)
+        if not bucket:
+            del self.buckets[key]
+
+    # -------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------
+    def _candidates(self, map_name, x0, y0, x1, y1):
+        """타일 사각형 (x0, y0) ~ (x1, y1) (포함) 에 걸친 버킷의 엔티티"""
+        size = self.bucket_tiles
+        buckets = self.buckets
+        for by in range(y0 // size, y1 // size + 1):
+            for bx in range(x0 // size, x1 // size + 1):
+                bucket = buckets.get((map_name, bx, by))
+                if bucket:
+                    yield from bucket
+
+    def in_area(self, map_name, x0, y0, x1, y1):
+        """타일 사각형 (x0, y0) ~ (x1, y1) (포함) 안에 있는 엔티티 리스트 (화면 컬링 등)"""
+        where = self.where
+        return [e for e in self._candidates(map_name, x0, y0, x1, y1)
+                if x0 <= where[e][1] <= x1 and y0 <= where[e][2] <= y1]
+
+    def within(self, map_name, tile, tiles):
+        """tile 에서 가로 / 세로 모두 tiles 칸 안에 있는 엔티티 리스트"""
+        x, y = tile
+        where = self.where
+        return [e for e in self._candidates(map_name, x - tiles, y - tiles, x + tiles, y + tiles)
+                if abs(where[e][1] - x) <= tiles and abs(where[e][2] - y) <= tiles]
+
+    def nearest(self, map_name, tile, k=1, max_tiles=None):
+        """tile 에서 가까운 순서로 최대 k 개 (체비셰프 거리, 같으면 맨해튼 거리 순)
+
+        버킷 고리를 하나씩 넓혀 가다가 k 개가 모이고 더 먼 고리에 더 가까운 게 있을 수 없으면 멈춘다
+        """
+        x, y = tile
+        size = self.bucket_tiles
+        where = self.where
+        if max_tiles is None:
+            max_tiles = max((max(abs(w[1] - x), abs(w[2] - y)) for w in where.values() if w[0] == map_name),
+                            default=-1)
+        if max_tiles < 0:
+            return []
+
+        def distance(e):
+            dx, dy = abs(where[e][1] - x), abs(where[e][2] - y)
+            return max(dx, dy), dx + dy
+
+        found = []
+        bx, by = x // size, y // size
+        max_ring = max_tiles // size + 1
+        for ring in range(max_ring + 1):
+            for cy in range(by - ring, by + ring + 1):
+                for cx in range(bx - ring, bx + ring + 1):
+                    if max(abs(cx - bx), abs(cy - by)) != ring:
+                        continue
+                    bucket = self.buckets.get((map_name, cx, cy))
+                    if bucket:
+                        found.extend(e for e in bucket if distance(e)[0] <= max_tiles)
+            # 다음 고리의 엔티티는 적어도 ring * size 칸 떨어져 있다
+            if len(found) >= k:
+                found.sort(key=distance)
+                if distance(found[k - 1])[0] < ring * size + 1:
+                    break
+        found.sort(key=distance)
+        return found[:k]
+
+    def overlapping(self, map_name, rect, tile_size):
+        """rect (픽셀) 와 겹치는 엔티티 리스트 - 엔티티 rect 는 자기 타일에서 한 칸까지 삐져나올 수 있다고 본다"""
+        x0 = rect.left // tile_size - 1
+        y0 = rect.top // tile_size - 1
+        x1 = (rect.right - 1) // tile_size + 1
+        y1 = (rect.bottom - 1) // tile_size + 1
+        return [e for e in self._candidates(map_name, x0, y0, x1, y1) if rect.colliderect(e.rect)]
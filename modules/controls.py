@@ -0,0 +1,200 @@
+# modules/controls.py
+
+import struct
+from array import array
+
+import pygame
+
+from modules.map_format import content_hash
+
+# 기록/재생하는 키 (튜플 순서 = 비트 순서)
+TRACKED_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN, pygame.K_LSHIFT)
+
+
+class KeyState(frozenset):
+    """눌린 키 집합 - pygame.key.get_pressed() 처럼 keys[pygame.K_LEFT] 로 조회"""
+
+    def __getitem__(self, key):
+        return key in self
+
+
+def key_mask(keys):
+    """눌린 키 (get_pressed 결과) -> TRACKED_KEYS 비트마스크"""
+    mask = 0
+    for bit, key in enumerate(TRACKED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def mask_keys(mask):
+    """비트마스크 -> KeyState"""
+    return KeyState(key for bit, key in enumerate(TRACKED_KEYS) if mask & (1 << bit))
+
+
+class KeyboardInput:
+    """실제 키보드 입력 (기본값)"""
+
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+    def advance(self):
+        pass
+
+
+class ScriptedInput:
+    """미리 정한 입력을 틱마다 순서대로 돌려주는 입력 (헤드리스 시뮬레이션용)
+
+    steps = [(키 튜플, 유지할 틱 수), ...] - 끝나면 처음부터 반복
+    """
+
+    def __init__(self, steps, loop=True):
+        self.steps = [(KeyState(keys), ticks) for keys, ticks in steps if ticks > 0]
+        self.loop = loop
+        self.index = 0
+        self.remaining = self.steps[0][1] if self.steps else 0
+
+    def get_pressed(self):
+        if self.index >= len(self.steps):
+            return KeyState()
+        return self.steps[self.index][0]
+
+    def advance(self):
+        """한 틱 진행"""
+        if self.index >= len(self.steps):
+            return
+
+        self.remaining -= 1
+        while self.remaining <= 0 and self.index < len(self.steps):
+            self.index += 1
+            if self.index >= len(self.steps) and self.loop:
+                self.index = 0
+            if self.index < len(self.steps):
+                self.remaining = self.steps[self.index][1]
+
+    def seek(self, tick):
+        """처음부터 tick 틱 진행한 위치로 (스냅샷을 불러온 뒤 입력을 맞출 때)"""
+        self.index = 0
+        self.remaining = self.steps[0][1] if self.steps else 0
+        for _ in range(tick):
+            self.advance()
+
+    @classmethod
+    def parse(cls, text, loop=True):
+        """'RIGHT:60,DOWN+LSHIFT:30,NONE:20' 형식 문자열로 생성"""
+        steps = []
+        for token in text.split(","):
+            token = token.strip()
+            if not token:
+                continue
+            names, ticks = token.rsplit(":", 1)
+            keys = tuple(getattr(pygame, "K_" + name.strip()) for name in names.split("+") if name.strip() not in ("", "NONE"))
+            steps.append((keys, int(ticks)))
+        return cls(steps, loop)
+
+
+class InputLog:
+    """틱마다 눌린 키 비트마스크 1바이트씩 + 같은 월드를 다시 만들 설정 (시드, dt, 몬스터 수, 미로 / 레벨)
+
+    파일 = 작은 헤더 + 레벨 경로 (utf-8, 없으면 빈 문자열) + 마스크 바이트 그대로
+    maze = (width, height) 또는 None, level = 레벨 파일 경로 또는 None (map_format.content_hash 도 같이 저장)
+    """
+
+    MAGIC = b"HEIN"
+    VERSION = 2
+    # magic, version, seed, dt, monster_count, 월드 플래그, 미로 width, height (0 = 미로 아님), 레벨 내용 해시, 레벨 경로 길이
+    HEADER = struct.Struct("<4sHQdIBII16sH")
+    FLAG_SWARM = 0x01
+    FLAG_LOD = 0x02
+    NO_LEVEL = bytes(16)
+
+    def __init__(self, seed=0, dt=1 / 60, monster_count=2, swarm=False, masks=None, lod=False, maze=None,
+                 level=None, level_hash=None):
+        self.seed = seed
+        self.dt = dt
+        self.monster_count = monster_count
+        self.swarm = swarm
+        self.lod = lod
+        self.maze = tuple(maze) if maze is not None else None
+        self.level = level
+        if level_hash is None:
+            level_hash = content_hash(level).encode() if level is not None else self.NO_LEVEL
+        self.level_hash = level_hash
+        self.masks = masks if masks is not None else array("B")
+
+    def __len__(self):
+        return len(self.masks)
+
+    def append(self, mask):
+        self.masks.append(mask)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            flags = (self.FLAG_SWARM if self.swarm else 0) | (self.FLAG_LOD if self.lod else 0)
+            width, height = self.maze if self.maze is not None else (0, 0)
+            level = (self.level or "").encode("utf-8")
+            f.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.seed, self.dt, self.monster_count, flags,
+                                     width, height, self.level_hash, len(level)))
+            f.write(level)
+            f.write(self.masks.tobytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if data[:4] != cls.MAGIC or len(data) < 6:
+            raise ValueError(f"입력 기록 파일이 아님: {path}")
+        version = int.from_bytes(data[4:6], "little")
+        if version != cls.VERSION:
+            raise ValueError(f"입력 기록 버전이 다름 (파일 {version}, 지원 {cls.VERSION}): {path}")
+        (magic, version, seed, dt, monster_count, flags,
+         width, height, level_hash, level_size) = cls.HEADER.unpack_from(data)
+        start = cls.HEADER.size + level_size
+        level = data[cls.HEADER.size:start].decode("utf-8") or None
+        masks = array("B")
+        masks.frombytes(data[start:])
+        return cls(seed, dt, monster_count, bool(flags & cls.FLAG_SWARM), masks, bool(flags & cls.FLAG_LOD),
+                   maze=(width, height) if width else None, level=level, level_hash=level_hash)
+
+
+class InputRecorder:
+    """다른 입력 장치를 감싸서 틱마다 실제로 쓴 키를 InputLog 에 기록
+
+    플레이어에게는 기록되는 키(TRACKED_KEYS)만 넘겨서 재생 결과가 기록 때와 같도록 한다
+    """
+
+    def __init__(self, source, log):
+        self.source = source
+        self.log = log
+        self.current = None       # 이번 틱에 읽은 키 (한 틱에 여러 번 물어봐도 같은 값)
+
+    def get_pressed(self):
+        if self.current is None:
+            self.current = mask_keys(key_mask(self.source.get_pressed()))
+        return self.current
+
+    def advance(self):
+        # 이번 틱에 한 번도 안 물어봤으면 (탈진 등) 입력이 결과에 영향이 없으므로 0
+        self.log.append(key_mask(self.current) if self.current is not None else 0)
+        self.current = None
+        self.source.advance()
+
+
+class ReplayInput:
+    """InputLog 를 틱마다 그대로 돌려주는 입력 - 끝나면 아무 키도 안 누름"""
+
+    def __init__(self, log):
+        self.masks = log.masks
+        self.index = 0
+        self.states = [mask_keys(mask) for mask in range(1 << len(TRACKED_KEYS))]
+
+    def get_pressed(self):
+        if self.index >= len(self.masks):
+            return self.states[0]
+        return self.states[self.masks[self.index]]
+
+    def advance(self):
+        self.index += 1
+
+    def seek(self, tick):
+        self.index = tick
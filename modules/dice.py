@@ -0,0 +1,60 @@
+# modules/dice.py
+#
+# 몬스터마다 따로 쓰는 난수 (SplitMix64) - 상태가 64비트 정수 하나
+#
+#   Monster.rng = Dice(seed)                한 마리씩 (random.Random 과 같은 이름의 메서드)
+#   MonsterSwarm.dice = uint64 배열         같은 상태를 배열로 들고 roll(states) 로 한 번에 굴린다
+#
+# 같은 상태에서 Dice.random() 과 roll() 은 같은 값을 낸다 (스웜 == Monster.update).
+
+import os
+
+import numpy as np
+
+MASK = (1 << 64) - 1
+GAMMA = 0x9E3779B97F4A7C15
+MIX1 = 0xBF58476D1CE4E5B9
+MIX2 = 0x94D049BB133111EB
+UNIT = 1.0 / (1 << 53)    # 위 53비트 -> [0, 1)
+
+
+class Dice:
+    """몬스터 한 마리 난수 - random.Random 에서 쓰던 메서드만 (random / randrange / choice / uniform)"""
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little")
+        self.state = seed & MASK
+
+    def random(self):
+        self.state = z = (self.state + GAMMA) & MASK
+        z = ((z ^ (z >> 30)) * MIX1) & MASK
+        z = ((z ^ (z >> 27)) * MIX2) & MASK
+        return ((z ^ (z >> 31)) >> 11) * UNIT
+
+    def randrange(self, n):
+        return int(self.random() * n)     # roll() 결과에 n 을 곱해 버리는 스웜과 같은 값
+
+    def choice(self, seq):
+        return seq[self.randrange(len(seq))]
+
+    def uniform(self, a, b):
+        return a + (b - a) * self.random()
+
+    def getstate(self):
+        return self.state
+
+    def setstate(self, state):
+        self.state = state & MASK
+
+
+def roll(states):
+    """uint64 상태 배열을 한 칸씩 굴리고 (제자리) -> [0, 1) 실수 배열 (Dice.random 과 같은 값)"""
+    states += np.uint64(GAMMA)
+    z = states.copy()
+    z ^= z >> np.uint64(30)
+    z *= np.uint64(MIX1)
+    z ^= z >> np.uint64(27)
+    z *= np.uint64(MIX2)
+    z ^= z >> np.uint64(31)
+    return (z >> np.uint64(11)).astype(np.float64) * UNIT
@@ -0,0 +1,206 @@
+# modules/events.py
+#
+# 게임 이벤트 버스 - update 중에는 큐에 쌓기만 하고, 프레임마다 한 번 구독자에게 나눠 준다
+#
+#   events = map_manager.shared(EventBus)
+#   events.subscribe(on_state, StateChanged)      타입별 구독 (하위 타입 포함, 타입 없으면 전부)
+#   events.emit(StateChanged(monster, "PATROL", "CHASE", "HALL"))
+#   events.dispatch()                             프레임 끝에서 한 번
+#
+# 파일 / 콘솔 출력은 LogSink 가 백그라운드 스레드에서 프레임 묶음 단위로 한다 (시뮬레이션 경로에 I/O 없음).
+
+import queue
+import sys
+import threading
+
+
+# -------------------------------------------------------
+# 이벤트 타입
+# -------------------------------------------------------
+class Event:
+    """이벤트 공통 - frame 은 emit 할 때 버스가 찍는다. 필드는 만들 때 값을 복사해 둔다 (나중에 다른 스레드가 읽음)"""
+    __slots__ = ("frame",)
+
+    def message(self):
+        return type(self).__name__
+
+    def __repr__(self):
+        names = [name for cls in reversed(type(self).__mro__) for name in getattr(cls, "__slots__", ())]
+        fields = ", ".join(f"{name}={getattr(self, name, None)!r}" for name in names)
+        return f"{type(self).__name__}({fields})"
+
+
+class StateChanged(Event):
+    """몬스터 상태 전이 (monster = Monster, MonsterSwarm 이면 몬스터 인덱스)"""
+    __slots__ = ("monster", "old", "new", "map_name")
+
+    def __init__(self, monster, old, new, map_name):
+        self.monster = monster
+        self.old = old
+        self.new = new
+        self.map_name = map_name
+
+    def message(self):
+        return f"몬스터 {_name(self.monster)}: {self.old} -> {self.new} ({self.map_name})"
+
+
+class RoomChanged(Event):
+    """방 이동 (entity = 옮긴 엔티티, tile = 새 방에서 도착한 타일)"""
+    __slots__ = ("entity", "old_map", "new_map", "tile")
+
+    def __init__(self, entity, old_map, new_map, tile):
+        self.entity = entity
+        self.old_map = old_map
+        self.new_map = new_map
+        self.tile = tile
+
+    def message(self):
+        return f"{_name(self.entity)}: {self.old_map} -> {self.new_map} {self.tile}"
+
+
+class PlayerEvent(Event):
+    __slots__ = ("player",)
+    text = ""
+
+    def __init__(self, player):
+        self.player = player
+
+    def message(self):
+        return f"플레이어: {self.text}"
+
+
+class PlayerHid(PlayerEvent):
+    __slots__ = ()
+    text = "숨었습니다."
+
+
+class PlayerRevealed(PlayerEvent):
+    __slots__ = ()
+    text = "밖으로 나왔습니다."
+
+
+class PlayerExhausted(PlayerEvent):
+    __slots__ = ()
+    text = "탈진! 2초간 이동 불가."
+
+
+class PlayerRecovered(PlayerEvent):
+    __slots__ = ()
+    text = "체력 회복! 이동 가능."
+
+
+def _name(entity):
+    if isinstance(entity, int):
+        return f"#{entity}"
+    return f"{type(entity).__name__}@{id(entity):x}"
+
+
+# -------------------------------------------------------
+# 버스
+# -------------------------------------------------------
+class EventBus:
+    """이벤트 큐 + 구독자 목록 (맵 하나당 하나: map_manager.shared(EventBus))
+
+    구독자가 하나도 없으면 emit 은 아무것도 쌓지 않는다 (헤드리스 / 실험에서 큐가 자라지 않게).
+    구독자 안에서 emit 한 이벤트는 다음 dispatch 에서 나간다.
+    """
+
+    def __init__(self, map_manager=None):
+        self.queue = []
+        self.handlers = {}        # 이벤트 타입 -> [핸들러]
+        self.frame_handlers = []  # dispatch 마다 그 프레임 이벤트 리스트 통째로 받는 핸들러
+        self.frame = 0            # dispatch 횟수 (emit 한 이벤트에 찍힌다)
+        self.active = False       # 구독자가 있는가
+
+    def subscribe(self, handler, *event_types):
+        """handler(event) - event_types 를 안 주면 모든 이벤트"""
+        for event_type in event_types or (Event,):
+            self.handlers.setdefault(event_type, []).append(handler)
+        self.active = True
+
+    def subscribe_frame(self, handler):
+        """handler(events) - 이벤트가 있는 프레임마다 한 번, 그 프레임 이벤트 리스트 (LogSink 등 묶음 처리용)"""
+        self.frame_handlers.append(handler)
+        self.active = True
+
+    def unsubscribe(self, handler):
+        for handlers in self.handlers.values():
+            while handler in handlers:
+                handlers.remove(handler)
+        while handler in self.frame_handlers:
+            self.frame_handlers.remove(handler)
+        self.active = bool(self.frame_handlers) or any(self.handlers.values())
+
+    def emit(self, event):
+        if self.active:
+            event.frame = self.frame
+            self.queue.append(event)
+
+    def dispatch(self):
+        """쌓인 이벤트를 구독자에게 (emit 순서대로) -> 나눠 준 이벤트 수"""
+        events, self.queue = self.queue, []
+        self.frame += 1
+        if not events:
+            return 0
+
+        handlers = self.handlers
+        for event in events:
+            for event_type in type(event).__mro__:
+                for handler in handlers.get(event_type, ()):
+                    handler(event)
+        for handler in self.frame_handlers:
+            handler(events)
+        return len(events)
+
+
+# -------------------------------------------------------
+# 로그 출력 (백그라운드 스레드)
+# -------------------------------------------------------
+class LogSink:
+    """이벤트를 한 줄씩 글로 써 주는 구독자 - 메인 스레드는 프레임 묶음을 큐에 넣기만 한다
+
+    stream 대신 path 를 주면 그 파일에 쓴다 (close() 가 닫는다). 글자 만들기도 스레드에서 한다.
+    """
+
+    def __init__(self, stream=None, path=None):
+        self.file = open(path, "w", encoding="utf-8") if path is not None else None
+        self.stream = self.file if self.file is not None else (stream if stream is not None else sys.stdout)
+        self.batches = queue.SimpleQueue()      # 프레임 이벤트 리스트, None = 끝
+        self._put = self.batches.put
+        self.thread = threading.Thread(target=self._run, name="event-log", daemon=True)
+        self.thread.start()
+        self.bus = None
+
+    def attach(self, bus):
+        self.bus = bus
+        bus.subscribe_frame(self._put)
+        return self
+
+    def _run(self):
+        stream = self.stream
+        closing = False
+        while not closing:
+            # 밀린 묶음까지 모아서 한 번에 쓴다
+            batches = [self.batches.get()]
+            while True:
+                try:
+                    batches.append(self.batches.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batches:
+                closing = True
+                batches = batches[:batches.index(None)]
+            lines = [f"[{event.frame}] {event.message()}\n" for batch in batches for event in batch]
+            if lines:
+                stream.write("".join(lines))
+                stream.flush()
+
+    def close(self):
+        """남은 로그를 다 쓰고 스레드를 끝낸다"""
+        if self.bus is not None:
+            self.bus.unsubscribe(self._put)
+            self.bus = None
+        self.batches.put(None)
+        self.thread.join()
+        if self.file is not None:
+            self.file.close()
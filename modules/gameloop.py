@@ -0,0 +1,38 @@
+# modules/gameloop.py
+
+import pygame
+
+SIM_DT = 1 / 60           # 시뮬레이션 고정 틱 간격 (초)
+MAX_FRAME_TIME = 0.25     # 한 프레임에 따라잡을 최대 시간 (창 드래그 등으로 멈췄을 때 폭주 방지)
+
+
+class FixedTimestepLoop:
+    """렌더 프레임 시간과 상관없이 시뮬레이션은 항상 dt 간격으로 진행
+
+    매 프레임 advance(frame_time) -> 쌓인 시간만큼 step(dt) 를 여러 번(또는 0번) 호출하고
+    다음 틱까지 남은 비율 alpha (0 ~ 1) 를 돌려준다. 렌더는 alpha 로 이전/현재 위치를 보간.
+    """
+
+    def __init__(self, step, dt=SIM_DT, max_frame_time=MAX_FRAME_TIME):
+        self.step = step
+        self.dt = dt
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+        self.ticks = 0            # 지금까지 진행한 틱 수
+
+    def advance(self, frame_time):
+        self.accumulator += min(frame_time, self.max_frame_time)
+        while self.accumulator >= self.dt:
+            self.step(self.dt)
+            self.accumulator -= self.dt
+            self.ticks += 1
+        return self.accumulator / self.dt
+
+
+def interpolate_rect(prev_topleft, rect, alpha):
+    """이전 틱 위치와 현재 rect 사이를 alpha 만큼 보간한 Rect (prev_topleft 가 None 이면 현재 위치)"""
+    if prev_topleft is None:
+        return rect.copy()
+    x = prev_topleft[0] + (rect.x - prev_topleft[0]) * alpha
+    y = prev_topleft[1] + (rect.y - prev_topleft[1]) * alpha
+    return pygame.Rect(round(x), round(y), rect.width, rect.height)
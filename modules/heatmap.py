@@ -0,0 +1,232 @@
+# modules/heatmap.py
+#
+# SEARCH 용 "플레이어가 있을 법한 곳" 확률 지도 - 방마다 하나, 모든 몬스터 공유
+#
+#   heatmap = map_manager.shared(SearchHeatmap)
+#   heatmap.observe("HALL", (x, y))     플레이어를 봤다 (틱 끝에 그 타일 = 1, 나머지 0)
+#   heatmap.searched("HALL", x, y)      여기는 찾아봤다 (틱 끝에 0)
+#   heatmap.next_step("HALL", (x, y))   이웃 중 확률이 가장 높은 타일 (없으면 None)
+#   heatmap.update(dt)                  틱마다 한 번 (World.step 끝) - 방마다 스텐실 한 번
+#
+# 확률은 걸을 수 있는 타일을 따라 4방향으로 퍼진다 (벽은 막고 전체 합은 그대로).
+# 숨는 곳(FLAG_HIDE)은 확률이 천천히 빠져나가서 고인다 - 찾는 몬스터가 숨는 곳 쪽으로 올라간다.
+# observe / searched 는 틱 끝에 한꺼번에 반영하므로 틱 안에서는 읽기 전용 (몬스터 순서와 상관없음).
+# 지도를 바꾸는 건 update 하나뿐 - World.step 이 틱마다 한 번 부른다 (안 부르면 SEARCH 는 무작위 이동만 한다).
+
+import numpy as np
+
+from modules.map_manager import FLAG_WALL, FLAG_ENTRANCE, FLAG_HIDE
+
+SEARCH_RADIUS = 32        # 마지막 목격 타일 주변 몇 칸까지 확률을 퍼뜨리나 (큰 방도 창 하나만 갱신)
+SPREAD_RATE = 12.0        # 초당 이웃 한 칸으로 넘어가는 비율 (틱마다 SPREAD_RATE * dt)
+MAX_SPREAD = 0.25         # 틱당 비율 상한 (4방향 합이 1 을 넘으면 음수가 생긴다)
+HIDE_LEAK = 0.25          # 숨는 곳에서 빠져나가는 속도 배율 (작을수록 더 고인다)
+MEMORY = 12.0             # 마지막 목격 후 이 시간 (초) 이 지나면 지도를 버린다 (LOST + SEARCH 시간)
+
+
+class Trace:
+    """방 하나의 확률 창 - 마지막 목격 타일 (cx, cy) 중심 SEARCH_RADIUS 정사각형 (방 밖은 잘라냄)
+
+    p[y - y0, x - x0] = (x, y) 에 플레이어가 있을 확률 (창 밖은 0)
+    """
+
+    def __init__(self, room, tile, radius=SEARCH_RADIUS):
+        self.room = room
+        self.version = room.version
+        self.cx, self.cy = tile
+        self.radius = radius
+        self.x0 = max(0, self.cx - radius)
+        self.y0 = max(0, self.cy - radius)
+        x1 = min(room.width, self.cx + radius + 1)
+        y1 = min(room.height, self.cy + radius + 1)
+        self.width = x1 - self.x0
+        self.height = y1 - self.y0
+        self.age = 0.0            # 마지막 목격 후 지난 시간 (초)
+
+        grid = room.grid[self.y0:y1, self.x0:x1]
+        walk = (grid & FLAG_WALL) == 0
+        self.open = walk & ((grid & FLAG_ENTRANCE) == 0)    # 찾으러 발을 디딜 수 있는 타일
+        padded = np.pad(walk, 1)                            # 창 테두리 밖은 벽 취급
+        degree = (padded[:-2, 1:-1].astype(np.float32) + padded[2:, 1:-1] +
+                  padded[1:-1, :-2] + padded[1:-1, 2:]) * walk
+        leak = np.where((grid & FLAG_HIDE) != 0, HIDE_LEAK, 1.0).astype(np.float32) * walk
+
+        # 테두리 한 칸을 두른 버퍼를 1차원으로 펴서 쓴다 - 이웃은 +-1, +-한 줄 떨어진 연속 슬라이스
+        # (테두리 칸은 walk / degree / leak 가 0 이라 늘 0 으로 남는다)
+        self._p = np.zeros((self.height + 2, self.width + 2), dtype=np.float32)
+        self.p = self._p[1:-1, 1:-1]
+        self._flat = self._p.reshape(-1)
+        self._walk = np.pad(walk, 1).astype(np.float32).reshape(-1)
+        self._degree = np.pad(degree, 1).reshape(-1)
+        self._leak = np.pad(leak, 1).reshape(-1)
+        self._flow = np.zeros_like(self._flat)
+        self._inflow = np.zeros_like(self._flat)
+        self.reset(tile)
+
+    def contains(self, x, y):
+        return 0 <= x - self.x0 < self.width and 0 <= y - self.y0 < self.height
+
+    def is_valid(self, room):
+        return room is self.room and room.version == self.version
+
+    def reset(self, tile):
+        """tile 에서 봤다 - 확률을 그 타일 하나로 모은다"""
+        self.age = 0.0
+        self.p[...] = 0
+        self.p[tile[1] - self.y0, tile[0] - self.x0] = 1.0
+
+    def clear(self, xs, ys):
+        """찾아본 타일들 (창 밖은 무시) 의 확률을 0 으로"""
+        xs = np.asarray(xs) - self.x0
+        ys = np.asarray(ys) - self.y0
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        self.p[ys[inside], xs[inside]] = 0
+
+    def diffuse(self, rate):
+        """한 틱 퍼뜨리기 - 타일마다 확률의 rate * leak 를 걸을 수 있는 이웃 하나하나에 보낸다"""
+        row = self.width + 2
+        p = self._flat
+        flow = self._flow
+        np.multiply(p, self._leak, out=flow)
+        flow *= rate
+        inflow = self._inflow[row:-row]
+        np.add(flow[row - 1:-row - 1], flow[row + 1:-row + 1], out=inflow)
+        inflow += flow[:-2 * row]
+        inflow += flow[2 * row:]
+        inflow *= self._walk[row:-row]
+        flow *= self._degree
+        p -= flow
+        p[row:-row] += inflow
+
+    def value(self, x, y):
+        if self.contains(x, y):
+            return float(self.p[y - self.y0, x - self.x0])
+        return 0.0
+
+
+class SearchHeatmap:
+    """방 이름 -> Trace - 본 적이 있고 MEMORY 초가 안 지난 방만 들고 있다
+
+    사용: map_manager.shared(SearchHeatmap)
+    """
+
+    def __init__(self, map_manager, radius=SEARCH_RADIUS):
+        self.map_manager = map_manager
+        self.radius = radius
+        self.traces = {}          # 방 이름 -> Trace
+        self.sightings = {}       # 방 이름 -> 이번 틱에 본 플레이어 타일 (update 에서 반영)
+        self.searched_tiles = {}  # 방 이름 -> [(xs, ys), ...] 이번 틱에 찾아본 타일 (update 에서 반영)
+
+    def reset(self):
+        self.traces.clear()
+        self.sightings.clear()
+        self.searched_tiles.clear()
+
+    # -------------------------------------------------------
+    # 틱 안에서 (쌓기만)
+    # -------------------------------------------------------
+    def observe(self, map_name, tile):
+        """map_name 의 tile 에서 플레이어를 봤다"""
+        self.sightings[map_name] = (int(tile[0]), int(tile[1]))
+
+    def searched(self, map_name, x, y):
+        """찾아본 타일 - x, y 는 정수 또는 배열 (스웜이 한 번에)"""
+        if map_name in self.traces:
+            self.searched_tiles.setdefault(map_name, []).append((x, y))
+
+    # -------------------------------------------------------
+    # 조회 (틱 안에서는 지도가 바뀌지 않는다)
+    # -------------------------------------------------------
+    def next_step(self, map_name, tile):
+        """tile 의 4방향 이웃 중 확률이 가장 높은 (0 보다 큰) 발 디딜 타일 - 없으면 None
+
+        같으면 오른쪽 / 왼쪽 / 아래 / 위 순서로 먼저 것 (steps 와 같은 규칙)
+        """
+        trace = self.traces.get(map_name)
+        if trace is None:
+            return None
+        x, y = tile
+        best = None
+        best_p = 0.0
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if trace.contains(nx, ny) and trace.open[ny - trace.y0, nx - trace.x0]:
+                value = trace.p[ny - trace.y0, nx - trace.x0]
+                if value > best_p:
+                    best = (nx, ny)
+                    best_p = value
+        return best
+
+    def steps(self, map_name, xs, ys):
+        """next_step 을 타일 배열로 -> (찾음 bool 배열, 다음 x 배열, 다음 y 배열)"""
+        found = np.zeros(len(xs), dtype=np.bool_)
+        best_x = np.array(xs, dtype=np.int64)
+        best_y = np.array(ys, dtype=np.int64)
+        trace = self.traces.get(map_name)
+        if trace is None:
+            return found, best_x, best_y
+
+        best_p = np.zeros(len(xs), dtype=np.float32)
+        for ox, oy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            lx = xs + ox - trace.x0
+            ly = ys + oy - trace.y0
+            ok = (lx >= 0) & (lx < trace.width) & (ly >= 0) & (ly < trace.height)
+            lx = np.where(ok, lx, 0)
+            ly = np.where(ok, ly, 0)
+            value = np.where(ok & trace.open[ly, lx], trace.p[ly, lx], 0)
+            better = value > best_p
+            best_x[better] = xs[better] + ox
+            best_y[better] = ys[better] + oy
+            best_p[better] = value[better]
+            found |= better
+        return found, best_x, best_y
+
+    def probability(self, map_name, x, y):
+        trace = self.traces.get(map_name)
+        return 0.0 if trace is None else trace.value(x, y)
+
+    # -------------------------------------------------------
+    # 틱 끝 갱신
+    # -------------------------------------------------------
+    def update(self, dt):
+        """쌓인 목격 / 찾아본 타일 반영 -> 방마다 퍼뜨리기 한 번 -> 오래된 방은 버림
+
+        틱마다 정확히 한 번 (World.step 끝) - 지도를 바꾸는 곳은 여기뿐
+        """
+        rooms = self.map_manager.rooms
+        for map_name, tile in self.sightings.items():
+            room = rooms[map_name]
+            trace = self.traces.get(map_name)
+            # 창 중심 근처에서 다시 봤으면 창을 그대로 쓰고, 멀어졌으면 새 창
+            if (trace is not None and trace.is_valid(room) and
+                    abs(tile[0] - trace.cx) <= trace.radius // 2 and abs(tile[1] - trace.cy) <= trace.radius // 2):
+                trace.reset(tile)
+            else:
+                self.traces[map_name] = Trace(room, tile, self.radius)
+        self.sightings.clear()
+
+        for map_name, tiles in self.searched_tiles.items():
+            trace = self.traces.get(map_name)
+            if trace is not None:
+                for xs, ys in tiles:
+                    trace.clear(xs, ys)
+        self.searched_tiles.clear()
+
+        if not self.traces:
+            return
+        rate = min(MAX_SPREAD, SPREAD_RATE * dt)
+        for map_name, trace in list(self.traces.items()):
+            if trace.age > MEMORY or not trace.is_valid(rooms.get(map_name)):
+                del self.traces[map_name]
+                continue
+            trace.diffuse(rate)
+            trace.age += dt
+
+    def restore(self, map_name, tile, age, p):
+        """스냅샷에서 - tile 중심 창을 새로 만들고 확률 / 나이를 덮어쓴다"""
+        trace = Trace(self.map_manager.rooms[map_name], tile, self.radius)
+        if p.size != trace.p.size:
+            raise ValueError(f"확률 창 크기가 맞지 않음: {map_name} {p.size} != {trace.p.size}")
+        trace.p[...] = p.reshape(trace.p.shape)
+        self.traces[map_name] = trace
+        trace.age = age
+        return trace
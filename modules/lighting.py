@@ -0,0 +1,122 @@
+# modules/lighting.py
+
+import numpy as np
+import pygame
+
+from modules.map_manager import TILE_SIZE
+from modules.sight import SightCache
+
+LIGHT_RADIUS = 6                 # 기본 빛 반경 (타일)
+AMBIENT_COLOR = (14, 12, 20)     # 빛이 닿지 않는 곳의 밝기 (곱하기 값)
+STENCIL_CACHE_SIZE = 256         # 시야 스텐실을 들고 있을 최대 타일 수
+
+_gradients = {}                  # 반경(픽셀) -> 방사형 그라디언트 Surface
+
+
+def radial_gradient(radius):
+    """가운데 흰색 -> 가장자리 검은색인 (2r x 2r) Surface (반경마다 한 번만 만든다)"""
+    surface = _gradients.get(radius)
+    if surface is None:
+        coords = np.arange(2 * radius) - radius + 0.5
+        dist = np.sqrt(coords[:, None] ** 2 + coords[None, :] ** 2) / radius
+        level = (np.clip(1.0 - dist, 0.0, 1.0) ** 1.5 * 255).astype(np.uint8)
+        surface = pygame.surfarray.make_surface(np.repeat(level[:, :, None], 3, axis=2))
+        _gradients[radius] = surface
+    return surface
+
+
+class LightingLayer:
+    """플레이어 주변만 밝고 나머지는 어두운 공포 시야
+
+    어둠 마스크 = 주변광 색 위에 (방사형 그라디언트 x 시야 스텐실) 을 얹은 화면 크기 Surface.
+    시야 스텐실은 플레이어 타일에서 shadowcast 로 보이는 타일만 흰색 (SightCache 공유).
+    플레이어 타일 / 카메라 / 빛 위치가 그대로면 마스크를 다시 만들지 않고,
+    화면에는 BLEND_RGBA_MULT blit 한 번으로 입힌다.
+
+    바뀐 곳만 그리는 프레임: 조명 전 화면(scene) 에 그린 뒤 prepare() -> compose(screen, scene, rects)
+    사각형마다 scene 을 복사하고 마스크를 곱하므로 사각형이 겹쳐도 두 번 어두워지지 않는다.
+    """
+
+    def __init__(self, map_manager, map_name="HALL", tile_size=TILE_SIZE):
+        self.map_manager = map_manager
+        self.map_name = map_name          # 빛을 비추는 방 (플레이어가 있는 방)
+        self.tile_size = tile_size
+        self.sight = map_manager.shared(SightCache)
+
+        self.mask = None
+        self.mask_key = None
+        self.stencils = {}                # (방 이름, 타일, 반경) -> (room.version, Surface)
+
+    def draw(self, screen, player, camera_offset, light_rect=None):
+        """player 를 광원으로 screen 전체에 어둠을 입힌다 (light_rect: 보간된 플레이어 rect)"""
+        self.prepare(screen.get_size(), player, camera_offset, light_rect)
+        screen.blit(self.mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+
+    def prepare(self, size, player, camera_offset, light_rect=None):
+        """이번 프레임 마스크를 맞춘다 -> 다시 만들었으면 True (화면 전체에 다시 입혀야 한다)"""
+        rect = player.rect if light_rect is None else light_rect
+        center = (rect.centerx - camera_offset[0], rect.centery - camera_offset[1])
+        tile = (player.tile_x, player.tile_y)
+        radius = getattr(player, "light_radius", LIGHT_RADIUS)
+        version = self.map_manager.rooms[self.map_name].version
+
+        key = (self.map_name, version, tile, radius, tuple(camera_offset), center, tuple(size))
+        if key == self.mask_key:
+            return False
+        self._build_mask(size, tile, radius, camera_offset, center)
+        self.mask_key = key
+        return True
+
+    def compose(self, screen, scene, rects=None):
+        """scene (조명 전 화면) x 마스크 -> screen (rects 를 주면 그 화면 사각형만, 없으면 전체)"""
+        if rects is None:
+            screen.blit(scene, (0, 0))
+            screen.blit(self.mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            return
+        for rect in rects:
+            screen.blit(scene, rect, rect)
+            screen.blit(self.mask, rect, rect, special_flags=pygame.BLEND_RGBA_MULT)
+
+    # -------------------------------------------------------
+    # 마스크 만들기
+    # -------------------------------------------------------
+    def _build_mask(self, size, tile, radius, camera_offset, center):
+        if self.mask is None or self.mask.get_size() != size:
+            self.mask = pygame.Surface(size)
+        self.mask.fill(AMBIENT_COLOR)
+
+        radius_px = radius * self.tile_size
+        light = radial_gradient(radius_px).copy()
+        light_pos = (center[0] - radius_px, center[1] - radius_px)
+
+        # 보이지 않는 타일은 그라디언트를 지운다 (스텐실 곱하기)
+        stencil_tiles = radius + 1
+        stencil = self._stencil(tile, stencil_tiles)
+        stencil_pos = ((tile[0] - stencil_tiles) * self.tile_size - camera_offset[0],
+                       (tile[1] - stencil_tiles) * self.tile_size - camera_offset[1])
+        light.blit(stencil, (stencil_pos[0] - light_pos[0], stencil_pos[1] - light_pos[1]),
+                   special_flags=pygame.BLEND_RGB_MULT)
+
+        self.mask.blit(light, light_pos, special_flags=pygame.BLEND_RGB_MAX)
+
+    def _stencil(self, tile, radius):
+        """tile 에서 보이는 타일만 흰색인 ((2r+1) 타일)^2 Surface - 방 타일이 바뀌면 다시 만든다"""
+        room = self.map_manager.rooms[self.map_name]
+        key = (self.map_name, tile, radius)
+        cached = self.stencils.get(key)
+        if cached is not None and cached[0] == room.version:
+            return cached[1]
+
+        size = self.tile_size
+        surface = pygame.Surface(((2 * radius + 1) * size, (2 * radius + 1) * size))
+        surface.fill((0, 0, 0))
+        fov = self.sight.get(self.map_name, tile)
+        for dy in range(-radius, radius + 1):
+            for dx in range(-radius, radius + 1):
+                if fov.can_see(tile[0] + dx, tile[1] + dy):
+                    surface.fill((255, 255, 255), ((dx + radius) * size, (dy + radius) * size, size, size))
+
+        if len(self.stencils) >= STENCIL_CACHE_SIZE:
+            self.stencils.clear()
+        self.stencils[key] = (room.version, surface)
+        return surface
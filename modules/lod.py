@@ -0,0 +1,155 @@
+# modules/lod.py
+
+import heapq
+
+from modules.events import RoomChanged
+from modules.map_manager import TILE_SIZE
+from modules.monster import WAIT_DURATION
+from modules.roomgraph import RoomGraph
+
+COARSE_DWELL = (10.0, 30.0)    # 거친 몬스터가 방을 나가기 전에 그 방을 돌아다니는 시간 범위 (초)
+
+
+class LodScheduler:
+    """몬스터 LOD (level of detail) - 플레이어가 있는 방의 몬스터만 정밀하게 갱신
+
+    - 플레이어 방의 몬스터: 매 틱 Monster.update (픽셀 단위 그대로)
+    - 다른 방의 몬스터: 방 그래프만 따라가는 거친 모델.
+      방을 COARSE_DWELL 동안 돌아다니다 연결된 입구 하나를 골라
+      (맨해튼 거리 / 속도 + WAIT_DURATION) 뒤에 그 방으로 넘어간다.
+      goal_room 이 있는 몬스터는 돌아다니지 않고 방 그래프가 고른 입구로 (실제 걸음 수) 바로 간다.
+      도착 시각을 힙에 넣어 두므로 틱마다 드는 비용은 도착한 몬스터 수뿐이다.
+    - 거친 몬스터가 플레이어 방으로 들어오거나 플레이어가 그 방에 들어가면 정밀 모드로 올린다
+      (마지막으로 서 있던 타일 중앙에서 PATROL 부터 다시 시작)
+    """
+
+    def __init__(self, map_manager, monsters, index=None):
+        self.map_manager = map_manager
+        self.monsters = monsters
+        self.index = index        # EntityIndex - 거친 몬스터는 위치가 정확하지 않으므로 색인에서 뺀다
+        self.time = 0.0
+        self.player_map = None
+
+        self.full = []            # 정밀 갱신할 몬스터 (monsters 순서 유지)
+        self.coarse = {}          # 방 이름 -> 그 방의 거친 몬스터 set
+        self.events = []          # (도착 시각, 순번, 몬스터, 목표 입구) 힙
+        self.legs = {}            # 몬스터 -> 지금 유효한 이동의 순번 (취소된 힙 항목 거르기)
+        self._seq = 0
+        self._exits = {}          # 방 이름 -> 연결된 입구 좌표 리스트
+        self._exits_version = None    # _exits 를 만들 때의 map_manager.links_version
+        self.room_graph = map_manager.shared(RoomGraph)
+
+    def update(self, player_map, dt):
+        """시간을 dt 만큼 진행 -> 이번 틱에 정밀 update 할 몬스터 리스트"""
+        if player_map != self.player_map:
+            self._set_player_map(player_map)
+
+        # 정밀 몬스터가 다른 방으로 나갔으면 내린다
+        if any(monster.current_map != player_map for monster in self.full):
+            for monster in [m for m in self.full if m.current_map != player_map]:
+                self._demote(monster)
+            self._rebuild_full()
+
+        self.time += dt
+        events = self.events
+        promoted = False
+        while events and events[0][0] <= self.time:
+            _, seq, monster, exit_tile = heapq.heappop(events)
+            if self.legs.get(monster) != seq:
+                continue
+            promoted |= self._hop(monster, exit_tile)
+        if promoted:
+            self._rebuild_full()
+        return self.full
+
+    def is_coarse(self, monster):
+        return monster in self.legs
+
+    # -------------------------------------------------------
+    # 올리기 / 내리기
+    # -------------------------------------------------------
+    def _set_player_map(self, player_map):
+        first = self.player_map is None
+        self.player_map = player_map
+        for monster in list(self.coarse.get(player_map, ())):
+            self._promote(monster)
+        for monster in (self.monsters if first else self.full):
+            if monster.active and monster.current_map != player_map and not self.is_coarse(monster):
+                self._demote(monster)
+        self._rebuild_full()
+
+    def _rebuild_full(self):
+        self.full = [m for m in self.monsters if m.active and not self.is_coarse(m)]
+
+    def _promote(self, monster):
+        del self.legs[monster]
+        self.coarse[monster.current_map].discard(monster)
+        monster.spawn((monster.tile_x, monster.tile_y))   # 타일 중앙, PATROL, 타이머 초기화
+
+    def _demote(self, monster):
+        if self.index is not None:
+            self.index.remove(monster)
+        monster.set_state("PATROL")
+        monster.prev_state = None
+        monster.target_tile = None
+        monster.wait_timer = 0
+        self.coarse.setdefault(monster.current_map, set()).add(monster)
+        self._plan_leg(monster)
+
+    # -------------------------------------------------------
+    # 거친 모델
+    # -------------------------------------------------------
+    def _exits_of(self, map_name):
+        if self._exits_version != self.map_manager.links_version:
+            self._exits.clear()
+            self._exits_version = self.map_manager.links_version
+        exits = self._exits.get(map_name)
+        if exits is None:
+            exits = self._exits[map_name] = sorted(pos for room, pos in self.map_manager.room_links if room == map_name)
+        return exits
+
+    def _plan_leg(self, monster):
+        """다음에 나갈 입구와 도착 시각을 정해 힙에 넣는다 (나갈 곳이 없으면 올려질 때까지 그대로)"""
+        self._seq += 1
+        self.legs[monster] = self._seq
+
+        if monster.goal_room == monster.current_map:
+            monster.goal_room = None
+        if monster.speed <= 0:
+            return
+
+        tile = (monster.tile_x, monster.tile_y)
+        exit_tile = None
+        if monster.goal_room is not None:
+            exit_tile = self.room_graph.next_exit(monster.current_map, tile, monster.goal_room)
+            if exit_tile is None:
+                monster.goal_room = None      # 갈 수 없는 방
+        if exit_tile is not None:
+            tiles = self.room_graph.walk_distance(monster.current_map, tile, exit_tile)
+            dwell = 0.0
+        else:
+            exits = self._exits_of(monster.current_map)
+            if not exits:
+                return
+            exit_tile = monster.rng.choice(exits)
+            tiles = abs(exit_tile[0] - monster.tile_x) + abs(exit_tile[1] - monster.tile_y)
+            dwell = monster.rng.uniform(*COARSE_DWELL)
+        arrive = self.time + dwell + tiles * TILE_SIZE / monster.speed + WAIT_DURATION
+        heapq.heappush(self.events, (arrive, self._seq, monster, exit_tile))
+
+    def _hop(self, monster, exit_tile):
+        """exit_tile 을 지나 옆 방으로 -> 플레이어 방에 들어왔으면 True"""
+        self.coarse[monster.current_map].discard(monster)
+        old_map = monster.current_map
+        monster.current_map, monster.tile_x, monster.tile_y = \
+            self.map_manager.move_to_room(exit_tile, monster.current_map)
+        monster.events.emit(RoomChanged(monster, old_map, monster.current_map, (monster.tile_x, monster.tile_y)))
+
+        if monster.current_map == self.player_map:
+            del self.legs[monster]
+            monster.spawn((monster.tile_x, monster.tile_y))
+            return True
+
+        self.coarse.setdefault(monster.current_map, set()).add(monster)
+        self._plan_leg(monster)
+        return False
@@ -0,0 +1,229 @@
+# modules/map_format.py
+#
+# 방 파일 (.room) = 64바이트 헤더 + 타일 배열 + 입구 배열 + 방 연결 배열 (전부 고정 크기, 8바이트 정렬)
+#
+#   헤더     magic "HERM", version, width, height, 입구 수, 연결 수, 방 이름 (utf-8, 32바이트)
+#   타일     width * height 바이트 (map_manager 타일 플래그, y * width + x)
+#   입구     ENTRANCE_DTYPE x 입구 수
+#   연결     LINK_DTYPE x 연결 수 (이 방의 입구 -> 다른 방 입구)
+#
+# np.memmap 으로 열어서 각 구간을 그대로 뷰로 쓰므로 파싱이 없다.
+
+import csv
+import hashlib
+import os
+import struct
+
+import numpy as np
+
+from modules.map_manager import TILE_CHARS, FLAG_ENTRANCE
+
+MAGIC = b"HERM"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIII32s")    # magic, version, 예약, width, height, 입구 수, 연결 수, 이름
+HEADER_SIZE = 64
+ALIGN = 8
+ROOM_EXT = ".room"
+CACHE_DIR_NAME = "__mapcache__"
+
+NAME_SIZE = 32
+ENTRANCE_DTYPE = np.dtype([("x", "<i4"), ("y", "<i4")])
+LINK_DTYPE = np.dtype([("x", "<i4"), ("y", "<i4"), ("to_x", "<i4"), ("to_y", "<i4"), ("to_room", f"S{NAME_SIZE}")])
+
+
+def _align(n):
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+def _encode_name(name):
+    data = name.encode("utf-8")
+    if len(data) > NAME_SIZE:
+        raise ValueError(f"방 이름이 너무 김 ({NAME_SIZE}바이트 이하): {name}")
+    return data
+
+
+# -------------------------------------------------------
+# 쓰기 / 읽기
+# -------------------------------------------------------
+def write_room(path, name, width, height, tiles, links=()):
+    """방 하나를 .room 파일로 저장
+
+    tiles = width * height 바이트 (bytes / bytearray / uint8 배열)
+    links = [((x, y), 도착 방 이름, (x, y)), ...]
+    """
+    tiles = np.asarray(memoryview(tiles), dtype=np.uint8).reshape(-1)
+    if len(tiles) != width * height:
+        raise ValueError(f"타일 수가 맞지 않음: {len(tiles)} != {width} x {height}")
+
+    ys, xs = np.divmod(np.flatnonzero(tiles & FLAG_ENTRANCE), width)
+    entrances = np.zeros(len(xs), dtype=ENTRANCE_DTYPE)
+    entrances["x"] = xs
+    entrances["y"] = ys
+
+    link_table = np.zeros(len(links), dtype=LINK_DTYPE)
+    for i, ((x, y), to_room, (to_x, to_y)) in enumerate(links):
+        link_table[i] = (x, y, to_x, to_y, _encode_name(to_room))
+
+    header = HEADER.pack(MAGIC, VERSION, 0, width, height, len(entrances), len(link_table), _encode_name(name))
+    tiles_end = HEADER_SIZE + len(tiles)
+    entrances_end = _align(tiles_end) + entrances.nbytes
+
+    with open(path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        f.write(tiles.tobytes())
+        f.write(b"\0" * (_align(tiles_end) - tiles_end))
+        f.write(entrances.tobytes())
+        f.write(b"\0" * (_align(entrances_end) - entrances_end))
+        f.write(link_table.tobytes())
+
+
+class RoomFile:
+    """np.memmap 으로 연 .room 파일 - tiles / entrances / links 는 파일을 바로 보는 배열
+
+    mode="c" (copy-on-write) 라 게임 중 타일을 바꿔도 디스크 파일은 그대로
+    """
+
+    def __init__(self, path, mode="c"):
+        self.path = path
+        self.data = np.memmap(path, dtype=np.uint8, mode=mode)
+
+        magic, version, _, width, height, entrance_count, link_count, name = HEADER.unpack_from(self.data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"방 파일이 아님: {path}")
+        self.name = name.rstrip(b"\0").decode("utf-8")
+        self.width = width
+        self.height = height
+
+        start = HEADER_SIZE
+        self.tiles = self.data[start:start + width * height]
+        start = _align(start + width * height)
+        self.entrances = self.data[start:start + entrance_count * ENTRANCE_DTYPE.itemsize].view(ENTRANCE_DTYPE)
+        start = _align(start + self.entrances.nbytes)
+        self.links = self.data[start:start + link_count * LINK_DTYPE.itemsize].view(LINK_DTYPE)
+
+    def link_list(self):
+        """[((x, y), 도착 방 이름, (x, y)), ...]"""
+        return [((int(l["x"]), int(l["y"])), l["to_room"].decode("utf-8"), (int(l["to_x"]), int(l["to_y"])))
+                for l in self.links]
+
+
+# -------------------------------------------------------
+# 텍스트 / CSV 레이아웃 -> .room
+# -------------------------------------------------------
+def parse_text_level(text):
+    """텍스트 레벨 -> (방 이름 -> 행 리스트, 연결 리스트)
+
+        [HALL]            방 이름
+        #####             '#' 벽 / '.' 바닥 / 'E' 입구 / 'H' 숨는 곳
+        #...E
+        [links]
+        HALL 4 1 CELLAR 0 5     (양방향 연결, '#' 뒤는 주석)
+    """
+    rooms = {}
+    links = []
+    section = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped.startswith("[") and stripped.endswith("]"):
+            section = stripped[1:-1].strip()
+            if section != "links":
+                rooms[section] = []
+            continue
+        if section == "links":
+            stripped = stripped.split("#", 1)[0].strip()
+            if stripped:
+                room_a, xa, ya, room_b, xb, yb = stripped.split()
+                links.append(((room_a, (int(xa), int(ya))), (room_b, (int(xb), int(yb)))))
+        elif section is not None:
+            rooms[section].append(line.rstrip())
+        else:
+            raise ValueError(f"[방 이름] 앞에 내용이 있음: {line!r}")
+    return rooms, links
+
+
+def parse_csv_room(text):
+    """CSV 방 -> (행 리스트, 연결 리스트)
+
+    칸 = 타일 문자 ('#', '.', 'E', 'H') 또는 플래그 숫자
+    '@link,x,y,도착 방,x,y' 줄은 이 방에서 나가는 연결 (한쪽 방향)
+    """
+    rows = []
+    links = []
+    for cells in csv.reader(text.splitlines()):
+        if not cells:
+            continue
+        if cells[0] == "@link":
+            _, x, y, to_room, to_x, to_y = cells
+            links.append(((int(x), int(y)), to_room.strip(), (int(to_x), int(to_y))))
+            continue
+        rows.append([cell.strip() for cell in cells])
+    return rows, links
+
+
+def _tile_bytes(rows, width):
+    """행(문자열 또는 칸 리스트) -> 타일 플래그 바이트 (짧은 행은 바닥으로 채움)"""
+    tiles = bytearray(width * len(rows))
+    for y, row in enumerate(rows):
+        for x, cell in enumerate(row):
+            tiles[y * width + x] = TILE_CHARS[cell] if cell in TILE_CHARS else int(cell)
+    return tiles
+
+
+def compile_level(source_path, out_dir):
+    """텍스트(.txt) 또는 CSV(.csv) 레이아웃을 out_dir 안의 .room 파일들로 변환 -> 파일 경로 리스트 (방 순서대로)"""
+    with open(source_path, encoding="utf-8") as f:
+        text = f.read()
+
+    if source_path.lower().endswith(".csv"):
+        rows, room_links = parse_csv_room(text)
+        name = os.path.splitext(os.path.basename(source_path))[0]
+        rooms = {name: rows}
+        outgoing = {name: room_links}
+    else:
+        rooms, links = parse_text_level(text)
+        outgoing = {name: [] for name in rooms}
+        for (room_a, pos_a), (room_b, pos_b) in links:
+            outgoing[room_a].append((pos_a, room_b, pos_b))
+            outgoing[room_b].append((pos_b, room_a, pos_a))
+
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for i, (name, rows) in enumerate(rooms.items()):
+        width = max((len(row) for row in rows), default=0)
+        path = os.path.join(out_dir, f"{i:03d}_{name}{ROOM_EXT}")
+        write_room(path, name, width, len(rows), _tile_bytes(rows, width), outgoing[name])
+        paths.append(path)
+    return paths
+
+
+def content_hash(path):
+    h = hashlib.sha1()
+    h.update(f"v{VERSION}".encode())
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.hexdigest()[:16]
+
+
+def cached_level(source_path, cache_dir=None):
+    """내용 해시로 캐시된 .room 파일 경로들 - 레이아웃이 안 바뀌었으면 다시 변환하지 않는다"""
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(source_path)), CACHE_DIR_NAME)
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    out_dir = os.path.join(cache_dir, f"{stem}-{content_hash(source_path)}")
+
+    if os.path.isdir(out_dir):
+        paths = sorted(os.path.join(out_dir, f) for f in os.listdir(out_dir) if f.endswith(ROOM_EXT))
+        if paths:
+            return paths
+
+    # 다른 프로세스와 겹치지 않게 임시 디렉터리에 만든 뒤 이름을 바꾼다
+    tmp_dir = f"{out_dir}.tmp{os.getpid()}"
+    compile_level(source_path, tmp_dir)
+    try:
+        os.replace(tmp_dir, out_dir)
+    except OSError:
+        pass    # 누가 먼저 만들었으면 그쪽을 쓴다
+    return sorted(os.path.join(out_dir, f) for f in os.listdir(out_dir) if f.endswith(ROOM_EXT))
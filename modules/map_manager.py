@@ -0,0 +1,218 @@
+# modules/map_manager.py
+
+import random
+
+import numpy as np
+import pygame
+
+TILE_SIZE = 32            # 타일 한 칸 픽셀 크기
+
+# 타일 플래그 (한 타일 = 1바이트, 비트별 의미)
+FLAG_WALL = 0x01          # 벽 (이동 불가)
+FLAG_ENTRANCE = 0x02      # 방 입구 (다른 방으로 이어짐)
+FLAG_HIDE = 0x04          # 숨는 곳 (걸을 수 있는 바닥)
+
+# 텍스트 레이아웃 문자 -> 타일 플래그
+TILE_CHARS = {
+    ".": 0,
+    "#": FLAG_WALL,
+    "E": FLAG_ENTRANCE,
+    "H": FLAG_HIDE,
+}
+
+
+class Room:
+    """방 하나의 타일 그리드 (bytearray 한 줄 + 같은 메모리를 보는 NumPy 뷰)"""
+
+    def __init__(self, name, width, height, tiles=None):
+        self.name = name
+        self.width = width
+        self.height = height
+
+        # tiles[y * width + x] 한 번 읽기로 벽/입구 판정
+        self.tiles = tiles if tiles is not None else bytearray(width * height)
+        # 벡터 연산용 (height, width) 뷰 - 메모리는 tiles 와 공유
+        self.grid = np.frombuffer(self.tiles, dtype=np.uint8).reshape(height, width)
+
+        self.entrances = set()    # 입구 타일 좌표 (x, y)
+        self.version = 0          # 타일이 바뀔 때마다 증가 (캐시 무효화용)
+
+        # 순찰 목표 후보: 걸을 수 있고 입구가 아닌 타일의 평탄 인덱스
+        self._walkable_index = None
+        self._walkable_version = -1
+
+    @property
+    def walkable_index(self):
+        """걸을 수 있는(입구 제외) 타일의 y * width + x 배열 - 타일이 바뀌면 다시 만든다"""
+        if self._walkable_version != self.version:
+            flat = self.grid.reshape(-1)
+            self._walkable_index = np.flatnonzero((flat & (FLAG_WALL | FLAG_ENTRANCE)) == 0).astype(np.int32)
+            self._walkable_version = self.version
+        return self._walkable_index
+
+    def in_bounds(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def flags(self, x, y):
+        return self.tiles[y * self.width + x]
+
+
+class MapManager:
+    def __init__(self):
+        self.rooms = {}             # 방 이름 -> Room
+        self.room_entrances = {}    # 방 이름 -> 입구 좌표 set (Room.entrances 와 같은 객체)
+        self.room_links = {}        # (방 이름, (x, y)) -> (도착 방 이름, (x, y))
+        self.links_version = 0      # 방 연결이 바뀔 때마다 증가 (캐시 무효화용 - 연결 수는 그대로일 수 있다)
+        self.services = {}          # 공유 서비스 (길찾기 등) - 클래스 -> 인스턴스
+
+    # -------------------------------------------------------
+    # 방 생성
+    # -------------------------------------------------------
+    def add_room(self, name, width, height):
+        room = Room(name, width, height)
+        self.rooms[name] = room
+        self.room_entrances[name] = room.entrances
+        return room
+
+    def load_room_from_rows(self, name, rows):
+        """'#' 벽 / '.' 바닥 / 'E' 입구 / 'H' 숨는 곳 으로 된 문자열 리스트로 방 생성"""
+        height = len(rows)
+        width = max(len(row) for row in rows) if rows else 0
+        room = self.add_room(name, width, height)
+
+        for y, row in enumerate(rows):
+            for x, ch in enumerate(row):
+                self.set_tile(name, x, y, TILE_CHARS[ch])
+
+        room.walkable_index       # 로드할 때 한 번 만들어 둔다
+        return room
+
+    def load_room_from_grid(self, name, grid):
+        """타일 플래그 배열 (height, width) 로 방 생성 - 배열은 복사해서 쓴다 (mazegen 등)"""
+        grid = np.asarray(grid, dtype=np.uint8)
+        height, width = grid.shape
+        room = Room(name, width, height, tiles=bytearray(grid.tobytes()))
+        ys, xs = np.nonzero(grid & FLAG_ENTRANCE)
+        room.entrances.update(zip(xs.tolist(), ys.tolist()))
+        self.rooms[name] = room
+        self.room_entrances[name] = room.entrances
+
+        room.walkable_index
+        return room
+
+    def load_room_file(self, path):
+        """.room 파일 (map_format) 을 np.memmap 으로 열어 방 생성 - 타일은 파일 메모리를 그대로 쓴다
+
+        copy-on-write 매핑이라 set_tile 로 바꿔도 파일은 그대로. 방 연결도 같이 등록한다.
+        """
+        from modules.map_format import RoomFile    # map_format 이 이 모듈의 상수를 쓰므로 여기서 import
+
+        data = RoomFile(path)
+        # memoryview 로 감싸야 tiles[i] 가 NumPy 스칼라가 아닌 int (bytearray 와 같은 속도)
+        room = Room(data.name, data.width, data.height, tiles=memoryview(data.tiles))
+        room.entrances.update(zip(data.entrances["x"].tolist(), data.entrances["y"].tolist()))
+        self.rooms[room.name] = room
+        self.room_entrances[room.name] = room.entrances
+
+        for pos, to_room, to_pos in data.link_list():
+            self.link_entrances(room.name, pos, to_room, to_pos, both_ways=False)
+        return room
+
+    def load_level(self, source_path, cache_dir=None):
+        """텍스트(.txt) / CSV(.csv) 레이아웃을 .room 으로 변환(내용 해시 캐시)해서 전부 로드 -> 방 리스트"""
+        from modules.map_format import cached_level
+
+        return [self.load_room_file(path) for path in cached_level(source_path, cache_dir)]
+
+    def set_tile(self, name, x, y, flags):
+        room = self.rooms[name]
+        room.tiles[y * room.width + x] = flags
+        room.version += 1
+
+        if flags & FLAG_ENTRANCE:
+            room.entrances.add((x, y))
+        else:
+            room.entrances.discard((x, y))
+
+    def shared(self, service_cls):
+        """맵 하나당 하나씩만 만드는 공유 서비스 (몬스터들이 같은 캐시를 쓰도록)"""
+        service = self.services.get(service_cls)
+        if service is None:
+            service = self.services[service_cls] = service_cls(self)
+        return service
+
+    # -------------------------------------------------------
+    # 타일 조회 (몬스터가 매 프레임 여러 번 호출)
+    # -------------------------------------------------------
+    def is_walkable(self, x, y, map_name):
+        room = self.rooms[map_name]
+        if 0 <= x < room.width and 0 <= y < room.height:
+            return not room.tiles[y * room.width + x] & FLAG_WALL
+        return False
+
+    def is_entrance(self, x, y, map_name):
+        room = self.rooms[map_name]
+        if 0 <= x < room.width and 0 <= y < room.height:
+            return bool(room.tiles[y * room.width + x] & FLAG_ENTRANCE)
+        return False
+
+    def random_walkable_tile(self, map_name, rng=random, region=None):
+        """입구가 아닌 걸을 수 있는 타일 하나를 균등하게 고른다 (없으면 None)
+
+        region = (x0, y0, x1, y1) 을 주면 그 사각형 안 (x1, y1 미포함) 에서만 고른다
+        """
+        room = self.rooms[map_name]
+        index = room.walkable_index
+
+        if region is not None:
+            x0, y0, x1, y1 = region
+            xs = index % room.width
+            ys = index // room.width
+            index = index[(xs >= x0) & (xs < x1) & (ys >= y0) & (ys < y1)]
+
+        if len(index) == 0:
+            return None
+
+        i = int(index[rng.randrange(len(index))])
+        return i % room.width, i // room.width
+
+    def wall_rects(self, map_name, tile_size=TILE_SIZE):
+        """벽 타일을 가로줄 단위로 합친 픽셀 Rect 리스트 (플레이어 충돌용)"""
+        room = self.rooms[map_name]
+        rects = []
+        for y in range(room.height):
+            row = (room.grid[y] & FLAG_WALL) != 0
+            # 벽 구간의 시작/끝 찾기 (앞뒤에 False 를 붙여 경계 검출)
+            edges = np.flatnonzero(np.diff(np.concatenate(([False], row, [False])).astype(np.int8)))
+            for start, end in zip(edges[::2], edges[1::2]):
+                rects.append(pygame.Rect(int(start) * tile_size, y * tile_size,
+                                         int(end - start) * tile_size, tile_size))
+        return rects
+
+    # -------------------------------------------------------
+    # 방 연결 / 이동
+    # -------------------------------------------------------
+    def link_entrances(self, room_a, pos_a, room_b, pos_b, both_ways=True):
+        """room_a 의 입구 pos_a 를 room_b 의 입구 pos_b 와 연결"""
+        self.room_links[(room_a, tuple(pos_a))] = (room_b, tuple(pos_b))
+        if both_ways:
+            self.room_links[(room_b, tuple(pos_b))] = (room_a, tuple(pos_a))
+        self.links_version += 1
+
+    def move_to_room(self, tile_pos, map_name):
+        """입구 tile_pos 를 통해 이동 -> (새 방 이름, x, y)
+
+        도착 좌표는 연결된 입구 바로 옆의 걸을 수 있는 타일
+        (입구 위에 내려주면 바로 다시 WAIT 에 들어가 되돌아가기 때문)
+        연결이 없는 입구면 같은 방 안쪽 타일로 돌려보낸다
+        """
+        new_map, (x, y) = self.room_links.get((map_name, tuple(tile_pos)), (map_name, tuple(tile_pos)))
+        arrival = self.arrival_tile(new_map, x, y)
+        return new_map, arrival[0], arrival[1]
+
+    def arrival_tile(self, map_name, x, y):
+        """입구 (x, y) 옆에서 입구가 아닌 걸을 수 있는 첫 타일"""
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if self.is_walkable(nx, ny, map_name) and not self.is_entrance(nx, ny, map_name):
+                return nx, ny
+        return x, y
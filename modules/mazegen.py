@@ -0,0 +1,141 @@
+# modules/mazegen.py
+#
+# 시드 고정 미로 생성기 - MapManager 타일 그리드 (uint8, (height, width)) 를 바로 만든다
+#
+#   칸(cell) = 홀수 좌표 타일 (2c+1, 2r+1), 칸 사이 타일이 벽 또는 통로
+#   1. Sidewinder 로 완전 미로 (모든 칸이 한 덩어리) - 행 전체를 NumPy 로 한 번에
+#   2. 방 (직사각형으로 칸 여러 개를 통째로 판다)
+#   3. 고리 (남은 칸 사이 벽을 조금 허문다 - 도망칠 길이 하나뿐이지 않게)
+#   4. 테두리 입구, 막다른 곳 일부를 숨는 곳으로
+# 칸마다 파이썬 재귀 / 반복이 없어서 1000x1000 도 수십 ms.
+# 같은 (width, height, seed, 설정) 이면 같은 그리드 - 결과는 메모해 두고 읽기 전용으로 돌려준다 (seed=None 은 매번 새로).
+
+import functools
+
+import numpy as np
+
+from modules.map_manager import FLAG_WALL, FLAG_ENTRANCE, FLAG_HIDE
+
+EAST_CHANCE = 0.5         # Sidewinder 에서 오른쪽으로 이어 갈 확률 (클수록 가로 복도가 길다)
+ROOM_CELLS = 150          # 방 하나당 칸 수 (rooms=None 이면 칸 수 / 이 값 만큼 방을 판다)
+ROOM_SIZE = (2, 5)        # 방 한 변 칸 수 (최소, 최대)
+LOOP_RATIO = 0.05         # 남은 칸 사이 벽을 허무는 비율
+HIDE_RATIO = 0.5          # 막다른 곳 중 숨는 곳으로 만드는 비율
+ENTRANCES = 2             # 테두리 입구 수
+MAZE_CACHE_SIZE = 16      # 메모해 둘 그리드 수 (1000x1000 = 1MB)
+
+
+def _sidewinder(rng, rows, cols):
+    """-> (east, north) bool 배열 (rows, cols) - 칸에서 오른쪽 / 위쪽으로 뚫린 통로
+
+    행마다 오른쪽으로 이어진 구간(run) 을 만들고, 구간마다 칸 하나에서 위로 뚫는다.
+    구간은 행 끝에서 반드시 끊기므로 평탄 배열에서 연속 구간으로 한 번에 처리한다.
+    """
+    east = rng.random((rows, cols)) < EAST_CHANCE
+    east[:, -1] = False
+    east[0, :-1] = True       # 첫 행은 한 줄 복도 (위로 뚫을 곳이 없다)
+
+    ends = ~east.reshape(-1)                              # 구간이 끝나는 칸
+    starts = np.flatnonzero(np.concatenate(([True], ends[:-1])))
+    lengths = np.diff(np.append(starts, ends.size))
+    chosen = starts + (rng.random(starts.size) * lengths).astype(np.int64)
+
+    north = np.zeros(rows * cols, dtype=bool)
+    north[chosen] = True
+    north = north.reshape(rows, cols)
+    north[0] = False
+    return east, north
+
+
+def _carve_rooms(rng, grid, rows, cols, count):
+    lo, hi = ROOM_SIZE
+    hs = rng.integers(lo, hi + 1, count)
+    ws = rng.integers(lo, hi + 1, count)
+    r0s = (rng.random(count) * np.maximum(rows - hs + 1, 1)).astype(np.int64)
+    c0s = (rng.random(count) * np.maximum(cols - ws + 1, 1)).astype(np.int64)
+    for r0, c0, h, w in zip(r0s.tolist(), c0s.tolist(), hs.tolist(), ws.tolist()):
+        grid[2 * r0 + 1:2 * min(r0 + h, rows), 2 * c0 + 1:2 * min(c0 + w, cols)] = 0
+
+
+def _place_entrances(rng, grid, rows, cols, count):
+    """테두리에서 칸 바로 옆 타일 count 개를 입구로 (짝수 크기라 남는 벽 줄이 있으면 같이 뚫는다)"""
+    height, width = grid.shape
+    sides = ([(0, 2 * r + 1) for r in range(rows)] + [(width - 1, 2 * r + 1) for r in range(rows)] +
+             [(2 * c + 1, 0) for c in range(cols)] + [(2 * c + 1, height - 1) for c in range(cols)])
+    picks = rng.choice(len(sides), size=min(count, len(sides)), replace=False)
+    for i in picks.tolist():
+        x, y = sides[i]
+        if x == width - 1:
+            grid[y, 2 * cols:x] = 0
+        if y == height - 1:
+            grid[2 * rows:y, x] = 0
+        grid[y, x] = FLAG_ENTRANCE
+
+
+def _mark_hides(rng, grid, ratio):
+    """막다른 곳 (바닥인데 상하좌우 중 셋이 벽) 중 ratio 만큼 숨는 곳 표시"""
+    wall = np.pad((grid & FLAG_WALL) != 0, 1, constant_values=True)
+    walls_around = (wall[:-2, 1:-1].astype(np.int8) + wall[2:, 1:-1] + wall[1:-1, :-2] + wall[1:-1, 2:])
+    dead_end = (grid == 0) & (walls_around == 3)
+    grid[dead_end & (rng.random(grid.shape) < ratio)] |= FLAG_HIDE
+
+
+def generate_maze(width, height, seed, rooms=None, loop_ratio=LOOP_RATIO, hide_ratio=HIDE_RATIO,
+                  entrances=ENTRANCES):
+    """width x height 미로 타일 그리드 (uint8, (height, width), 읽기 전용 - 같은 인자면 같은 객체)
+
+    rooms = 팔 방 수 (None 이면 크기에 맞춰), loop_ratio = 칸 사이 벽을 더 허무는 비율,
+    hide_ratio = 막다른 곳 중 숨는 곳 비율, entrances = 테두리 입구 수
+    모든 바닥 / 입구 타일은 서로 이어져 있다. 짝수 크기면 오른쪽 / 아래 끝 한 줄은 벽.
+    seed=None 이면 부를 때마다 다른 미로 (메모하지 않는다).
+    """
+    if seed is None:
+        return _generate(width, height, None, rooms, loop_ratio, hide_ratio, entrances)
+    return _generate_memo(width, height, seed, rooms, loop_ratio, hide_ratio, entrances)
+
+
+def _generate(width, height, seed, rooms, loop_ratio, hide_ratio, entrances):
+    if width < 3 or height < 3:
+        raise ValueError(f"미로는 3x3 이상이어야 함: {width} x {height}")
+    rng = np.random.default_rng(seed)
+    rows, cols = (height - 1) // 2, (width - 1) // 2
+
+    grid = np.full((height, width), FLAG_WALL, dtype=np.uint8)
+    east, north = _sidewinder(rng, rows, cols)
+    grid[1:2 * rows:2, 1:2 * cols:2] = 0
+    grid[1:2 * rows:2, 2:2 * cols - 1:2][east[:, :-1]] = 0
+    grid[2:2 * rows - 1:2, 1:2 * cols:2][north[1:]] = 0
+
+    # Sidewinder 는 첫 행이 곧은 복도라 방향을 시드로 뒤집는다 (칸 영역은 뒤집어도 칸 좌표가 그대로)
+    body = grid[:2 * rows + 1, :2 * cols + 1]
+    if rows == cols and rng.random() < 0.5:
+        body[...] = body.T.copy()
+    if rng.random() < 0.5:
+        body[...] = body[::-1].copy()
+    if rng.random() < 0.5:
+        body[...] = body[:, ::-1].copy()
+
+    if rooms is None:
+        rooms = rows * cols // ROOM_CELLS
+    if rooms:
+        _carve_rooms(rng, grid, rows, cols, rooms)
+
+    if loop_ratio:
+        for passages in (grid[1:2 * rows:2, 2:2 * cols - 1:2], grid[2:2 * rows - 1:2, 1:2 * cols:2]):
+            passages[(passages == FLAG_WALL) & (rng.random(passages.shape) < loop_ratio)] = 0
+
+    if entrances:
+        _place_entrances(rng, grid, rows, cols, entrances)
+    if hide_ratio:
+        _mark_hides(rng, grid, hide_ratio)
+
+    grid.setflags(write=False)
+    return grid
+
+
+_generate_memo = functools.lru_cache(maxsize=MAZE_CACHE_SIZE)(_generate)
+
+
+def build_maze_room(map_manager, name, width, height, seed, **params):
+    """미로를 만들어 map_manager 에 방으로 넣는다 -> Room (타일은 복사본이라 set_tile 해도 메모는 그대로)"""
+    return map_manager.load_room_from_grid(name, generate_maze(width, height, seed, **params))
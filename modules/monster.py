@@ -1,17 +1,30 @@
 # modules/monster.py
 
 import math
-import random
 import pygame
 
+from modules.assets import load_frames
+from modules.dice import Dice
+from modules.events import EventBus, RoomChanged, StateChanged
+from modules.heatmap import SearchHeatmap
+from modules.map_manager import TILE_SIZE
+from modules.pathfinding import FlowFieldCache
+from modules.roomgraph import RoomGraph
+from modules.sight import SightCache, SIGHT_RANGE
+
 # 설정값
-TILE_SIZE = 32
-MAX_CHASE_TILES = 10           # 플레이어와 거리가 이 이상이면 chase 해제
+MAX_CHASE_TILES = SIGHT_RANGE  # 플레이어와 거리가 이 이상이면 chase 해제 (시야 반경과 같음)
 WAIT_DURATION = 1.5            # 방 입구 등에서 대기 시간 (초)
 SEARCH_DURATION = 10.0         # SEARCH 유지 시간 (초)
+LOST_DURATION = 2.0            # CHASE 중 플레이어를 이만큼 놓치면 SEARCH (초)
+SEARCH_DIRECTIONS = (0, math.pi/2, math.pi, 3*math.pi/2)   # SEARCH 배회 방향 (라디안, 4방향)
+MONSTER_IMAGE = "assets/images/monster_walk1.png"
+MONSTER_FRAMES = [MONSTER_IMAGE]   # 걷기 애니메이션 프레임 (왼쪽을 보는 그림, 순서대로)
+# 시작할 때 미리 불러 둘 이미지 (경로, 크기, 좌우반전) - __init__ 에서 쓰는 것과 같아야 한다
+MONSTER_ASSETS = [(path, (TILE_SIZE, TILE_SIZE), flip) for path in MONSTER_FRAMES for flip in (False, True)]
 
 class Monster(pygame.sprite.Sprite):
-    def __init__(self, speed, map_manager):
+    def __init__(self, speed, map_manager, seed=None):
         super().__init__()
 
         # 타일 좌표
@@ -19,6 +32,7 @@ class Monster(pygame.sprite.Sprite):
         self.tile_y = 0           # 몬스터 y 좌표
 
         self.speed = speed        # 몬스터 이동 속도 (픽셀/초 단위)
+        self.rng = Dice(seed)             # 몬스터마다 따로 쓰는 난수 (같은 시드면 같은 행동, 스웜과 같은 수열)
 
         self.active = False       # 스폰 여부 (True면 추적 시작)
         self.state = "NONE"       # 몬스터 행동 상태 (NONE / PATROL / CHASE / SEARCH / WAIT)
@@ -32,33 +46,29 @@ class Monster(pygame.sprite.Sprite):
         self.search_direction = None
         self.search_direction_timer = 0
 
+        self.goal_room = None     # 순찰 대신 찾아갈 방 (방 그래프로 입구를 골라 여러 방을 건넌다)
+
         # 크기
         self.width = TILE_SIZE    # 가로
         self.height = TILE_SIZE   # 세로
 
-        # 이미지 불러오기
-        try:
-            raw_image = pygame.image.load("assets/images/monster_walk1.png").convert_alpha()
-            self.image_walk1 = pygame.transform.scale(raw_image, (self.width, self.height))
-            self.image_walk2 = pygame.transform.flip(self.image_walk1, True, False)                  # 다른 이미지는 좌우반전만
-            self.image = self.image_walk1
-        except FileNotFoundError:
-            # 이미지 없으면 초록 사각형
-            self.image = pygame.Surface((self.width, self.height))
-            self.image.fill((0, 255, 0))
-            self.image_walk1 = self.image
-            self.image_walk2 = self.image
+        # 걷기 프레임 (공유 캐시 - 몬스터가 늘어도 디코딩/Surface 는 한 벌, 이미지 없으면 초록 사각형)
+        # 어느 프레임을 그릴지는 렌더러(EntityLayer)가 시간 / 이동 방향으로 고른다
+        self.frames = load_frames(MONSTER_FRAMES, (self.width, self.height), (0, 255, 0))
+        self.image = self.frames.left[0]
 
         # rect 생성
         self.rect = self.image.get_rect()
         self.rect.center = (0, 0)
-
-        # 애니메이션 (2개 이미지 번갈아가며 신호)
-        self.image_toggle = True
         
         # 외부 시스템
         self.map_manager = map_manager   # 맵
         self.current_map = "HALL"        # 초기 맵 이름 (지금은 임시)
+        self.flow_fields = map_manager.shared(FlowFieldCache)   # 추적용 흐름장 (모든 몬스터 공유)
+        self.sight = map_manager.shared(SightCache)             # 타일별 시야 (모든 몬스터 공유)
+        self.room_graph = map_manager.shared(RoomGraph)         # 방 사이 길찾기 (모든 몬스터 공유)
+        self.events = map_manager.shared(EventBus)              # 상태 전이 / 방 이동 알림
+        self.search_map = map_manager.shared(SearchHeatmap)     # 마지막 목격 위치 확률 (모든 몬스터 공유)
 
     # spawn / despawn
     def spawn(self, tile_pos):
@@ -67,7 +77,7 @@ class Monster(pygame.sprite.Sprite):
                              self.tile_y * TILE_SIZE + TILE_SIZE // 2)
 
         self.active = True
-        self.state = "PATROL"
+        self.set_state("PATROL")
         self.target_tile = None
 
         self.lost_timer = 0
@@ -76,11 +86,17 @@ class Monster(pygame.sprite.Sprite):
 
     def despawn(self):
         self.active = False
-        self.state = "NONE"
+        self.set_state("NONE")
         self.target_tile = None
 
     # main update (매 프레임 호출)
     def update(self, player, dt):
+        """한 틱 - 상태별 갱신
+
+        SEARCH 가 따라가는 확률 지도 (search_map) 는 여기서 바꾸지 않는다 (목격 / 찾아본 타일만 쌓음).
+        지도를 틱마다 갱신하는 건 World.step 뿐 - World 없이 몬스터만 돌릴 때는
+        몬스터를 다 갱신한 뒤 search_map.update(dt) 를 직접 불러야 한다 (안 부르면 SEARCH 는 무작위 이동).
+        """
         if not self.active:
             return
 
@@ -95,18 +111,31 @@ class Monster(pygame.sprite.Sprite):
 
     # patrol state
     def update_patrol(self, player, dt):
-        # 플레이어가 괴물의 사정거리 안이고 숨은 상태가 아니라면 CHASE 모드 진입
-        if self.in_chase_range((player.tile_x, player.tile_y)) and not player.is_hiding:
-            self.state = "CHASE"
+        # 플레이어가 괴물의 시야 안이고 숨은 상태가 아니라면 CHASE 모드 진입
+        if not player.is_hiding and self.can_see_player(player):
+            self.set_state("CHASE")
             self.target_tile = (player.tile_x, player.tile_y)
+            self.search_map.observe(self.current_map, self.target_tile)
             return
+
+        # 찾아갈 방이 있으면 방 그래프가 고른 입구로 (입구를 밟으면 WAIT -> 옆 방)
+        if self.goal_room is not None:
+            if self.goal_room == self.current_map:
+                self.goal_room = None
+            else:
+                exit_tile = self.room_graph.next_exit(self.current_map, (self.tile_x, self.tile_y), self.goal_room)
+                if exit_tile is not None:
+                    step = self.room_graph.next_step(self.current_map, (self.tile_x, self.tile_y), exit_tile) or exit_tile
+                    self.move_towards((step[0] * TILE_SIZE + TILE_SIZE // 2, step[1] * TILE_SIZE + TILE_SIZE // 2), dt)
+                    return
+                self.goal_room = None     # 갈 수 없는 방
         
-        # 목표가 없으면 새 랜덤 좌표 생성
+        # 목표가 없으면 새 랜덤 좌표 생성 (맵 실제 크기 안에서)
         if self.target_tile is None:
-            self.target_tile = self.get_random_walkable_tile(max_x=100, max_y=100)
+            self.target_tile = self.get_random_walkable_tile()
 
         # 목표에 도달하면 target을 None으로
-        if self.tile_x == self.target_tile[0] and self.tile_y == self.target_tile[1]:
+        if self.target_tile is not None and self.tile_x == self.target_tile[0] and self.tile_y == self.target_tile[1]:
             self.target_tile = None
 
         # 랜덤 좌표로 이동
@@ -117,46 +146,53 @@ class Monster(pygame.sprite.Sprite):
 
     # chase state
     def update_chase(self, player, dt):
-        # 플레이어가 괴물의 사정거리 밖이면 SEARCH 모드 진입
-        if not self.in_chase_range((player.tile_x, player.tile_y)):
-            self.state = "SEARCH"
+        # 플레이어가 다른 방으로 갔거나 괴물의 사정거리 밖이면 SEARCH 모드 진입
+        if player.current_map != self.current_map or not self.in_chase_range((player.tile_x, player.tile_y)):
+            self.set_state("SEARCH")
             self.search_timer = 0
             return
         
-        # 플레이어가 숨으면 lost 증가 (사정 거리의 반 이하에서 숨으면 걸림)
+        # 플레이어가 숨거나 벽에 가려지면 lost 증가 (사정 거리의 반 이하에서 숨으면 걸림)
         dx = abs(player.tile_x - self.tile_x)
         dy = abs(player.tile_y - self.tile_y)
-        if player.is_hiding and (dx > MAX_CHASE_TILES / 2 or dy > MAX_CHASE_TILES / 2):
+        if (player.is_hiding and (dx > MAX_CHASE_TILES / 2 or dy > MAX_CHASE_TILES / 2)) or not self.can_see_player(player):
             self.lost_timer += dt
         else:
             self.lost_timer = 0
+            self.search_map.observe(self.current_map, (player.tile_x, player.tile_y))
 
         # 일정 시간 동안 플레이어를 놓치면 SEARCH 모드 진입
-        if self.lost_timer > 2.0:  # 초 단위
-            self.state = "SEARCH"
+        if self.lost_timer > LOST_DURATION:  # 초 단위
+            self.set_state("SEARCH")
             self.search_timer = 0
             return
 
         # 위의 해당 사항 없으면 추적
-        target_x = player.tile_x * TILE_SIZE + TILE_SIZE // 2
-        target_y = player.tile_y * TILE_SIZE + TILE_SIZE // 2
+        # 흐름장에서 다음 칸을 읽어 벽을 돌아간다 (경로가 없으면 플레이어 쪽으로 직진)
+        step = self.flow_fields.next_step(self.current_map, (self.tile_x, self.tile_y), (player.tile_x, player.tile_y))
+        if step is None:
+            step = (player.tile_x, player.tile_y)
+
+        target_x = step[0] * TILE_SIZE + TILE_SIZE // 2
+        target_y = step[1] * TILE_SIZE + TILE_SIZE // 2
         self.move_towards((target_x, target_y), dt)
 
     # search state
     def update_search(self, player, dt):
-        # 근처 랜덤 배회
-        self.random_move(dt)
+        # 마지막으로 본 곳에서 퍼진 확률을 따라 올라간다 (퍼지지 않은 곳이면 랜덤 배회)
+        self.search_move(dt)
 
-        # 플레이어가 숨지 않고 사정거리 안이면 CHASE
-        if self.in_chase_range((player.tile_x, player.tile_y)) and not player.is_hiding:
-            self.state = "CHASE"
+        # 플레이어가 숨지 않고 시야 안이면 CHASE
+        if not player.is_hiding and self.can_see_player(player):
+            self.set_state("CHASE")
             self.lost_timer = 0
+            self.search_map.observe(self.current_map, (player.tile_x, player.tile_y))
             return
         
         # 일정 시간 지나면 순찰(PATROL) 복귀
         self.search_timer += dt
         if self.search_timer > SEARCH_DURATION:
-            self.state = "PATROL"
+            self.set_state("PATROL")
 
     # wait state
     def update_wait(self, dt):
@@ -166,12 +202,14 @@ class Monster(pygame.sprite.Sprite):
             new_map, new_tile_x, new_tile_y = self.map_manager.move_to_room((self.tile_x, self.tile_y), self.current_map)
 
             # 새로운 좌표 받기
+            old_map = self.current_map
             self.current_map, self.tile_x, self.tile_y = new_map, new_tile_x, new_tile_y
             self.rect.center = (self.tile_x * TILE_SIZE + TILE_SIZE//2,
                                 self.tile_y * TILE_SIZE + TILE_SIZE//2)
+            self.events.emit(RoomChanged(self, old_map, new_map, (new_tile_x, new_tile_y)))
         
             # 이전 상태 복귀
-            self.state = self.prev_state
+            self.set_state(self.prev_state)
             self.prev_state = None
             self.wait_timer = 0
 
@@ -209,7 +247,22 @@ class Monster(pygame.sprite.Sprite):
             self.rect.centery = new_cy
             self.tile_y = new_tile_y
 
-    # 랜덤 배회 (Search 용)
+    # 확률 지도 따라 찾기 (Search 용) - 지금 타일은 찾아본 곳으로 지운다 (틱 끝에 반영)
+    def search_move(self, dt):
+        # 이동 전에 현재 위치가 문이면 WAIT
+        if self.is_entrance():
+            self.enter_wait_mode()
+            return
+
+        tile = (self.tile_x, self.tile_y)
+        self.search_map.searched(self.current_map, self.tile_x, self.tile_y)
+        step = self.search_map.next_step(self.current_map, tile)
+        if step is None:
+            self.random_move(dt)
+            return
+        self.move_towards((step[0] * TILE_SIZE + TILE_SIZE // 2, step[1] * TILE_SIZE + TILE_SIZE // 2), dt)
+
+    # 랜덤 배회 (Search 용, 확률 지도가 평평할 때)
     def random_move(self, dt):
         # 이동 전에 현재 위치가 문이면 WAIT
         if self.is_entrance():
@@ -219,8 +272,8 @@ class Monster(pygame.sprite.Sprite):
         # 찾는 방향이 None 이거나 정해진 시간 만큼 일정 방향 동안 찾았을 경우
         if self.search_direction is None or self.search_direction_timer <= 0:
              # 방향 재설정 및 정해진 시간 재설정 (4방향)
-            self.search_direction = random.choice([0, math.pi/2, math.pi, 3*math.pi/2])
-            self.search_direction_timer = random.uniform(3.0, 4.0)
+            self.search_direction = self.rng.choice(SEARCH_DIRECTIONS)
+            self.search_direction_timer = self.rng.uniform(3.0, 4.0)
         
         dx = math.cos(self.search_direction) * self.speed * dt
         dy = math.sin(self.search_direction) * self.speed * dt
@@ -266,26 +319,39 @@ class Monster(pygame.sprite.Sprite):
             abs(py - self.tile_y) <= MAX_CHASE_TILES
         )
     
+    # 시야 체크 (같은 방 + 사정거리 안 + 벽에 가리지 않음, 타일별 시야는 캐시에서)
+    def can_see_player(self, player):
+        if player.current_map != self.current_map:
+            return False
+        player_tile = (player.tile_x, player.tile_y)
+        return self.in_chase_range(player_tile) and self.sight.can_see(self.current_map, (self.tile_x, self.tile_y), player_tile)
+
     # WAIT 모드 진입
     def enter_wait_mode(self):
         self.prev_state = self.state
-        self.state = "WAIT"
+        self.set_state("WAIT")
         self.wait_timer = 0
 
+    # 상태 바꾸기 (바뀌면 이벤트 버스로 알린다 - 읽기는 그냥 self.state)
+    def set_state(self, state):
+        if state != self.state and self.events.active:
+            self.events.emit(StateChanged(self, self.state, state, self.current_map))
+        self.state = state
+
     # 방 입구 체크
     def is_entrance(self, x=None, y=None):
         check_x = self.tile_x if x is None else x
         check_y = self.tile_y if y is None else y
-        return (check_x, check_y) in self.map_manager.room_entrances[self.current_map]
+        return self.map_manager.is_entrance(check_x, check_y, self.current_map)
     
     # 플레이어와 충돌 체크
     def is_colliding(self, player):
         return self.rect.colliderect(player.rect)
     
-    # patrol 모드에서 랜덤 target 타일 좌표 생성
-    def get_random_walkable_tile(self, max_x=100, max_y=100):
-        while True:
-            x = random.randint(0, max_x-1)
-            y = random.randint(0, max_y-1)
-            if self.map_manager.is_walkable(x, y, self.current_map) and (x, y) not in self.map_manager.room_entrances[self.current_map]:
-                return x, y
+    # patrol 모드에서 랜덤 target 타일 좌표 생성 (걸을 수 있는 타일이 없으면 None)
+    def get_random_walkable_tile(self, max_x=None, max_y=None):
+        region = None
+        if max_x is not None or max_y is not None:
+            room = self.map_manager.rooms[self.current_map]
+            region = (0, 0, room.width if max_x is None else max_x, room.height if max_y is None else max_y)
+        return self.map_manager.random_walkable_tile(self.current_map, self.rng, region)
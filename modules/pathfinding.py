@@ -0,0 +1,114 @@
+# modules/pathfinding.py
+
+from array import array
+from collections import deque
+
+from modules.map_manager import FLAG_WALL, FLAG_ENTRANCE
+
+# 흐름장(flow field)에서 지나갈 수 없는 타일 (입구를 밟으면 방을 나가버리므로 막음)
+BLOCKED = FLAG_WALL | FLAG_ENTRANCE
+
+
+class FlowField:
+    """방 하나에서 목표 타일까지의 BFS 거리 지도
+
+    dist[y * width + x] = 목표까지 남은 칸 수 (-1 이면 도달 불가)
+    몬스터는 이웃 중 거리가 가장 작은 타일로 한 칸씩 내려가면 된다
+    """
+
+    def __init__(self, room, target):
+        self.room = room
+        self.target = target
+        self.version = room.version
+        self.dist = self._build()
+
+    def _build(self):
+        room = self.room
+        w = room.width
+        h = room.height
+        tiles = room.tiles
+
+        dist = array("i", [-1]) * (w * h)
+        tx, ty = self.target
+        if not room.in_bounds(tx, ty):
+            return dist
+
+        start = ty * w + tx
+        dist[start] = 0
+        queue = deque([start])
+        pop = queue.popleft
+        push = queue.append
+
+        # 4방향 BFS (한 번의 그리드 탐색)
+        while queue:
+            i = pop()
+            d = dist[i] + 1
+            x = i % w
+
+            if x > 0:
+                j = i - 1
+                if dist[j] < 0 and not tiles[j] & BLOCKED:
+                    dist[j] = d
+                    push(j)
+            if x < w - 1:
+                j = i + 1
+                if dist[j] < 0 and not tiles[j] & BLOCKED:
+                    dist[j] = d
+                    push(j)
+            if i >= w:
+                j = i - w
+                if dist[j] < 0 and not tiles[j] & BLOCKED:
+                    dist[j] = d
+                    push(j)
+            if i < (h - 1) * w:
+                j = i + w
+                if dist[j] < 0 and not tiles[j] & BLOCKED:
+                    dist[j] = d
+                    push(j)
+
+        return dist
+
+    def distance(self, x, y):
+        if not self.room.in_bounds(x, y):
+            return -1
+        return self.dist[y * self.room.width + x]
+
+    def next_step(self, x, y):
+        """(x, y) 에서 목표로 가는 다음 타일 (없으면 None)"""
+        room = self.room
+        w = room.width
+        dist = self.dist
+
+        best = None
+        best_d = self.distance(x, y)
+        if best_d == 0:
+            return None     # 이미 목표 타일
+
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < w and 0 <= ny < room.height:
+                d = dist[ny * w + nx]
+                if d >= 0 and (best_d < 0 or d < best_d):
+                    best = (nx, ny)
+                    best_d = d
+        return best
+
+
+class FlowFieldCache:
+    """방마다 흐름장 하나 - 목표 타일이 바뀌거나 맵이 바뀔 때만 다시 계산
+
+    사용: map_manager.shared(FlowFieldCache)
+    """
+
+    def __init__(self, map_manager):
+        self.map_manager = map_manager
+        self.fields = {}          # 방 이름 -> FlowField
+
+    def get(self, map_name, target):
+        field = self.fields.get(map_name)
+        room = self.map_manager.rooms[map_name]
+        if field is None or field.target != target or field.version != room.version or field.room is not room:
+            field = self.fields[map_name] = FlowField(room, target)
+        return field
+
+    def next_step(self, map_name, from_tile, target):
+        return self.get(map_name, tuple(target)).next_step(from_tile[0], from_tile[1])
@@ -1,73 +1,112 @@
 import pygame
 
+from modules.assets import load_frames
+from modules.collision import WallIndex
+from modules.controls import KeyboardInput
+from modules.events import EventBus, LogSink, PlayerExhausted, PlayerHid, PlayerRecovered, PlayerRevealed
+from modules.map_manager import TILE_SIZE
+
+PLAYER_IMAGE = "assets/images/player.png"
+# 시작할 때 미리 불러 둘 이미지 (경로, 크기, 좌우반전) - __init__ 에서 쓰는 것과 같아야 한다
+PLAYER_ASSETS = [(PLAYER_IMAGE, (32, 32), False), (PLAYER_IMAGE, (32, 32), True)]
+EXHAUST_DURATION = 2.0     # 탈진 후 움직일 수 없는 시간 (초)
+
 class Player(pygame.sprite.Sprite):
-    def __init__(self, x, y):
+    def __init__(self, x, y, controls=None, events=None):
         super().__init__()
         
         # ---------------------------------------------------------
         # 1. 이미지 로드 및 미리 만들어두기
         # ---------------------------------------------------------
-        try:
-            raw_image = pygame.image.load("assets/images/player.png").convert_alpha()
-            # 32x32 크기로 조정
-            self.image_left = pygame.transform.scale(raw_image, (32, 32))
-            # 좌우 반전하여 오른쪽 이미지 생성
-            self.image_right = pygame.transform.flip(self.image_left, True, False)
-            # 기본 이미지는 왼쪽
-            self.image = self.image_left    
-        except FileNotFoundError:
-            # 이미지가 없으면 빨간 사각형
-            self.image = pygame.Surface((32, 32))
-            self.image.fill((255, 0, 0))
-            self.image_left = self.image
-            self.image_right = self.image
+        # 32x32 왼쪽 / 좌우 반전한 오른쪽 프레임 (공유 캐시, 이미지가 없으면 빨간 사각형)
+        self.frames = load_frames([PLAYER_IMAGE], (32, 32), (255, 0, 0))
+        self.image_left = self.frames.left[0]
+        self.image_right = self.frames.right[0]
+        # 기본 이미지는 왼쪽
+        self.image = self.image_left
         
         self.rect = self.image.get_rect()
         self.rect.topleft = (x, y)
+        # 실수 좌표 (dt 가 작으면 한 틱 이동량이 1픽셀 미만이라 rect 만으로는 잘려 나간다)
+        self.pos_x = float(x)
+        self.pos_y = float(y)
         
+        # 입력 장치 (기본 키보드, 헤드리스 시뮬레이션에서는 ScriptedInput)
+        self.controls = controls if controls is not None else KeyboardInput()
+        # 이벤트 버스 (숨기 / 탈진 알림, 없으면 알리지 않음)
+        self.events = events
+
         # 상태 변수
         self.is_hiding = False
+        self.current_map = "HALL"  # 지금 있는 방 (입구를 지나면 World 가 바꾼다)
+        self.light_radius = 6      # 손전등 빛 반경 (타일)
 
-        # [이동 및 스테미너 스탯]
-        self.walk_speed = 4
-        self.run_speed = 8
+        # [이동 및 스테미너 스탯] (초 단위 - 60fps 기준 걷기 4px, 달리기 8px/프레임)
+        self.walk_speed = 240      # 픽셀/초
+        self.run_speed = 480       # 픽셀/초
         self.speed = self.walk_speed
         
         self.max_stamina = 100.0
         self.current_stamina = 100.0
-        self.stamina_drain = 1.0
-        self.stamina_regen = 0.5
+        self.stamina_drain = 60.0  # 달릴 때 초당 감소량
+        self.stamina_regen = 30.0  # 쉴 때 초당 회복량
 
         # [탈진 상태 관리]
         self.is_exhausted = False  # 탈진 상태인가?
-        self.exhausted_time = 0    # 탈진이 시작된 시간
+        self.exhausted_timer = 0   # 탈진 후 지난 시간 (초)
+
+    # -------------------------------------------------------
+    # [타일 좌표] (몬스터가 추적할 때 사용)
+    # -------------------------------------------------------
+    @property
+    def tile_x(self):
+        return self.rect.centerx // TILE_SIZE
+
+    @property
+    def tile_y(self):
+        return self.rect.centery // TILE_SIZE
+
+    @property
+    def visible(self):
+        """렌더러(EntityLayer)가 그릴지 - 숨어 있으면 안 그린다"""
+        return not self.is_hiding
 
     # -------------------------------------------------------
     # [숨기/나오기 메서드]
     # -------------------------------------------------------
     def hide(self):
         self.is_hiding = True
-        print("플레이어: 숨었습니다.") 
+        self.emit(PlayerHid(self))
 
     def reveal(self):
         self.is_hiding = False
-        print("플레이어: 밖으로 나왔습니다.")
+        self.emit(PlayerRevealed(self))
+
+    def place(self, x, y):
+        """픽셀 좌표 (x, y) 로 순간 이동 (방을 옮길 때)"""
+        self.rect.topleft = (x, y)
+        self.pos_x = float(x)
+        self.pos_y = float(y)
+
+    def emit(self, event):
+        if self.events is not None:
+            self.events.emit(event)
 
     # -------------------------------------------------------
     # [메인 업데이트 루프]
     # -------------------------------------------------------
-    def update(self, walls):
+    def update(self, walls, dt):
         # 1. 키 입력 계산 (탈진 시 0 반환)
         dx, dy = self.get_input()
         
         # 2. 스테미너 및 탈진 상태 관리 (속도 결정)
-        self.manage_stamina(dx, dy)
+        self.manage_stamina(dx, dy, dt)
 
         # 3. 애니메이션 (이미지 방향 전환)
         self.animate(dx)
         
         # 4. 실제 이동 및 충돌 처리
-        self.move(dx, dy, walls)
+        self.move(dx, dy, walls, dt)
 
     # -------------------------------------------------------
     # [보조 메서드들 (Helper Methods)]
@@ -77,7 +116,7 @@ class Player(pygame.sprite.Sprite):
         if self.is_exhausted:
             return 0, 0
 
-        keys = pygame.key.get_pressed()
+        keys = self.controls.get_pressed()
         dx = 0
         dy = 0
         
@@ -88,31 +127,30 @@ class Player(pygame.sprite.Sprite):
             
         return dx, dy
 
-    def manage_stamina(self, dx, dy):
-        current_time = pygame.time.get_ticks()
-
+    def manage_stamina(self, dx, dy, dt):
         # [상황 A] 탈진 상태 (회복 대기)
         if self.is_exhausted:
             self.speed = 0 
-            # 2초(2000ms) 지났는지 확인
-            if current_time - self.exhausted_time > 2000:
+            # 2초 지났는지 확인
+            self.exhausted_timer += dt
+            if self.exhausted_timer > EXHAUST_DURATION:
                 self.is_exhausted = False      
                 self.current_stamina = 30.0    # 약간 회복 후 기상
-                print("플레이어: 체력 회복! 이동 가능.")
+                self.emit(PlayerRecovered(self))
             return 
 
         # [상황 B] 정상 상태
-        keys = pygame.key.get_pressed()
+        keys = self.controls.get_pressed()
         is_moving = (dx != 0 or dy != 0)
         
         # Shift키 + 움직임 + 스테미너 남음 -> 달리기
         if keys[pygame.K_LSHIFT] and is_moving:
             self.speed = self.run_speed
-            self.current_stamina -= self.stamina_drain
+            self.current_stamina -= self.stamina_drain * dt
         else:
             self.speed = self.walk_speed
             if self.current_stamina < self.max_stamina:
-                self.current_stamina += self.stamina_regen
+                self.current_stamina += self.stamina_regen * dt
 
         # 스테미너 범위 제한
         self.current_stamina = max(0, min(self.current_stamina, self.max_stamina))
@@ -120,8 +158,8 @@ class Player(pygame.sprite.Sprite):
         # 0이 되면 탈진 시작
         if self.current_stamina <= 0:
             self.is_exhausted = True
-            self.exhausted_time = current_time
-            print("플레이어: 탈진! 2초간 이동 불가.")
+            self.exhausted_timer = 0
+            self.emit(PlayerExhausted(self))
 
     def animate(self, dx):
         """이동 방향에 따라 이미지 교체"""
@@ -130,29 +168,37 @@ class Player(pygame.sprite.Sprite):
         elif dx > 0: 
             self.image = self.image_right
 
-    def move(self, dx, dy, walls):
+    def move(self, dx, dy, walls, dt):
         """좌표 이동 및 벽 충돌 처리"""
-        # 방향(dx,dy) * 속도(speed) = 실제 이동 거리
-        move_x = dx * self.speed
-        move_y = dy * self.speed
+        # 방향(dx,dy) * 속도(speed, 픽셀/초) * dt = 실제 이동 거리
+        move_x = dx * self.speed * dt
+        move_y = dy * self.speed * dt
 
         # X축 이동
-        self.rect.x += move_x
-        for wall in walls:
-            if self.rect.colliderect(wall):
-                if move_x > 0:
-                    self.rect.right = wall.left
-                elif move_x < 0:
-                    self.rect.left = wall.right
+        self.pos_x += move_x
+        self.rect.x = self.pos_x
+        for wall in self.hit_walls(walls):
+            if move_x > 0:
+                self.rect.right = wall.left
+            elif move_x < 0:
+                self.rect.left = wall.right
+            self.pos_x = float(self.rect.x)
 
         # Y축 이동
-        self.rect.y += move_y
-        for wall in walls:
-            if self.rect.colliderect(wall):
-                if move_y > 0:
-                    self.rect.bottom = wall.top
-                elif move_y < 0:
-                    self.rect.top = wall.bottom
+        self.pos_y += move_y
+        self.rect.y = self.pos_y
+        for wall in self.hit_walls(walls):
+            if move_y > 0:
+                self.rect.bottom = wall.top
+            elif move_y < 0:
+                self.rect.top = wall.bottom
+            self.pos_y = float(self.rect.y)
+
+    def hit_walls(self, walls):
+        """현재 rect 와 겹치는 벽들 (WallIndex 면 주변 칸만 검사, 리스트면 전부 검사)"""
+        if isinstance(walls, WallIndex):
+            return walls.colliding(self.rect)
+        return (wall for wall in walls if self.rect.colliderect(wall))
 
     def draw(self, screen, camera_offset):
         """카메라 위치를 반영하여 그리기"""
@@ -192,9 +238,12 @@ if __name__ == "__main__":
         pygame.Rect(0, 0, 10, WORLD_HEIGHT),  # 왼쪽
         pygame.Rect(WORLD_WIDTH-10, 0, 10, WORLD_HEIGHT)  # 오른쪽
     ]
+    wall_index = WallIndex(walls)   # 충돌 검사용 공간 색인
 
-    # 3. 플레이어 생성 (중앙 쯤에서 시작)
-    player = Player(400, 300)
+    # 3. 플레이어 생성 (중앙 쯤에서 시작) - 숨기 / 탈진 알림은 이벤트 버스 -> 콘솔 로그
+    events = EventBus()
+    event_log = LogSink().attach(events)
+    player = Player(400, 300, events=events)
 
     # 폰트 설정 (상태 표시용)
     font = pygame.font.SysFont(None, 24)
@@ -203,6 +252,7 @@ if __name__ == "__main__":
 
     running = True
     while running:
+        dt = clock.tick(60) / 1000   # 초 단위
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
@@ -219,7 +269,8 @@ if __name__ == "__main__":
         # (1) 업데이트
         # ---------------------------------------
         # 플레이어 업데이트 (벽 정보 전달)
-        player.update(walls)
+        player.update(wall_index, dt)
+        events.dispatch()
 
         # ---------------------------------------
         # (2) 카메라 계산 (플레이어 중심)
@@ -265,6 +316,6 @@ if __name__ == "__main__":
         screen.blit(text_surf, (10, 40))
 
         pygame.display.flip()
-        clock.tick(60)
 
+    event_log.close()
     pygame.quit()
\ No newline at end of file
@@ -0,0 +1,235 @@
+# modules/profiler.py
+
+import csv
+import json
+import time
+
+import numpy as np
+import pygame
+
+RING_SIZE = 1024          # 구간마다 보관할 최근 샘플 수
+PERCENTILES = (50, 95, 99)
+
+OVERLAY_COLOR = (255, 255, 0)
+OVERLAY_BACKGROUND = (0, 0, 0, 180)
+
+
+class RingBuffer:
+    """고정 크기 float 링 버퍼 - 가득 차면 가장 오래된 샘플을 덮어쓴다"""
+
+    def __init__(self, size=RING_SIZE):
+        self.data = np.zeros(size, dtype=np.float64)
+        self.size = size
+        self.index = 0
+        self.count = 0
+
+    def add(self, value):
+        self.data[self.index] = value
+        self.index = (self.index + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+
+    def values(self):
+        if self.count < self.size:
+            return self.data[:self.count]
+        return np.roll(self.data, -self.index)
+
+    def clear(self):
+        self.index = 0
+        self.count = 0
+
+
+class _NullSection:
+    """꺼져 있을 때 section() 이 돌려주는 아무 일도 안 하는 컨텍스트"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SECTION = _NullSection()
+
+
+class _Section:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Profiler:
+    """구간별 실행 시간 수집기
+
+    - section(name): with 블록 하나를 잰다 (꺼져 있으면 빈 컨텍스트)
+    - watch(obj, {메서드 이름: 구간 이름}): 켜질 때만 그 객체의 메서드를 시간 재는 래퍼로 바꿔 끼운다.
+      꺼져 있을 때는 원래 메서드 그대로라 핫 패스(몬스터 update, 타일 조회 등)에 비용이 없다.
+
+    샘플은 호출 1번 = 1개 (ms 가 아닌 초 단위로 저장), end_frame() 마다 구간별 프레임 합계도 따로 쌓는다.
+    """
+
+    def __init__(self, ring_size=RING_SIZE):
+        self.ring_size = ring_size
+        self.enabled = False
+        self.samples = {}         # 구간 이름 -> RingBuffer (호출 1번당 시간)
+        self.frames = {}          # 구간 이름 -> RingBuffer (프레임당 합계)
+        self._frame_totals = {}   # 이번 프레임에 쌓는 중인 합계
+        self.frame_count = 0
+
+        self._watched = []        # (객체, {메서드 이름: 구간 이름})
+        self._patched = []        # (객체, 메서드 이름, 원래 인스턴스 속성 또는 None)
+
+    # -------------------------------------------------------
+    # 켜기 / 끄기
+    # -------------------------------------------------------
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        for obj, methods in self._watched:
+            self._patch(obj, methods)
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        for obj, name, original in reversed(self._patched):
+            if original is None:
+                del obj.__dict__[name]
+            else:
+                obj.__dict__[name] = original
+        self._patched = []
+
+    def toggle(self):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+        return self.enabled
+
+    def watch(self, obj, methods):
+        """obj 의 메서드들을 계측 대상으로 등록 (켜져 있으면 바로 적용)"""
+        self._watched.append((obj, methods))
+        if self.enabled:
+            self._patch(obj, methods)
+
+    def _patch(self, obj, methods):
+        for attr, section in methods.items():
+            method = getattr(obj, attr)
+            self._patched.append((obj, attr, obj.__dict__.get(attr)))
+            obj.__dict__[attr] = self._timed(method, section)
+
+    def _timed(self, method, section):
+        record = self.record
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                record(section, perf_counter() - start)
+
+        return timed
+
+    # -------------------------------------------------------
+    # 기록
+    # -------------------------------------------------------
+    def section(self, name):
+        if not self.enabled:
+            return NULL_SECTION
+        return _Section(self, name)
+
+    def record(self, name, seconds):
+        ring = self.samples.get(name)
+        if ring is None:
+            ring = self.samples[name] = RingBuffer(self.ring_size)
+            self.frames[name] = RingBuffer(self.ring_size)
+        ring.add(seconds)
+        self._frame_totals[name] = self._frame_totals.get(name, 0.0) + seconds
+
+    def end_frame(self):
+        """프레임(틱) 하나가 끝날 때 호출 - 이번 프레임 구간별 합계를 쌓는다"""
+        if not self.enabled:
+            return
+        totals = self._frame_totals
+        for name, ring in self.frames.items():
+            ring.add(totals.get(name, 0.0))
+        self._frame_totals = {}
+        self.frame_count += 1
+
+    def reset(self):
+        for ring in self.samples.values():
+            ring.clear()
+        for ring in self.frames.values():
+            ring.clear()
+        self._frame_totals = {}
+        self.frame_count = 0
+
+    # -------------------------------------------------------
+    # 통계 / 내보내기
+    # -------------------------------------------------------
+    def stats(self):
+        """구간 이름 -> {calls, p50, p95, p99, mean, frame_mean, frame_p95} (시간은 ms)"""
+        result = {}
+        for name in sorted(self.samples):
+            values = self.samples[name].values() * 1000
+            if len(values) == 0:
+                continue
+            row = {"calls": len(values)}
+            for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+                row[f"p{p}"] = float(v)
+            row["mean"] = float(values.mean())
+
+            frames = self.frames[name].values() * 1000
+            row["frame_mean"] = float(frames.mean()) if len(frames) else 0.0
+            row["frame_p95"] = float(np.percentile(frames, 95)) if len(frames) else 0.0
+            result[name] = row
+        return result
+
+    def export_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"frames": self.frame_count, "sections": self.stats()}, f, indent=2)
+
+    def export_csv(self, path):
+        columns = ["calls"] + [f"p{p}" for p in PERCENTILES] + ["mean", "frame_mean", "frame_p95"]
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["section"] + columns)
+            for name, row in self.stats().items():
+                writer.writerow([name] + [row[c] for c in columns])
+
+    def export(self, path):
+        """확장자로 형식 결정 (.csv 아니면 JSON)"""
+        if path.lower().endswith(".csv"):
+            self.export_csv(path)
+        else:
+            self.export_json(path)
+
+
+# 게임 전체가 같이 쓰는 기본 프로파일러
+PROFILER = Profiler()
+
+
+def draw_overlay(screen, profiler, font, pos=(10, 10)):
+    """구간별 p50/p95/p99 (ms) 와 프레임당 평균 합계를 화면에 표시"""
+    header = f"{'section':<24}{'p50':>8}{'p95':>8}{'p99':>8}{'/frame':>9}"
+    lines = [header]
+    for name, row in profiler.stats().items():
+        lines.append(f"{name:<24}{row['p50']:>8.3f}{row['p95']:>8.3f}{row['p99']:>8.3f}{row['frame_mean']:>9.3f}")
+
+    line_height = font.get_linesize()
+    width = max(font.size(line)[0] for line in lines) + 10
+    panel = pygame.Surface((width, line_height * len(lines) + 10), pygame.SRCALPHA)
+    panel.fill(OVERLAY_BACKGROUND)
+    for i, line in enumerate(lines):
+        panel.blit(font.render(line, True, OVERLAY_COLOR), (5, 5 + i * line_height))
+    return screen.blit(panel, pos)
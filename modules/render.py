@@ -0,0 +1,239 @@
+# modules/render.py
+
+import numpy as np
+import pygame
+
+from modules.map_manager import TILE_SIZE, FLAG_WALL
+
+CHUNK_TILES = 8                  # 청크 한 변의 타일 수 (8 x 32px = 256px)
+BACKGROUND_COLOR = (0, 0, 0)     # 바닥 / 맵 바깥
+WALL_COLOR = (150, 150, 150)
+
+
+class TileMapRenderer:
+    """방을 고정 크기 청크 Surface 로 미리 그려 두고 카메라에 보이는 청크만 blit
+
+    한 프레임 = begin() -> blit() 여러 번 -> present()
+    카메라가 움직였거나 방이 바뀐 프레임은 화면 전체를 다시 그리고 display.flip(),
+    카메라가 그대로면 지난 프레임에 스프라이트가 있던 자리만 배경으로 지우고
+    바뀐 사각형만 display.update() 한다.
+    """
+
+    def __init__(self, map_manager, tile_size=TILE_SIZE, chunk_tiles=CHUNK_TILES):
+        self.map_manager = map_manager
+        self.tile_size = tile_size
+        self.chunk_tiles = chunk_tiles
+        self.chunk_px = tile_size * chunk_tiles
+
+        self.chunks = {}          # 방 이름 -> {(청크 x, 청크 y): Surface}
+        self.versions = {}        # 방 이름 -> 청크를 그릴 때의 room.version
+
+        # 프레임 상태
+        self.screen = None
+        self.map_name = None
+        self.camera_offset = None
+        self.full_redraw = True
+        self.drawn = []           # 이번 프레임에 스프라이트를 그린 화면 사각형
+        self.dirty = []           # display.update 에 넘길 사각형
+
+    # -------------------------------------------------------
+    # 청크 (한 번 그려서 재사용)
+    # -------------------------------------------------------
+    def chunk(self, map_name, cx, cy):
+        room = self.map_manager.rooms[map_name]
+        if self.versions.get(map_name) != room.version:
+            self.chunks[map_name] = {}
+            self.versions[map_name] = room.version
+
+        chunks = self.chunks[map_name]
+        surface = chunks.get((cx, cy))
+        if surface is None:
+            surface = chunks[(cx, cy)] = self._render_chunk(room, cx, cy)
+        return surface
+
+    def _render_chunk(self, room, cx, cy):
+        size = self.tile_size
+        surface = pygame.Surface((self.chunk_px, self.chunk_px))
+        surface.fill(BACKGROUND_COLOR)
+
+        x0 = cx * self.chunk_tiles
+        y0 = cy * self.chunk_tiles
+        block = room.grid[y0:y0 + self.chunk_tiles, x0:x0 + self.chunk_tiles]
+        for ty, tx in zip(*np.nonzero(block & FLAG_WALL)):
+            surface.fill(WALL_COLOR, (int(tx) * size, int(ty) * size, size, size))
+        return surface
+
+    def warm(self, map_name):
+        """방의 모든 청크를 하나씩 미리 그린다 (로딩 화면용 제너레이터, 진행도 0 ~ 1 을 yield)"""
+        room = self.map_manager.rooms[map_name]
+        cols = -(-room.width // self.chunk_tiles)
+        rows = -(-room.height // self.chunk_tiles)
+        total = cols * rows
+        for i in range(total):
+            self.chunk(map_name, i % cols, i // cols)
+            yield (i + 1) / total
+
+    def visible_chunks(self, map_name, camera_offset, view_size):
+        """화면에 걸치는 (청크 x, 청크 y) 들 (맵 밖 청크는 제외)"""
+        room = self.map_manager.rooms[map_name]
+        px = self.chunk_px
+        ox, oy = camera_offset
+        w, h = view_size
+
+        cols = -(-room.width // self.chunk_tiles)
+        rows = -(-room.height // self.chunk_tiles)
+        x0 = max(0, ox // px)
+        y0 = max(0, oy // px)
+        x1 = min(cols - 1, (ox + w - 1) // px)
+        y1 = min(rows - 1, (oy + h - 1) // px)
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                yield cx, cy
+
+    def draw_map(self, screen, map_name, camera_offset, clip=None):
+        """보이는 청크만 blit (clip 을 주면 그 화면 사각형 안만)"""
+        ox, oy = camera_offset
+        px = self.chunk_px
+        if clip is not None:
+            screen.set_clip(clip)
+            area = clip.move(ox, oy)
+            chunks = self.visible_chunks(map_name, area.topleft, area.size)
+        else:
+            chunks = self.visible_chunks(map_name, camera_offset, screen.get_size())
+
+        for cx, cy in chunks:
+            screen.blit(self.chunk(map_name, cx, cy), (cx * px - ox, cy * px - oy))
+
+        if clip is not None:
+            screen.set_clip(None)
+
+    # -------------------------------------------------------
+    # 프레임
+    # -------------------------------------------------------
+    def begin(self, screen, map_name, camera_offset, full=False):
+        """full=True 면 카메라가 그대로여도 전체를 다시 그린다 (화면 전체에 조명을 입힐 때 등)"""
+        camera_offset = (int(camera_offset[0]), int(camera_offset[1]))
+        self.full_redraw = (full or screen is not self.screen or map_name != self.map_name or
+                            camera_offset != self.camera_offset)
+
+        if self.full_redraw:
+            screen.fill(BACKGROUND_COLOR)
+            self.draw_map(screen, map_name, camera_offset)
+            self.dirty = []
+        else:
+            # 지난 프레임 스프라이트 자리를 배경으로 되돌린다
+            for rect in self.drawn:
+                screen.fill(BACKGROUND_COLOR, rect)
+                self.draw_map(screen, map_name, camera_offset, clip=rect)
+            self.dirty = list(self.drawn)
+
+        self.screen = screen
+        self.map_name = map_name
+        self.camera_offset = camera_offset
+        self.drawn = []
+
+    def blit(self, image, world_rect):
+        """월드 좌표 rect 위치에 image 를 그리고 dirty 에 기록"""
+        rect = world_rect.move(-self.camera_offset[0], -self.camera_offset[1])
+        rect = self.screen.blit(image, rect)
+        if rect.width and rect.height:
+            self.drawn.append(rect)
+            self.dirty.append(rect)
+        return rect
+
+    def blits(self, sequence):
+        """[(image, 월드 좌표 rect)] 를 Surface.blits() 한 번으로 그리고 dirty 에 기록"""
+        ox, oy = self.camera_offset
+        rects = self.screen.blits([(image, (rect.x - ox, rect.y - oy)) for image, rect in sequence])
+        for rect in rects:
+            if rect.width and rect.height:
+                self.drawn.append(rect)
+                self.dirty.append(rect)
+        return rects
+
+    def mark(self, screen_rect):
+        """스프라이트가 아닌 것(UI 등)을 화면 좌표 screen_rect 에 그렸을 때 dirty 에 기록"""
+        rect = pygame.Rect(screen_rect)
+        self.drawn.append(rect)
+        self.dirty.append(rect)
+
+    def present(self):
+        if self.full_redraw:
+            pygame.display.flip()
+        elif self.dirty:
+            pygame.display.update(self.dirty)
+
+
+class EntityLayer:
+    """움직이는 엔티티 그리기 - 카메라에 보이는 것만 골라 TileMapRenderer.blits() 한 번
+
+    스프라이트는 pygame.sprite.LayeredUpdates 에 층(layer) 과 함께 넣는다 (층이 높을수록 위, 같은 층은 아래쪽이 위).
+    indexed=True 로 넣은 스프라이트는 EntityIndex 에 화면 타일 범위를 물어서 후보만 보므로
+    화면 밖 몬스터가 아무리 많아도 그리는 비용은 화면 안 몬스터 수만큼이다.
+    나머지(플레이어 등) 는 매 프레임 rect 로 직접 컬링한다.
+
+    스프라이트 속성: rect, frames (SpriteFrames, 없으면 image), visible (없으면 True),
+    current_map (없으면 지금 그리는 방에 있다고 본다)
+    프레임은 시간으로 고르고, 방향은 그린 위치가 움직인 쪽 (멈추면 마지막 방향 + 첫 프레임).
+    """
+
+    def __init__(self, index=None, margin_tiles=2):
+        self.group = pygame.sprite.LayeredUpdates()
+        self.index = index
+        self.margin_tiles = margin_tiles      # 색인 타일은 rect 보다 한두 칸 어긋날 수 있다 (보간 / 타일 경계)
+        self.loose = []           # 색인에 없는 스프라이트
+        self.facing = {}          # 스프라이트 -> (마지막으로 그린 x, 오른쪽을 보는가)
+        self.drawn_count = 0      # 지난 draw() 에서 그린 수
+
+    def add(self, sprite, layer=0, indexed=False):
+        self.group.add(sprite, layer=layer)
+        if not indexed:
+            self.loose.append(sprite)
+
+    def remove(self, sprite):
+        self.group.remove(sprite)
+        if sprite in self.loose:
+            self.loose.remove(sprite)
+        self.facing.pop(sprite, None)
+
+    def candidates(self, map_name, view):
+        """view (월드 픽셀 Rect) 근처에 있을 수 있는 스프라이트"""
+        if self.index is None:
+            return self.group.sprites()
+        margin = self.margin_tiles
+        found = self.index.in_area(map_name, view.left // TILE_SIZE - margin, view.top // TILE_SIZE - margin,
+                                   (view.right - 1) // TILE_SIZE + margin, (view.bottom - 1) // TILE_SIZE + margin)
+        group = self.group
+        return [sprite for sprite in found if sprite in group] + self.loose
+
+    def draw(self, renderer, map_name, now, rect_of=None):
+        """renderer 의 이번 프레임에 보이는 스프라이트를 그린다 -> 그린 수
+
+        now = 애니메이션 시각 (초), rect_of(sprite) = 그릴 월드 rect (기본 sprite.rect, 보간할 때 주기)
+        """
+        view = pygame.Rect(renderer.camera_offset, renderer.screen.get_size())
+        layer_of = self.group.get_layer_of_sprite
+        facing = self.facing
+
+        visible = []
+        for sprite in self.candidates(map_name, view):
+            if not getattr(sprite, "visible", True) or getattr(sprite, "current_map", map_name) != map_name:
+                continue
+            rect = sprite.rect if rect_of is None else rect_of(sprite)
+            if view.colliderect(rect):
+                visible.append((layer_of(sprite), rect.bottom, rect.x, id(sprite), sprite, rect))
+        visible.sort()
+
+        sequence = []
+        for _, _, x, _, sprite, rect in visible:
+            last_x, right = facing.get(sprite, (x, False))
+            moving = x != last_x
+            if moving:
+                right = x > last_x
+            facing[sprite] = (x, right)
+            frames = getattr(sprite, "frames", None)
+            sequence.append((sprite.image if frames is None else frames.frame(now, right, moving), rect))
+
+        renderer.blits(sequence)
+        self.drawn_count = len(sequence)
+        return self.drawn_count
@@ -0,0 +1,153 @@
+# modules/roomgraph.py
+
+import numpy as np
+
+from modules.pathfinding import FlowField
+
+LINK_COST = 1             # 연결된 입구를 건너가는 비용 (타일 수로 셈)
+UNREACHABLE = np.inf
+
+
+class RoomGraph:
+    """방 그래프 - 여러 방을 건너 목표 방으로 가는 길 (런타임 그리드 탐색 없음)
+
+    노드 = 방 연결(room_links)에 나오는 입구 (방 이름, (x, y))
+    맵이 로드되거나 타일 / 연결이 바뀐 뒤 (room.version, links_version) 처음 물을 때 한 번만 만든다:
+      - 입구마다 흐름장 (방 안 어느 타일에서든 그 입구까지 거리 / 다음 칸)
+      - 같은 방 입구끼리 거리 + 연결 비용으로 Floyd-Warshall 전쌍 거리
+      - via_exit[입구, 방] = 그 입구로 나가서 목표 방에 닿기까지 남은 거리
+    질의는 현재 방의 출구 수만큼만 본다.
+
+    사용: map_manager.shared(RoomGraph)
+    """
+
+    def __init__(self, map_manager):
+        self.map_manager = map_manager
+        self.key = None
+
+    # -------------------------------------------------------
+    # 만들기
+    # -------------------------------------------------------
+    def _ensure(self):
+        mm = self.map_manager
+        key = (mm.links_version, tuple((name, id(room), room.version) for name, room in mm.rooms.items()))
+        if key != self.key:
+            self._build()
+            self.key = key
+
+    def _build(self):
+        mm = self.map_manager
+        links = mm.room_links
+
+        self.nodes = sorted(set(links) | set(links.values()))
+        self.node_index = {node: i for i, node in enumerate(self.nodes)}
+        self.room_names = sorted(mm.rooms)
+        self.room_index = {name: r for r, name in enumerate(self.room_names)}
+
+        self.fields = [FlowField(mm.rooms[room], pos) for room, pos in self.nodes]
+        self.exits = {}           # 방 이름 -> 다른 곳으로 이어지는 입구 노드 번호 리스트
+        for i, node in enumerate(self.nodes):
+            if node in links:
+                self.exits.setdefault(node[0], []).append(i)
+
+        # 전쌍 거리 (노드 수가 작아서 NumPy Floyd-Warshall 로 충분)
+        n = len(self.nodes)
+        dist = np.full((n, n), UNREACHABLE)
+        np.fill_diagonal(dist, 0)
+        for i, (room, _) in enumerate(self.nodes):
+            for j, (other_room, other_pos) in enumerate(self.nodes):
+                if i != j and room == other_room:
+                    d = self._walk(self.fields[i], other_pos)
+                    if d >= 0:
+                        dist[i, j] = d
+        for src, dst in links.items():
+            i, j = self.node_index[src], self.node_index[dst]
+            dist[i, j] = min(dist[i, j], LINK_COST)
+        for k in range(n):
+            np.minimum(dist, dist[:, k, None] + dist[None, k, :], out=dist)
+        self.dist = dist
+
+        # to_room[노드, 방] = 그 노드에서 방의 아무 입구까지 최단 거리 (이미 그 방이면 0)
+        to_room = np.full((n, len(self.room_names)), UNREACHABLE)
+        for r, name in enumerate(self.room_names):
+            members = [i for i, (room, _) in enumerate(self.nodes) if room == name]
+            if members:
+                to_room[:, r] = dist[:, members].min(axis=1)
+                to_room[members, r] = 0
+        self.to_room = to_room
+
+        # via_exit[출구 노드, 방] = 그 출구를 건넌 뒤 목표 방까지 (건너는 비용 포함)
+        via_exit = np.full((n, len(self.room_names)), UNREACHABLE)
+        for src, dst in links.items():
+            via_exit[self.node_index[src]] = LINK_COST + to_room[self.node_index[dst]]
+        self.via_exit = via_exit
+
+    @staticmethod
+    def _walk(field, pos):
+        """field 목표에서 pos 까지 걸음 수 - pos 가 입구(흐름장에서 막힌 칸)면 옆 칸 + 1 (없으면 -1)"""
+        d = field.distance(*pos)
+        if d >= 0:
+            return d
+        x, y = pos
+        best = -1
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            nd = field.distance(nx, ny)
+            if nd >= 0 and (best < 0 or nd + 1 < best):
+                best = nd + 1
+        return best
+
+    # -------------------------------------------------------
+    # 질의
+    # -------------------------------------------------------
+    def _best_exit(self, map_name, tile, target_room):
+        """(출구 노드 번호, 남은 거리) - 없으면 (None, UNREACHABLE)"""
+        self._ensure()
+        r = self.room_index.get(target_room)
+        if r is None:
+            return None, UNREACHABLE
+
+        best, best_cost = None, UNREACHABLE
+        for i in self.exits.get(map_name, ()):
+            walk = self._walk(self.fields[i], tile)
+            if walk < 0:
+                continue
+            cost = walk + self.via_exit[i, r]
+            if cost < best_cost:
+                best, best_cost = i, cost
+        return best, best_cost
+
+    def next_exit(self, map_name, tile, target_room):
+        """target_room 으로 가려면 지금 방에서 향할 입구 (이미 그 방이거나 못 가면 None)"""
+        if map_name == target_room:
+            return None
+        i, _ = self._best_exit(map_name, tuple(tile), target_room)
+        return None if i is None else self.nodes[i][1]
+
+    def distance_to_room(self, map_name, tile, target_room):
+        """target_room 까지 걸음 수 (이미 그 방이면 0, 못 가면 inf)"""
+        if map_name == target_room:
+            return 0
+        return self._best_exit(map_name, tuple(tile), target_room)[1]
+
+    def walk_distance(self, map_name, tile, exit_tile):
+        """같은 방 tile 에서 입구 exit_tile 까지 걸음 수 (못 가면 -1)"""
+        self._ensure()
+        return self._walk(self.fields[self.node_index[(map_name, tuple(exit_tile))]], tuple(tile))
+
+    def next_step(self, map_name, tile, exit_tile):
+        """입구 exit_tile 로 가는 다음 타일 (흐름장, 이미 입구 위면 None)"""
+        self._ensure()
+        return self.fields[self.node_index[(map_name, tuple(exit_tile))]].next_step(tile[0], tile[1])
+
+    def route(self, map_name, tile, target_room):
+        """[(방 이름, 나갈 입구), ...] - 디버깅 / 표시용 전체 경로"""
+        path = []
+        seen = set()
+        while map_name != target_room:
+            exit_tile = self.next_exit(map_name, tile, target_room)
+            if exit_tile is None or (map_name, exit_tile) in seen:
+                return None
+            seen.add((map_name, exit_tile))
+            path.append((map_name, exit_tile))
+            map_name, tile = self.map_manager.room_links[(map_name, exit_tile)]
+        return path
@@ -0,0 +1,132 @@
+# modules/sight.py
+
+from fractions import Fraction
+from math import ceil, floor
+
+import numpy as np
+
+from modules.map_manager import FLAG_WALL
+
+SIGHT_RANGE = 10          # 시야 창 반경 (타일, 정사각형) - monster.MAX_CHASE_TILES 와 같게
+
+
+class FieldOfView:
+    """한 타일에서 보이는 타일들 (반경 radius 정사각형 창)
+
+    대칭 shadowcasting 으로 계산 - 바닥 타일끼리는 A 가 B 를 보면 B 도 A 를 본다.
+    visible[(dy + r) * size + (dx + r)] = 1 이면 origin + (dx, dy) 가 보임
+    """
+
+    def __init__(self, room, origin, radius=SIGHT_RANGE):
+        self.origin = origin
+        self.radius = radius
+        self.size = 2 * radius + 1
+        self.visible = bytearray(self.size * self.size)
+        self._compute(room)
+
+    def can_see(self, x, y):
+        dx = x - self.origin[0]
+        dy = y - self.origin[1]
+        r = self.radius
+        if -r <= dx <= r and -r <= dy <= r:
+            return self.visible[(dy + r) * self.size + (dx + r)] == 1
+        return False
+
+    def can_see_many(self, xs, ys):
+        """can_see 를 좌표 배열로 -> bool 배열"""
+        r = self.radius
+        size = self.size
+        dx = np.asarray(xs) - self.origin[0] + r
+        dy = np.asarray(ys) - self.origin[1] + r
+        inside = (dx >= 0) & (dx < size) & (dy >= 0) & (dy < size)
+        visible = np.frombuffer(self.visible, dtype=np.uint8)
+        return inside & (visible[np.where(inside, dy * size + dx, 0)] == 1)
+
+    def _compute(self, room):
+        ox, oy = self.origin
+        r = self.radius
+        size = self.size
+        width = room.width
+        tiles = room.tiles
+        visible = self.visible
+
+        def blocked(x, y):
+            # 방 밖은 벽 취급
+            if 0 <= x < width and 0 <= y < room.height:
+                return tiles[y * width + x] & FLAG_WALL != 0
+            return True
+
+        def reveal(x, y):
+            visible[(y - oy + r) * size + (x - ox + r)] = 1
+
+        reveal(ox, oy)
+
+        # 4사분면 (북 / 동 / 남 / 서) - (깊이, 옆칸) -> 맵 좌표
+        for transform in ((lambda d, c: (ox + c, oy - d)),
+                          (lambda d, c: (ox + d, oy + c)),
+                          (lambda d, c: (ox + c, oy + d)),
+                          (lambda d, c: (ox - d, oy + c))):
+            rows = [(1, Fraction(-1), Fraction(1))]
+            while rows:
+                depth, start, end = rows.pop()
+                if depth > r:
+                    continue
+
+                prev_wall = None            # 직전 칸이 벽인지 (None = 직전 칸 없음)
+                min_col = floor(depth * start + Fraction(1, 2))
+                max_col = ceil(depth * end - Fraction(1, 2))
+                for col in range(min_col, max_col + 1):
+                    x, y = transform(depth, col)
+                    wall = blocked(x, y)
+
+                    # 벽이거나 원점에서 대칭으로 보이는 바닥이면 보임
+                    if wall or depth * start <= col <= depth * end:
+                        if -r <= x - ox <= r and -r <= y - oy <= r:
+                            reveal(x, y)
+
+                    if prev_wall and not wall:
+                        start = Fraction(2 * col - 1, 2 * depth)
+                    if prev_wall is False and wall:
+                        rows.append((depth + 1, start, Fraction(2 * col - 1, 2 * depth)))
+                    prev_wall = wall
+
+                if prev_wall is False:
+                    rows.append((depth + 1, start, end))
+
+
+class SightCache:
+    """(방, 타일) 하나당 시야 하나 - 방 타일이 바뀔 때만 버리고 다시 계산
+
+    사용: map_manager.shared(SightCache)
+    """
+
+    def __init__(self, map_manager, radius=SIGHT_RANGE):
+        self.map_manager = map_manager
+        self.radius = radius
+        self.fields = {}          # 방 이름 -> {(x, y): FieldOfView}
+        self.versions = {}        # 방 이름 -> (Room, version)
+
+    def get(self, map_name, tile):
+        room = self.map_manager.rooms[map_name]
+        key = (room, room.version)
+        if self.versions.get(map_name) != key:
+            self.fields[map_name] = {}
+            self.versions[map_name] = key
+
+        fields = self.fields[map_name]
+        fov = fields.get(tile)
+        if fov is None:
+            fov = fields[tile] = FieldOfView(room, tile, self.radius)
+        return fov
+
+    def can_see(self, map_name, from_tile, to_tile):
+        """from_tile 에서 to_tile 이 보이는지 (반경 밖이면 False)"""
+        return self.get(map_name, tuple(from_tile)).can_see(to_tile[0], to_tile[1])
+
+    def visible_from(self, map_name, tile, xs, ys):
+        """tile 에서 (xs, ys) 타일들이 보이는지 (bool 배열)
+
+        바닥 타일끼리는 시야가 대칭이라 "(xs[i], ys[i]) 에서 tile 이 보이는지" 와도 같다
+        (스웜은 플레이어 타일 시야 하나로 몬스터 전원을 판정)
+        """
+        return self.get(map_name, tuple(tile)).can_see_many(xs, ys)
@@ -0,0 +1,261 @@
+# modules/simulation.py
+
+import random
+import time
+
+from modules.collision import EntityIndex, WallIndex
+from modules.events import EventBus, RoomChanged
+from modules.gameloop import interpolate_rect
+from modules.heatmap import SearchHeatmap
+from modules.lod import LodScheduler
+from modules.map_manager import MapManager, TILE_SIZE
+from modules.mazegen import build_maze_room
+from modules.monster import Monster
+from modules.pathfinding import FlowFieldCache
+from modules.sight import SightCache
+from modules.player import Player
+from modules.swarm import MonsterSwarm
+
+# 데모 맵 ('#' 벽 / '.' 바닥 / 'E' 입구)
+DEMO_ROOMS = {
+    "HALL": [
+        "#########################",
+        "#.......#...............#",
+        "#.......#.......#####...#",
+        "#..###..#.......#.......#",
+        "#..#....#####...#...#####",
+        "#..#............#.......#",
+        "#..#######..#...#####...E",
+        "#...........#...........#",
+        "#####...#####...#####...#",
+        "#.......#.......#.......#",
+        "#.......#...#####.......#",
+        "#...#####...#...........#",
+        "#...........#...#####...#",
+        "#...#.......#.......#...#",
+        "#...#####...#####...#...#",
+        "#.......#...........#...#",
+        "#.......#...#####...#...#",
+        "#...........#...........#",
+        "#########################",
+    ],
+    "CELLAR": [
+        "###############",
+        "#.............#",
+        "#..#######....#",
+        "#........#....#",
+        "#........#....#",
+        "E....#...#....#",
+        "#....#........#",
+        "#....######...#",
+        "#.............#",
+        "###############",
+    ],
+}
+DEMO_LINKS = [
+    (("HALL", (24, 6)), ("CELLAR", (0, 5))),
+]
+# 프로파일러 계측 구간 (메서드 이름 -> 구간 이름)
+PLAYER_SECTIONS = {"get_input": "player.get_input", "manage_stamina": "player.manage_stamina", "move": "player.move"}
+MONSTER_SECTIONS = {"update_patrol": "monster.PATROL", "update_chase": "monster.CHASE",
+                    "update_search": "monster.SEARCH", "update_wait": "monster.WAIT"}
+MAP_SECTIONS = {"is_walkable": "map.is_walkable", "is_entrance": "map.is_entrance",
+                "random_walkable_tile": "map.random_walkable_tile", "move_to_room": "map.move_to_room"}
+
+PLAYER_START = (1, 1)                          # 플레이어 시작 타일
+MONSTER_STARTS = [(22, 16), (10, 9), (2, 15), (22, 1)]
+
+
+class World:
+    """맵 + 플레이어 + 몬스터 묶음 - 한 틱씩 진행"""
+
+    def __init__(self, map_manager, player, monsters, player_map="HALL", swarm=None, lod=False):
+        self.map_manager = map_manager
+        self.player = player
+        self.monsters = monsters
+        self.swarm = swarm        # MonsterSwarm (몬스터가 많을 때 배열로 한 번에 갱신)
+        # 몬스터 위치 색인 (잡힘 판정 / 근처 몬스터 조회 - 타일이 바뀔 때만 버킷 이동)
+        self.monster_index = EntityIndex()
+        for monster in monsters:
+            if monster.active:
+                self.monster_index.update(monster, monster.current_map)
+        # lod=True 면 플레이어 방 밖의 몬스터는 방 그래프만 따라가는 거친 모델로 돌린다
+        self.lod = LodScheduler(map_manager, monsters, self.monster_index) if lod else None
+        self.player_map = player_map
+        # 게임 이벤트 (update 중에는 쌓기만, 프레임마다 한 번 events.dispatch())
+        self.events = map_manager.shared(EventBus)
+        # SEARCH 몬스터가 따라가는 목격 위치 확률 (틱 끝에 방마다 한 번 퍼뜨린다)
+        self.search_map = map_manager.shared(SearchHeatmap)
+
+        # 방마다 벽 색인 (플레이어 충돌용)
+        self.walls = {name: WallIndex(map_manager.wall_rects(name)) for name in map_manager.rooms}
+
+        self.tick = 0
+        self.caught_tick = None   # 처음 잡힌 틱
+        self.prev_positions = {}  # id(엔티티) -> (방 이름, rect.topleft) - 직전 틱 위치 (렌더 보간용)
+
+    def step(self, dt):
+        player = self.player
+
+        prev = self.prev_positions = {id(player): (self.player_map, player.rect.topleft)}
+        for monster in self.monsters:
+            prev[id(monster)] = (monster.current_map, monster.rect.topleft)
+
+        player.update(self.walls[self.player_map], dt)
+        player.controls.advance()
+        self._use_entrance()
+
+        monsters = self.monsters if self.lod is None else self.lod.update(self.player_map, dt)
+        index = self.monster_index
+        for monster in monsters:
+            monster.update(player, dt)
+            index.update(monster, monster.current_map)
+        if self.caught_tick is None and index.overlapping(self.player_map, player.rect, TILE_SIZE):
+            self.caught_tick = self.tick
+
+        if self.swarm is not None:
+            self.swarm.update(player, dt)
+            if self.caught_tick is None and len(self.swarm.colliding(player.rect, self.player_map)):
+                self.caught_tick = self.tick
+
+        self.search_map.update(dt)
+        self.tick += 1
+
+    @property
+    def player_map(self):
+        """플레이어가 있는 방 (= player.current_map, 몬스터 시야도 이 값으로 같은 방인지 본다)"""
+        return self.player.current_map
+
+    @player_map.setter
+    def player_map(self, map_name):
+        self.player.current_map = map_name
+
+    def _use_entrance(self):
+        """플레이어 중심이 입구 타일이면 연결된 방으로 (몬스터와 달리 WAIT 없이 바로)
+
+        도착 타일은 move_to_room 이 고른 입구 옆 바닥 - 다음 틱부터 벽 / 시야 / LOD 가 새 방 기준
+        """
+        player = self.player
+        old_map = self.player_map
+        tile = (player.tile_x, player.tile_y)
+        if not self.map_manager.is_entrance(tile[0], tile[1], old_map):
+            return
+        new_map, x, y = self.map_manager.move_to_room(tile, old_map)
+        player.place(x * TILE_SIZE, y * TILE_SIZE)
+        self.player_map = new_map
+        self.events.emit(RoomChanged(player, old_map, new_map, (x, y)))
+
+    def profile(self, profiler):
+        """플레이어 / 몬스터 상태별 / 맵 조회 메서드를 프로파일러 계측 대상으로 등록"""
+        profiler.watch(self.player, PLAYER_SECTIONS)
+        for monster in self.monsters:
+            profiler.watch(monster, MONSTER_SECTIONS)
+        if self.swarm is not None:
+            profiler.watch(self.swarm, {"update": "swarm.update"})
+        profiler.watch(self.map_manager, MAP_SECTIONS)
+        profiler.watch(self.map_manager.shared(FlowFieldCache), {"next_step": "map.flow_field"})
+        profiler.watch(self.map_manager.shared(SightCache), {"can_see": "map.sight"})
+        profiler.watch(self.search_map, {"update": "map.search_heatmap"})
+
+    def monsters_near(self, tiles, tile=None):
+        """플레이어 방에서 tile (기본: 플레이어 타일) 로부터 가로 / 세로 tiles 칸 안의 몬스터"""
+        if tile is None:
+            tile = (self.player.tile_x, self.player.tile_y)
+        return self.monster_index.within(self.player_map, tile, tiles)
+
+    def render_rect(self, entity, map_name, alpha):
+        """직전 틱과 현재 틱 사이 alpha 위치의 rect (방을 옮긴 직후면 보간 없이 현재 위치)"""
+        prev = self.prev_positions.get(id(entity))
+        return interpolate_rect(prev[1] if prev is not None and prev[0] == map_name else None, entity.rect, alpha)
+
+    def monster_states(self):
+        """상태 이름 -> 몬스터 수"""
+        states = {}
+        for monster in self.monsters:
+            states[monster.state] = states.get(monster.state, 0) + 1
+        if self.swarm is not None:
+            for name, count in self.swarm.state_counts().items():
+                states[name] = states.get(name, 0) + count
+        return states
+
+
+def build_demo_world(controls=None, monster_count=2, monster_speed=60, seed=None, swarm=False, level=None,
+                     lod=False, maze=None):
+    """데모 맵 월드 - swarm=True 면 몬스터를 Monster 객체 대신 MonsterSwarm 하나로 만든다
+
+    seed 하나에서 몬스터별 시드를 뽑으므로 같은 seed + 같은 입력이면 같은 결과
+    level = 텍스트/CSV 레이아웃 경로 (주면 데모 맵 대신 로드, 첫 방에서 시작)
+    maze = (width, height) 를 주면 seed 로 만든 미로 방 하나 (MAZE) 에서 시작
+    lod = 플레이어 방 밖의 몬스터를 거친 모델로 (swarm 과는 같이 쓰지 않는다)
+    """
+    seeds = random.Random(seed)
+
+    map_manager = MapManager()
+    if maze is not None:
+        maze_seed = seed if seed is not None else seeds.getrandbits(64)    # 같은 seed 면 같은 미로 (메모된 그리드)
+        start_map = build_maze_room(map_manager, "MAZE", maze[0], maze[1], maze_seed).name
+    elif level is None:
+        for name, rows in DEMO_ROOMS.items():
+            map_manager.load_room_from_rows(name, rows)
+        for (room_a, pos_a), (room_b, pos_b) in DEMO_LINKS:
+            map_manager.link_entrances(room_a, pos_a, room_b, pos_b)
+        start_map = "HALL"
+    else:
+        start_map = map_manager.load_level(level)[0].name
+
+    def start_tile(tile):
+        # 레벨마다 시작 좌표가 벽일 수 있으니 그때는 시드로 아무 바닥 타일
+        if map_manager.is_walkable(tile[0], tile[1], start_map) and not map_manager.is_entrance(*tile, start_map):
+            return tile
+        return map_manager.random_walkable_tile(start_map, seeds)
+
+    player_tile = start_tile(PLAYER_START)
+    player = Player(player_tile[0] * TILE_SIZE, player_tile[1] * TILE_SIZE, controls,
+                    events=map_manager.shared(EventBus))
+
+    monsters = []
+    for i in range(monster_count):
+        monster = Monster(speed=monster_speed, map_manager=map_manager, seed=seeds.getrandbits(64))
+        monster.current_map = start_map
+        monster.spawn(start_tile(MONSTER_STARTS[i % len(MONSTER_STARTS)]))
+        monsters.append(monster)
+
+    if swarm:
+        return World(map_manager, player, [], player_map=start_map,
+                     swarm=MonsterSwarm.from_monsters(monsters, map_manager))
+    return World(map_manager, player, monsters, player_map=start_map, lod=lod)
+
+
+def run_headless(world, ticks, dt, profiler=None, autosave=None):
+    """렌더링 없이 고정 dt 로 최대한 빠르게 ticks 만큼 진행 -> 결과 요약 dict
+
+    profiler 를 주면 틱마다 "tick" 구간을 재고 프레임 합계를 끊는다
+    헤드리스는 틱 = 프레임이라 이벤트도 틱마다 나눠 준다
+    autosave (snapshot.Autosaver) 는 world.tick 기준으로 틱마다 확인한다
+    """
+    events = world.events
+    start = time.perf_counter()
+    if profiler is None:
+        for _ in range(ticks):
+            world.step(dt)
+            events.dispatch()
+            if autosave is not None:
+                autosave.update(world)
+    else:
+        for _ in range(ticks):
+            with profiler.section("tick"):
+                world.step(dt)
+            events.dispatch()
+            if autosave is not None:
+                autosave.update(world)
+            profiler.end_frame()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "ticks": ticks,
+        "elapsed": elapsed,
+        "ticks_per_sec": ticks / elapsed if elapsed > 0 else float("inf"),
+        "caught_tick": world.caught_tick,
+        "monster_states": world.monster_states(),
+        "player_tile": (world.player.tile_x, world.player.tile_y),
+    }
@@ -0,0 +1,269 @@
+# modules/snapshot.py
+#
+# 월드 스냅샷 (.snap) - 플레이어 / 몬스터 상태 전부를 고정 크기 바이너리로
+#
+#   헤더       magic "HESN", version, 방 수, tick, caught_tick (-1 = 아직), 플레이어 방, 몬스터 수, 스웜 수,
+#              SEARCH 확률 창 수
+#   방 이름    NAME_SIZE 바이트씩 (방 코드 = 이 순서, 불러올 때 이름으로 맞춘다)
+#   플레이어   PLAYER_RECORD
+#   몬스터     MONSTER_RECORD x 몬스터 수
+#   스웜       SWARM_FIELDS 배열을 순서대로 [:count] 바이트 그대로
+#   확률 창    (TRACE_RECORD + float32 확률 width * height) x 창 수 (heatmap.SearchHeatmap)
+#
+# 저장은 미리 만든 bytearray 에 pack_into 만 (몇십 µs), 파일 쓰기는 Autosaver 가 백그라운드 스레드에서.
+# 맵 / 캐시는 저장하지 않는다 - 같은 레벨 / 시드로 만든 월드에 덮어쓴다.
+
+import os
+import struct
+import threading
+
+import numpy as np
+
+from modules.collision import EntityIndex
+from modules.heatmap import SearchHeatmap
+from modules.lod import LodScheduler
+from modules.map_format import NAME_SIZE
+from modules.monster import SEARCH_DIRECTIONS
+from modules.swarm import STATE_CODES, STATE_NAMES
+
+MAGIC = b"HESN"
+VERSION = 3
+HEADER = struct.Struct("<4sHHQqIIII")
+NAME = struct.Struct(f"<{NAME_SIZE}s")
+# pos_x, pos_y, rect.x, rect.y, speed, stamina, exhausted_timer, is_exhausted, is_hiding, 오른쪽 이미지
+PLAYER_RECORD = struct.Struct("<ddqqddd???")
+# active, state, prev_state, 방, goal_room (-1 = 없음), tile_x, tile_y, rect.x, rect.y,
+# 목표 있음, target_x, target_y, speed, lost_timer, search_timer, wait_timer, search_direction (-1 = 없음),
+# search_direction_timer, 난수 상태 (Dice)
+MONSTER_RECORD = struct.Struct("<?bbiiqqqq?qqddddbdQ")
+# 방, 목격 타일 x, y, 창 width, height, 나이
+TRACE_RECORD = struct.Struct("<iiiiid")
+SWARM_FIELDS = ("active", "speed", "room", "tile_x", "tile_y", "center_x", "center_y", "state", "prev_state",
+                "has_target", "target_x", "target_y", "lost_timer", "search_timer", "wait_timer",
+                "search_direction", "search_direction_timer", "goal_room", "dice")
+ROOM_FIELDS = ("room", "goal_room")      # 방 코드 배열 (-1 = 없음) - 스웜 코드 <-> 스냅샷 코드
+AUTOSAVE_SECONDS = 30.0
+
+
+def snapshot_size(world):
+    swarm = world.swarm
+    size = HEADER.size + NAME.size * len(world.map_manager.rooms) + PLAYER_RECORD.size
+    size += MONSTER_RECORD.size * len(world.monsters)
+    if swarm is not None:
+        size += sum(getattr(swarm, name).itemsize for name in SWARM_FIELDS) * swarm.count
+    for trace in world.map_manager.shared(SearchHeatmap).traces.values():
+        size += TRACE_RECORD.size + trace.p.nbytes
+    return size
+
+
+# -------------------------------------------------------
+# 저장 / 복원
+# -------------------------------------------------------
+def save_world(world, buffer=None):
+    """world 의 플레이어 / 몬스터 / 스웜 상태 -> bytearray (buffer 를 주면 크기가 맞을 때 재사용)"""
+    size = snapshot_size(world)
+    if buffer is None or len(buffer) != size:
+        buffer = bytearray(size)
+
+    rooms = list(world.map_manager.rooms)
+    codes = {name: i for i, name in enumerate(rooms)}
+    swarm = world.swarm
+    search_map = world.map_manager.shared(SearchHeatmap)
+    HEADER.pack_into(buffer, 0, MAGIC, VERSION, len(rooms), world.tick,
+                     -1 if world.caught_tick is None else world.caught_tick, codes[world.player_map],
+                     len(world.monsters), 0 if swarm is None else swarm.count, len(search_map.traces))
+    offset = HEADER.size
+    for name in rooms:
+        NAME.pack_into(buffer, offset, name.encode("utf-8"))
+        offset += NAME.size
+
+    player = world.player
+    PLAYER_RECORD.pack_into(buffer, offset, player.pos_x, player.pos_y, player.rect.x, player.rect.y,
+                            player.speed, player.current_stamina, player.exhausted_timer,
+                            player.is_exhausted, player.is_hiding, player.image is player.image_right)
+    offset += PLAYER_RECORD.size
+
+    pack_monster = MONSTER_RECORD.pack_into
+    for m in world.monsters:
+        target = m.target_tile
+        pack_monster(buffer, offset, m.active, STATE_CODES[m.state], STATE_CODES.get(m.prev_state, 0),
+                     codes[m.current_map], -1 if m.goal_room is None else codes[m.goal_room],
+                     m.tile_x, m.tile_y, m.rect.x, m.rect.y,
+                     target is not None, target[0] if target else 0, target[1] if target else 0,
+                     m.speed, m.lost_timer, m.search_timer, m.wait_timer,
+                     -1 if m.search_direction is None else SEARCH_DIRECTIONS.index(m.search_direction),
+                     m.search_direction_timer, m.rng.getstate())
+        offset += MONSTER_RECORD.size
+
+    if swarm is not None:
+        n = swarm.count
+        for name in SWARM_FIELDS:
+            array = getattr(swarm, name)[:n]
+            if name in ROOM_FIELDS:   # 스웜 방 코드 -> 스냅샷 방 코드
+                array = np.array([codes[swarm.room_names[code]] if code >= 0 else -1 for code in array.tolist()],
+                                 dtype=array.dtype)
+            data = array.tobytes()
+            buffer[offset:offset + len(data)] = data
+            offset += len(data)
+
+    for map_name, trace in search_map.traces.items():
+        TRACE_RECORD.pack_into(buffer, offset, codes[map_name], trace.cx, trace.cy, trace.width, trace.height,
+                               trace.age)
+        offset += TRACE_RECORD.size
+        data = trace.p.tobytes()
+        buffer[offset:offset + len(data)] = data
+        offset += len(data)
+    return buffer
+
+
+def load_world(world, data):
+    """save_world 결과를 같은 레벨 / 몬스터 수로 만든 world 에 덮어쓴다
+
+    LOD 의 거친 이동 계획은 저장하지 않으므로 다시 만든다 (다른 방 몬스터는 다음 틱에 새로 계획).
+    렌더 보간용 직전 위치도 비운다.
+    """
+    data = memoryview(data)
+    magic, version = HEADER.unpack_from(data)[:2]
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("스냅샷 파일이 아님")
+    (_, _, room_count, tick, caught_tick, player_room, monster_count, swarm_count,
+     trace_count) = HEADER.unpack_from(data)
+    swarm = world.swarm
+    if monster_count != len(world.monsters) or swarm_count != (0 if swarm is None else swarm.count):
+        raise ValueError(f"몬스터 수가 맞지 않음: 스냅샷 {monster_count} + {swarm_count}")
+
+    offset = HEADER.size
+    rooms = []
+    for _ in range(room_count):
+        rooms.append(NAME.unpack_from(data, offset)[0].rstrip(b"\0").decode("utf-8"))
+        offset += NAME.size
+    missing = set(rooms) - set(world.map_manager.rooms)
+    if missing:
+        raise ValueError(f"맵에 없는 방: {sorted(missing)}")
+
+    world.tick = tick
+    world.caught_tick = None if caught_tick < 0 else caught_tick
+    world.player_map = rooms[player_room]
+    world.prev_positions = {}
+
+    player = world.player
+    (player.pos_x, player.pos_y, x, y, player.speed, player.current_stamina, player.exhausted_timer,
+     player.is_exhausted, player.is_hiding, right) = PLAYER_RECORD.unpack_from(data, offset)
+    player.rect.topleft = (x, y)
+    player.image = player.image_right if right else player.image_left
+    offset += PLAYER_RECORD.size
+
+    unpack_monster = MONSTER_RECORD.unpack_from
+    for m in world.monsters:
+        (m.active, state, prev_state, room, goal_room, m.tile_x, m.tile_y, x, y, has_target, target_x, target_y,
+         m.speed, m.lost_timer, m.search_timer, m.wait_timer, direction,
+         m.search_direction_timer, rng_state) = unpack_monster(data, offset)
+        m.state = STATE_NAMES[state]
+        m.prev_state = STATE_NAMES[prev_state] if prev_state else None
+        m.current_map = rooms[room]
+        m.goal_room = rooms[goal_room] if goal_room >= 0 else None
+        m.rect.topleft = (x, y)
+        m.target_tile = (target_x, target_y) if has_target else None
+        m.search_direction = SEARCH_DIRECTIONS[direction] if direction >= 0 else None
+        m.rng.setstate(rng_state)
+        offset += MONSTER_RECORD.size
+
+    if swarm is not None:
+        n = swarm.count
+        for name in SWARM_FIELDS:
+            array = getattr(swarm, name)
+            size = array.itemsize * n
+            array[:n] = np.frombuffer(data[offset:offset + size], dtype=array.dtype)
+            offset += size
+        # 스냅샷 방 코드 -> 스웜 방 코드
+        codes = [swarm.room_codes[name] for name in rooms]
+        for name in ROOM_FIELDS:
+            array = getattr(swarm, name)
+            array[:n] = [codes[code] if code >= 0 else -1 for code in array[:n].tolist()]
+
+    search_map = world.map_manager.shared(SearchHeatmap)
+    search_map.reset()
+    for _ in range(trace_count):
+        room, x, y, width, height, age = TRACE_RECORD.unpack_from(data, offset)
+        offset += TRACE_RECORD.size
+        size = width * height * 4
+        search_map.restore(rooms[room], (x, y), age, np.frombuffer(data[offset:offset + size], dtype=np.float32))
+        offset += size
+
+    # 위치 색인 / LOD 는 복원한 위치로 다시 만든다
+    world.monster_index = EntityIndex(world.monster_index.bucket_tiles)
+    for m in world.monsters:
+        if m.active:
+            world.monster_index.update(m, m.current_map)
+    if world.lod is not None:
+        world.lod = LodScheduler(world.map_manager, world.monsters, world.monster_index)
+
+    controls = player.controls
+    if hasattr(controls, "seek"):
+        controls.seek(tick)
+
+
+def write_snapshot(path, data):
+    """임시 파일에 쓰고 바꿔치기 (쓰다가 죽어도 이전 스냅샷은 그대로)"""
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def read_snapshot(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+# -------------------------------------------------------
+# 자동 저장
+# -------------------------------------------------------
+class Autosaver:
+    """every 틱마다 스냅샷 - 메인 스레드는 pack 만, 파일 쓰기는 백그라운드 스레드
+
+    world.tick (시뮬레이션 스텝) 으로 세므로 창 모드 / 헤드리스 모두 같은 틱에 저장한다.
+    쓰기가 밀리면 가장 최근 것 하나만 쓴다. update(world) 를 틱 (창 모드는 프레임) 마다 부른다.
+    start = 세기 시작할 틱 (스냅샷을 불러왔으면 world.tick)
+    """
+
+    def __init__(self, path, every, start=0):
+        self.path = path
+        self.every = max(1, int(every))
+        self.next_tick = start + self.every
+        self.saves = 0
+        self.pending = None       # 아직 안 쓴 최신 스냅샷
+        self.closing = False
+        self.cond = threading.Condition()
+        self.thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self.thread.start()
+
+    def update(self, world):
+        if world.tick >= self.next_tick:
+            # 한 프레임에 여러 틱이 지나가도 저장은 한 번, 간격은 그대로
+            self.next_tick += ((world.tick - self.next_tick) // self.every + 1) * self.every
+            self.save(world)
+
+    def save(self, world):
+        data = save_world(world)
+        with self.cond:
+            self.pending = data
+            self.cond.notify()
+        self.saves += 1
+
+    def _run(self):
+        while True:
+            with self.cond:
+                while self.pending is None and not self.closing:
+                    self.cond.wait()
+                data, self.pending = self.pending, None
+                if data is None:
+                    return
+            write_snapshot(self.path, data)
+
+    def close(self):
+        """밀린 스냅샷을 다 쓰고 스레드를 끝낸다"""
+        with self.cond:
+            self.closing = True
+            self.cond.notify()
+        self.thread.join()
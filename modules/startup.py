@@ -0,0 +1,79 @@
+# modules/startup.py
+
+import time
+
+import pygame
+
+from modules.monster import MONSTER_ASSETS
+from modules.player import PLAYER_ASSETS
+
+# 시작할 때 백그라운드로 미리 불러 둘 이미지 전체 (경로, 크기, 좌우반전)
+STARTUP_MANIFEST = MONSTER_ASSETS + PLAYER_ASSETS
+
+LOADING_FRAME_BUDGET = 1 / 120    # 로딩 화면 한 프레임에 작업을 돌릴 최대 시간 (초)
+LOADING_BACKGROUND = (0, 0, 0)
+LOADING_BAR_COLOR = (150, 150, 150)
+LOADING_TEXT_COLOR = (200, 200, 200)
+
+
+class StartupTimer:
+    """시작 단계별 소요 시간 - mark(name) 는 직전 mark 부터 지금까지를 name 단계로 기록"""
+
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self.last = self.start
+        self.phases = []          # (단계 이름, 초)
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.phases.append((name, now - self.last))
+        self.last = now
+
+    @property
+    def total(self):
+        return self.last - self.start
+
+    def report(self):
+        lines = [f"{name:<16}{seconds * 1000:>9.1f} ms" for name, seconds in self.phases]
+        lines.append(f"{'total':<16}{self.total * 1000:>9.1f} ms")
+        return "\n".join(lines)
+
+
+def init_pygame(headless=False):
+    """필요한 서브시스템만 초기화 (pygame.init() 은 오디오/조이스틱까지 켜서 느리다)"""
+    pygame.display.init()
+    if not headless:
+        pygame.font.init()
+
+
+def run_loading_screen(screen, clock, steps, font=None):
+    """steps (진행도 0 ~ 1 을 yield 하는 제너레이터) 를 다 돌 때까지 진행 막대를 그린다
+
+    한 프레임에 LOADING_FRAME_BUDGET 만큼만 작업을 돌리고 화면을 갱신하므로 창이 멈추지 않는다.
+    창을 닫으면 False
+    """
+    font = font if font is not None else pygame.font.Font(None, 28)
+    width, height = screen.get_size()
+    bar = pygame.Rect(width // 4, height // 2, width // 2, 12)
+    label = font.render("Loading...", True, LOADING_TEXT_COLOR)
+    progress = 0.0
+
+    steps = iter(steps)
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+
+        deadline = time.perf_counter() + LOADING_FRAME_BUDGET
+        try:
+            while time.perf_counter() < deadline:
+                progress = next(steps)
+        except StopIteration:
+            return True
+
+        screen.fill(LOADING_BACKGROUND)
+        screen.blit(label, label.get_rect(midbottom=(width // 2, bar.top - 8)))
+        pygame.draw.rect(screen, LOADING_BAR_COLOR, bar, 1)
+        pygame.draw.rect(screen, LOADING_BAR_COLOR, (bar.x, bar.y, int(bar.width * progress), bar.height))
+        pygame.display.flip()
+        clock.tick(60)
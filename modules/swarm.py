@@ -0,0 +1,611 @@
+# modules/swarm.py
+
+import math
+
+import numpy as np
+
+from modules.dice import Dice, roll
+from modules.events import EventBus, RoomChanged, StateChanged
+from modules.heatmap import SearchHeatmap
+from modules.map_manager import TILE_SIZE, FLAG_WALL, FLAG_ENTRANCE
+from modules.monster import MAX_CHASE_TILES, WAIT_DURATION, SEARCH_DURATION, LOST_DURATION, SEARCH_DIRECTIONS
+from modules.pathfinding import FlowFieldCache
+from modules.roomgraph import RoomGraph
+from modules.sight import SightCache
+
+# 상태 코드 (Monster.state 문자열 대신 정수)
+STATE_NONE = 0
+STATE_PATROL = 1
+STATE_CHASE = 2
+STATE_SEARCH = 3
+STATE_WAIT = 4
+STATE_NAMES = ("NONE", "PATROL", "CHASE", "SEARCH", "WAIT")
+STATE_CODES = {name: code for code, name in enumerate(STATE_NAMES)}
+
+# SEARCH 방향 코드 -> 단위 벡터 (Monster.random_move 와 같은 math.cos/sin 값)
+NO_DIRECTION = -1
+SEARCH_COS = np.array([math.cos(angle) for angle in SEARCH_DIRECTIONS])
+SEARCH_SIN = np.array([math.sin(angle) for angle in SEARCH_DIRECTIONS])
+
+HALF_TILE = TILE_SIZE // 2
+
+
+def round_px(values):
+    """pygame.Rect 좌표 대입과 같은 반올림 (0.5 는 0 에서 먼 쪽으로)"""
+    whole = np.trunc(values)
+    frac = values - whole
+    return (whole + np.sign(values) * (np.abs(frac) >= 0.5)).astype(np.int64)
+
+
+class MonsterSwarm:
+    """몬스터 여러 마리를 NumPy 배열 하나씩으로 들고 한 번에 갱신
+
+    Monster 한 마리 = 배열의 한 칸 (인덱스 i).
+    상태 전이, 시야, 이동, 난수 뽑기, 방 이동(WAIT 종료)까지 Monster.update 와 같은 규칙을 배열 연산으로 처리한다.
+    파이썬으로 도는 건 방 단위 (흐름장 / 확률 지도) 와 goal_room 이 있는 몬스터의 방 그래프 질의뿐.
+    난수는 몬스터마다 따로 (dice[i] = Monster.rng 상태) 굴리므로 같은 시드면 Monster.update 결과와 같다.
+
+    goal_room[i] = 방 코드 (-1 = 없음) 를 넣으면 Monster.goal_room 처럼 순찰 대신 그 방으로 건너간다.
+    배열 한 번에 드는 고정 비용이 있어서 몬스터가 수십 마리는 넘어야 Monster 객체보다 빠르다.
+    """
+
+    def __init__(self, map_manager, capacity=0):
+        self.map_manager = map_manager
+        self.flow_fields = map_manager.shared(FlowFieldCache)   # Monster 와 같은 흐름장 캐시
+        self.sight = map_manager.shared(SightCache)             # Monster 와 같은 시야 캐시
+        self.events = map_manager.shared(EventBus)              # 상태 전이 / 방 이동 알림 (몬스터 = 인덱스)
+        self.search_map = map_manager.shared(SearchHeatmap)     # Monster 와 같은 목격 위치 확률 지도
+        self.room_graph = map_manager.shared(RoomGraph)         # goal_room 길찾기
+
+        # 방 이름 <-> 방 코드
+        self.room_names = list(map_manager.rooms)
+        self.room_codes = {name: i for i, name in enumerate(self.room_names)}
+        self._tiles_key = None     # (links_version, 방들의 (객체, version)) - 바뀌면 타일 / 출구 배열을 다시 만든다
+        self._padded_field = None  # 마지막으로 쓴 추적 흐름장 (테두리 두른 거리 배열을 그대로 다시 쓴다)
+
+        self.count = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        def grow(name, dtype, fill):
+            old = getattr(self, name, None)
+            new = np.full(capacity, fill, dtype=dtype)
+            if old is not None:
+                new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+        grow("active", np.bool_, False)
+        grow("speed", np.float64, 0.0)
+        grow("room", np.int32, 0)
+        grow("tile_x", np.int64, 0)
+        grow("tile_y", np.int64, 0)
+        grow("center_x", np.int64, 0)        # rect.centerx (정수 픽셀)
+        grow("center_y", np.int64, 0)
+        grow("state", np.int8, STATE_NONE)
+        grow("prev_state", np.int8, STATE_NONE)
+        grow("has_target", np.bool_, False)
+        grow("target_x", np.int64, 0)
+        grow("target_y", np.int64, 0)
+        grow("lost_timer", np.float64, 0.0)
+        grow("search_timer", np.float64, 0.0)
+        grow("wait_timer", np.float64, 0.0)
+        grow("search_direction", np.int8, NO_DIRECTION)
+        grow("search_direction_timer", np.float64, 0.0)
+        grow("goal_room", np.int32, -1)
+        grow("dice", np.uint64, 0)            # 몬스터마다 따로 쓰는 난수 상태 (Monster.rng, dice.roll 로 굴림)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    # -------------------------------------------------------
+    # 추가 / spawn / despawn
+    # -------------------------------------------------------
+    def add(self, speed, map_name="HALL", seed=None):
+        """몬스터 한 칸 추가 (Monster(speed, map_manager, seed) 와 같은 초기값) -> 인덱스"""
+        if self.count == self.capacity:
+            self._allocate(max(16, self.capacity * 2))
+        i = self.count
+        self.count += 1
+        self.speed[i] = speed
+        self.room[i] = self.room_codes[map_name]
+        self.dice[i] = Dice(seed).getstate()
+        return i
+
+    def spawn(self, i, tile_pos):
+        self.tile_x[i], self.tile_y[i] = tile_pos
+        self.center_x[i] = self.tile_x[i] * TILE_SIZE + HALF_TILE
+        self.center_y[i] = self.tile_y[i] * TILE_SIZE + HALF_TILE
+
+        self.active[i] = True
+        self.state[i] = STATE_PATROL
+        self.has_target[i] = False
+
+        self.lost_timer[i] = 0
+        self.search_timer[i] = 0
+        self.wait_timer[i] = 0
+
+    def despawn(self, i):
+        self.active[i] = False
+        self.state[i] = STATE_NONE
+        self.has_target[i] = False
+
+    @classmethod
+    def from_monsters(cls, monsters, map_manager):
+        """Monster 객체들의 현재 상태를 그대로 옮겨 담은 스웜"""
+        swarm = cls(map_manager, capacity=len(monsters))
+        for monster in monsters:
+            i = swarm.add(monster.speed, monster.current_map)
+            swarm.dice[i] = monster.rng.getstate()
+            swarm.active[i] = monster.active
+            swarm.tile_x[i] = monster.tile_x
+            swarm.tile_y[i] = monster.tile_y
+            swarm.center_x[i], swarm.center_y[i] = monster.rect.center
+            swarm.state[i] = STATE_CODES.get(monster.state, STATE_NONE)
+            swarm.prev_state[i] = STATE_CODES.get(monster.prev_state, STATE_NONE)
+            swarm.has_target[i] = monster.target_tile is not None
+            if monster.target_tile is not None:
+                swarm.target_x[i], swarm.target_y[i] = monster.target_tile
+            swarm.lost_timer[i] = monster.lost_timer
+            swarm.search_timer[i] = monster.search_timer
+            swarm.wait_timer[i] = monster.wait_timer
+            if monster.search_direction is not None:
+                swarm.search_direction[i] = SEARCH_DIRECTIONS.index(monster.search_direction)
+            swarm.search_direction_timer[i] = monster.search_direction_timer
+            if monster.goal_room is not None:
+                swarm.goal_room[i] = swarm.room_codes[monster.goal_room]
+        return swarm
+
+    # -------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------
+    def state_name(self, i):
+        return STATE_NAMES[self.state[i]]
+
+    def map_name(self, i):
+        return self.room_names[self.room[i]]
+
+    def state_counts(self):
+        """상태 이름 -> 몬스터 수 (활성 여부와 상관없이 전부)"""
+        counts = np.bincount(self.state[:self.count], minlength=len(STATE_NAMES))
+        return {STATE_NAMES[code]: int(n) for code, n in enumerate(counts) if n}
+
+    def colliding(self, rect, map_name):
+        """rect 와 겹치는(같은 방에 있는) 몬스터 인덱스 배열 - Monster.is_colliding 과 같은 판정"""
+        n = self.count
+        left = self.center_x[:n] - HALF_TILE
+        top = self.center_y[:n] - HALF_TILE
+        hit = ((self.room[:n] == self.room_codes[map_name]) &
+               (left < rect.right) & (rect.left < left + TILE_SIZE) &
+               (top < rect.bottom) & (rect.top < top + TILE_SIZE))
+        return np.flatnonzero(hit)
+
+    # -------------------------------------------------------
+    # 타일 조회 (모든 방의 타일을 한 배열로 이어 붙여 한 번에 읽는다)
+    # -------------------------------------------------------
+    def _sync_tiles(self):
+        map_manager = self.map_manager
+        rooms = [map_manager.rooms[name] for name in self.room_names]
+        key = (map_manager.links_version, tuple((id(room), room.version) for room in rooms))
+        if key == self._tiles_key:
+            return
+
+        self._tiles = np.concatenate([room.grid.reshape(-1) for room in rooms])
+        self._room_width = np.array([room.width for room in rooms], dtype=np.int64)
+        self._room_height = np.array([room.height for room in rooms], dtype=np.int64)
+        self._room_offset = np.concatenate(([0], np.cumsum(self._room_width * self._room_height)[:-1])).astype(np.int64)
+        self._room_width_u = self._room_width.astype(np.uint64)
+        self._room_height_u = self._room_height.astype(np.uint64)
+
+        # 순찰 목표 후보 (MapManager.random_walkable_tile 과 같은 목록) - 방마다 [start, start + count)
+        walkable = [room.walkable_index for room in rooms]
+        self._walk_tiles = np.concatenate(walkable).astype(np.int64)
+        self._walk_count = np.array([len(index) for index in walkable], dtype=np.int64)
+        self._walk_start = np.concatenate(([0], np.cumsum(self._walk_count)[:-1])).astype(np.int64)
+
+        # 타일마다 방을 나가면 설 곳 (MapManager.move_to_room) - 연결 없는 타일은 같은 방 옆 칸
+        self._exit_room = np.concatenate([np.full(room.width * room.height, code, dtype=np.int32)
+                                          for code, room in enumerate(rooms)])
+        arrivals = [self._arrival(room.grid) for room in rooms]
+        self._exit_x = np.concatenate([x.reshape(-1) for x, _ in arrivals])
+        self._exit_y = np.concatenate([y.reshape(-1) for _, y in arrivals])
+        for (name, tile), (new_map, _) in map_manager.room_links.items():
+            code = self.room_codes.get(name)
+            if code is None or new_map not in self.room_codes:
+                continue
+            flat = self._room_offset[code] + tile[1] * self._room_width[code] + tile[0]
+            _, self._exit_x[flat], self._exit_y[flat] = map_manager.move_to_room(tile, name)
+            self._exit_room[flat] = self.room_codes[new_map]
+        self._tiles_key = key
+
+    @staticmethod
+    def _arrival(grid):
+        """타일마다 MapManager.arrival_tile - 입구가 아닌 걸을 수 있는 첫 이웃 (없으면 제자리) -> (x, y) 배열"""
+        h, w = grid.shape
+        ys, xs = np.indices((h, w), dtype=np.int64)
+        free = np.pad((grid & (FLAG_WALL | FLAG_ENTRANCE)) == 0, 1)
+        x = xs.copy()
+        y = ys.copy()
+        done = np.zeros((h, w), dtype=np.bool_)
+        for ox, oy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            ok = free[1 + oy:h + 1 + oy, 1 + ox:w + 1 + ox] & ~done
+            x[ok] += ox
+            y[ok] += oy
+            done |= ok
+        return x, y
+
+    def _flags(self, room, x, y):
+        """타일 플래그 - 방 범위 밖은 벽 (MapManager.is_walkable / is_entrance 가 False 인 곳)"""
+        w = self._room_width[room]
+        # 음수는 uint64 로 바꾸면 아주 큰 수 - 비교 두 번으로 범위 검사
+        inside = (x.astype(np.uint64) < self._room_width_u[room]) & (y.astype(np.uint64) < self._room_height_u[room])
+        index = self._room_offset[room] + y * w + x
+        return np.where(inside, self._tiles[np.where(inside, index, 0)], FLAG_WALL)
+
+    def _walkable(self, room, x, y):
+        return (self._flags(room, x, y) & FLAG_WALL) == 0
+
+    def _entrance(self, room, x, y):
+        return (self._flags(room, x, y) & FLAG_ENTRANCE) != 0
+
+    def _free(self, room, x, y):
+        """걸을 수 있고 입구가 아닌 타일 (SEARCH 배회가 들어갈 수 있는 곳)"""
+        return (self._flags(room, x, y) & (FLAG_WALL | FLAG_ENTRANCE)) == 0
+
+    # -------------------------------------------------------
+    # 메인 업데이트 (매 프레임 호출) - Monster.update 를 전원에게 한 번씩
+    # -------------------------------------------------------
+    def update(self, player, dt):
+        """한 틱 - Monster.update 와 같다 (search_map 갱신은 World.step 몫)"""
+        n = self.count
+        if n == 0:
+            return
+        if not self.events.active:
+            self._step(player, dt)
+            return
+
+        # 구독자가 있을 때만 갱신 전후 배열을 비교해서 알린다 (한 틱에 여러 번 바뀌면 처음 -> 끝만)
+        old_state = self.state[:n].copy()
+        old_room = self.room[:n].copy()
+        self._step(player, dt)
+        emit = self.events.emit
+        for i in np.flatnonzero(old_room != self.room[:n]).tolist():
+            emit(RoomChanged(i, self.room_names[old_room[i]], self.map_name(i),
+                             (int(self.tile_x[i]), int(self.tile_y[i]))))
+        for i in np.flatnonzero(old_state != self.state[:n]).tolist():
+            emit(StateChanged(i, STATE_NAMES[old_state[i]], self.state_name(i), self.map_name(i)))
+
+    def _step(self, player, dt):
+        n = self.count
+        self._sync_tiles()
+
+        state = self.state[:n]
+        room = self.room[:n]
+        tile_x = self.tile_x[:n]
+        tile_y = self.tile_y[:n]
+        active = self.active[:n]
+
+        # 상태 분기는 틱 시작 시점 상태 기준 (한 틱에 한 번만 분기)
+        patrol = active & (state == STATE_PATROL)
+        chase = active & (state == STATE_CHASE)
+        search = active & (state == STATE_SEARCH)
+        wait = active & (state == STATE_WAIT)
+
+        px, py = player.tile_x, player.tile_y
+        player_map = player.current_map
+        # 플레이어와 같은 방에 있는 몬스터만 사정거리 / 시야 판정 (다른 방 좌표는 의미가 없다)
+        here = room == self.room_codes.get(player_map, -1)
+        in_range = self._in_chase_range(px, py) & here
+
+        # PATROL: 숨지 않은 플레이어가 시야 안이면 CHASE
+        if not player.is_hiding:
+            spotted = self._sees_player(patrol & in_range, player_map, px, py)
+            state[spotted] = STATE_CHASE
+            self.has_target[:n][spotted] = True
+            self.target_x[:n][spotted] = px
+            self.target_y[:n][spotted] = py
+            self._observe(spotted, player_map, px, py)
+            patrol &= ~spotted
+
+        # CHASE: 다른 방 / 사정거리 밖이거나 숨은(또는 벽에 가려진) 플레이어를 2초 이상 놓치면 SEARCH
+        escaped = chase & ~in_range
+        chase &= in_range
+
+        lost_timer = self.lost_timer[:n]
+        missing = chase & ~self._sees_player(chase, player_map, px, py)
+        if player.is_hiding:
+            missing |= chase & ((np.abs(px - tile_x) > MAX_CHASE_TILES / 2) |
+                                (np.abs(py - tile_y) > MAX_CHASE_TILES / 2))
+        lost_timer[missing] += dt
+        lost_timer[chase & ~missing] = 0
+        self._observe(chase & ~missing, player_map, px, py)
+
+        lost = chase & (lost_timer > LOST_DURATION)
+        chase &= ~lost
+        escaped |= lost
+        state[escaped] = STATE_SEARCH
+        self.search_timer[:n][escaped] = 0
+
+        # SEARCH: 확률 지도 이웃 중 가장 높은 칸 (없으면 랜덤 배회)
+        at_entrance = self._entrance(room, tile_x, tile_y)
+        searching = search & ~at_entrance
+        climb = np.zeros(n, dtype=np.bool_)
+        step_x = tile_x.copy()
+        step_y = tile_y.copy()
+        if searching.any():
+            self._search_steps(searching, climb, step_x, step_y)
+
+        # PATROL: 찾아갈 방이 있으면 방 그래프가 고른 입구로 (못 가거나 이미 그 방이면 goal_room 해제)
+        routed = patrol & (self.goal_room[:n] >= 0)
+        route_x = tile_x.copy()
+        route_y = tile_y.copy()
+        if routed.any():
+            routed = self._route_steps(routed, route_x, route_y)
+            patrol &= ~routed
+
+        # 난수 뽑기 - 몬스터마다 자기 dice 상태에서
+        needs_target = patrol & ~self.has_target[:n]
+        needs_direction = searching & ~climb & ((self.search_direction[:n] == NO_DIRECTION) |
+                                                (self.search_direction_timer[:n] <= 0))
+        if needs_target.any():
+            self._draw_targets(needs_target)
+        if needs_direction.any():
+            self._draw_directions(needs_direction)
+
+        # PATROL: 목표 도달하면 목표 해제, 아니면 목표로 이동
+        has_target = self.has_target[:n]
+        has_target[patrol & has_target & (tile_x == self.target_x[:n]) & (tile_y == self.target_y[:n])] = False
+        patrol &= has_target
+
+        goal_x = self.target_x[:n].copy()
+        goal_y = self.target_y[:n].copy()
+
+        # CHASE: 흐름장에서 다음 칸 (경로 없으면 플레이어 타일로 직진)
+        if chase.any():
+            self._chase_steps(chase, player_map, px, py, goal_x, goal_y)
+
+        goal_x[climb] = step_x[climb]
+        goal_y[climb] = step_y[climb]
+        goal_x[routed] = route_x[routed]
+        goal_y[routed] = route_y[routed]
+        self._move_towards(patrol | chase | climb | routed, goal_x * TILE_SIZE + HALF_TILE,
+                           goal_y * TILE_SIZE + HALF_TILE, at_entrance, dt)
+
+        # SEARCH: 이동 후 (이동한 위치 기준) 플레이어가 보이면 CHASE, 오래되면 PATROL
+        if search.any():
+            self._random_move(search & ~climb, at_entrance, dt)
+
+            if not player.is_hiding:
+                found = self._sees_player(search & self._in_chase_range(px, py) & here, player_map, px, py)
+                state[found] = STATE_CHASE
+                lost_timer[found] = 0
+                self._observe(found, player_map, px, py)
+                search &= ~found
+
+            search_timer = self.search_timer[:n]
+            search_timer[search] += dt
+            state[search & (search_timer > SEARCH_DURATION)] = STATE_PATROL
+
+        # WAIT: 시간이 다 되면 연결된 방으로 이동하고 이전 상태 복귀
+        if wait.any():
+            wait_timer = self.wait_timer[:n]
+            wait_timer[wait] += dt
+            leaving = wait & (wait_timer >= WAIT_DURATION)
+            if leaving.any():
+                self._leave_room(leaving)
+
+    # -------------------------------------------------------
+    # 보조 메서드들
+    # -------------------------------------------------------
+    def _in_chase_range(self, px, py):
+        n = self.count
+        return ((np.abs(px - self.tile_x[:n]) <= MAX_CHASE_TILES) &
+                (np.abs(py - self.tile_y[:n]) <= MAX_CHASE_TILES))
+
+    def _sees_player(self, candidates, player_map, px, py):
+        """사정거리 안 후보 (플레이어와 같은 방) 중 플레이어 타일까지 시야가 트인 몬스터
+
+        시야는 대칭이라 (sight.FieldOfView) 몬스터마다 자기 시야를 보는 대신 플레이어 타일 시야 하나에서 한 번에 읽는다
+        """
+        seen = candidates.copy()
+        if seen.any():
+            seen[candidates] = self.sight.visible_from(player_map, (px, py), self.tile_x[:self.count][candidates],
+                                                       self.tile_y[:self.count][candidates])
+        return seen
+
+    def _observe(self, seen, player_map, px, py):
+        """seen 몬스터가 있으면 플레이어 목격 (Monster 의 search_map.observe - 보는 건 플레이어 방 몬스터뿐)"""
+        if seen.any():
+            self.search_map.observe(player_map, (px, py))
+
+    def _search_steps(self, searching, climb, step_x, step_y):
+        """Monster.search_move - 지금 타일은 찾아본 곳으로, 확률이 더 높은 이웃이 있으면 climb / step 에 기록
+
+        방 번호로 한 번 정렬해서 방마다 한 덩어리씩 (확률 지도는 방 단위)
+        """
+        idx = np.flatnonzero(searching)
+        rooms = self.room[idx]
+        order = np.argsort(rooms, kind="stable")
+        idx = idx[order]
+        codes, starts = np.unique(rooms[order], return_index=True)
+        for code, part in zip(codes.tolist(), np.split(idx, starts[1:])):
+            name = self.room_names[code]
+            x = self.tile_x[part]
+            y = self.tile_y[part]
+            self.search_map.searched(name, x, y)
+            found, best_x, best_y = self.search_map.steps(name, x, y)
+            climb[part] = found
+            step_x[part] = best_x
+            step_y[part] = best_y
+
+    def _draw_targets(self, needs_target):
+        """Monster.get_random_walkable_tile - 방의 순찰 후보 중 하나 (후보가 없는 방이면 난수도 안 굴린다)"""
+        idx = np.flatnonzero(needs_target)
+        room = self.room[idx]
+        count = self._walk_count[room]
+        ok = count > 0
+        idx = idx[ok]
+        room = room[ok]
+        if len(idx) == 0:
+            return
+        states = self.dice[idx]
+        pick = (roll(states) * count[ok]).astype(np.int64)        # Dice.randrange
+        self.dice[idx] = states
+        tile = self._walk_tiles[self._walk_start[room] + pick]
+        width = self._room_width[room]
+        self.has_target[idx] = True
+        self.target_x[idx] = tile % width
+        self.target_y[idx] = tile // width
+
+    def _draw_directions(self, needs_direction):
+        """Monster.random_move 와 같은 순서로 방향 (Dice.choice) -> 유지 시간 (Dice.uniform(3.0, 4.0))"""
+        idx = np.flatnonzero(needs_direction)
+        states = self.dice[idx]
+        self.search_direction[idx] = (roll(states) * len(SEARCH_DIRECTIONS)).astype(np.int8)
+        self.search_direction_timer[idx] = 3.0 + (4.0 - 3.0) * roll(states)
+        self.dice[idx] = states
+
+    def _route_steps(self, routed, step_x, step_y):
+        """goal_room 이 있는 순찰 몬스터 - Monster.update_patrol 과 같은 방 그래프 질의 (드물어서 한 마리씩)
+
+        -> 실제로 입구를 향해 가는 몬스터 (다음 칸은 step_x / step_y 에). 나머지는 goal_room 을 지우고 평소 순찰
+        """
+        moving = routed.copy()
+        graph = self.room_graph
+        for i in np.flatnonzero(routed).tolist():
+            here = self.room_names[self.room[i]]
+            goal = self.room_names[self.goal_room[i]]
+            tile = (int(self.tile_x[i]), int(self.tile_y[i]))
+            exit_tile = None if goal == here else graph.next_exit(here, tile, goal)
+            if exit_tile is None:
+                self.goal_room[i] = -1
+                moving[i] = False
+                continue
+            step_x[i], step_y[i] = graph.next_step(here, tile, exit_tile) or exit_tile
+        return moving
+
+    def _chase_steps(self, chase, player_map, px, py, goal_x, goal_y):
+        """chase 몬스터들 (전부 플레이어 방) 의 흐름장 다음 칸을 goal_x/goal_y 에 기록
+
+        FlowField.next_step 과 같은 우선순위 (오른쪽 / 왼쪽 / 아래 / 위, 더 작은 거리만)
+        """
+        goal_x[chase] = px
+        goal_y[chase] = py
+
+        field = self.flow_fields.get(player_map, (px, py))
+        if field is not self._padded_field:
+            # 거리 지도에 -1 테두리를 둘러 1차원으로 - 이웃은 +-1, +-한 줄 (범위 검사 없음)
+            w = field.room.width
+            dist = np.frombuffer(field.dist, dtype=np.intc).reshape(field.room.height, w)
+            self._padded_dist = np.pad(dist, 1, constant_values=-1).reshape(-1)
+            self._padded_field = field
+        dist = self._padded_dist
+        row = field.room.width + 2
+
+        idx = np.flatnonzero(chase)
+        here = (self.tile_y[idx] + 1) * row + self.tile_x[idx] + 1
+        best = here
+        best_d = dist[here]
+        at_goal = best_d == 0
+        for offset in (1, -1, row, -row):
+            d = dist[here + offset]
+            better = (d >= 0) & ((best_d < 0) | (d < best_d))
+            best = np.where(better, here + offset, best)
+            best_d = np.where(better, d, best_d)
+
+        step = (best != here) & ~at_goal
+        goal_x[idx[step]] = best[step] % row - 1
+        goal_y[idx[step]] = best[step] // row - 1
+
+    def _enter_wait(self, mask):
+        n = self.count
+        self.prev_state[:n][mask] = self.state[:n][mask]
+        self.state[:n][mask] = STATE_WAIT
+        self.wait_timer[:n][mask] = 0
+
+    def _move_towards(self, movers, target_cx, target_cy, at_entrance, dt):
+        """Monster.move_towards - 4방향으로 target 픽셀 좌표를 향해 이동"""
+        # 이동 전에 현재 위치가 문이면 WAIT
+        self._enter_wait(movers & at_entrance)
+        movers = movers & ~at_entrance
+        if not movers.any():
+            return
+
+        idx = np.flatnonzero(movers)
+        room = self.room[idx]
+        cx = self.center_x[idx]
+        cy = self.center_y[idx]
+        dx = target_cx[idx] - cx
+        dy = target_cy[idx] - cy
+
+        # 4방향 제한
+        horizontal = np.abs(dx) > np.abs(dy)
+        dx = np.where(horizontal, dx, 0)
+        dy = np.where(horizontal, 0, dy)
+
+        dist = np.maximum(0.001, np.sqrt((dx * dx + dy * dy).astype(np.float64)))
+        speed = self.speed[idx]
+        new_cx = cx + (dx / dist) * speed * dt
+        new_cy = cy + (dy / dist) * speed * dt
+        new_tile_x = (new_cx / TILE_SIZE).astype(np.int64)
+        new_tile_y = (new_cy / TILE_SIZE).astype(np.int64)
+
+        # 충돌 검사 후 이동 (x 먼저, y 는 바뀐 tile_x 기준)
+        tile_x = self.tile_x[idx]
+        tile_y = self.tile_y[idx]
+        ok_x = self._walkable(room, new_tile_x, tile_y)
+        tile_x = np.where(ok_x, new_tile_x, tile_x)
+        self.center_x[idx] = np.where(ok_x, round_px(new_cx), cx)
+        self.tile_x[idx] = tile_x
+
+        ok_y = self._walkable(room, tile_x, new_tile_y)
+        self.center_y[idx] = np.where(ok_y, round_px(new_cy), cy)
+        self.tile_y[idx] = np.where(ok_y, new_tile_y, tile_y)
+
+    def _random_move(self, searchers, at_entrance, dt):
+        """Monster.random_move - 정해진 방향으로 배회, 막히면 다음 틱에 방향 재설정"""
+        self._enter_wait(searchers & at_entrance)
+        searchers = searchers & ~at_entrance
+        if not searchers.any():
+            return
+
+        idx = np.flatnonzero(searchers)
+        room = self.room[idx]
+        direction = self.search_direction[idx]
+        speed = self.speed[idx]
+        new_cx = self.center_x[idx] + SEARCH_COS[direction] * speed * dt
+        new_cy = self.center_y[idx] + SEARCH_SIN[direction] * speed * dt
+        new_tile_x = (new_cx / TILE_SIZE).astype(np.int64)
+        new_tile_y = (new_cy / TILE_SIZE).astype(np.int64)
+
+        # 이동 가능 여부는 둘 다 이동 전 타일 기준 (문, 벽 있으면 이동 불가)
+        tile_x = self.tile_x[idx]
+        tile_y = self.tile_y[idx]
+        ok_x = self._free(room, new_tile_x, tile_y)
+        ok_y = self._free(room, tile_x, new_tile_y)
+
+        self.center_x[idx] = np.where(ok_x, round_px(new_cx), self.center_x[idx])
+        self.tile_x[idx] = np.where(ok_x, new_tile_x, tile_x)
+        self.center_y[idx] = np.where(ok_y, round_px(new_cy), self.center_y[idx])
+        self.tile_y[idx] = np.where(ok_y, new_tile_y, tile_y)
+
+        timer = self.search_direction_timer[idx]
+        timer[~(ok_x | ok_y)] = 0
+        self.search_direction_timer[idx] = timer - dt
+
+    def _leave_room(self, leaving):
+        """WAIT 종료 - Monster.update_wait 와 같이 연결된 방으로 옮기고 이전 상태 복귀 (미리 만든 타일별 도착 표)"""
+        idx = np.flatnonzero(leaving)
+        room = self.room[idx]
+        flat = self._room_offset[room] + self.tile_y[idx] * self._room_width[room] + self.tile_x[idx]
+        x = self._exit_x[flat]
+        y = self._exit_y[flat]
+        self.room[idx] = self._exit_room[flat]
+        self.tile_x[idx] = x
+        self.tile_y[idx] = y
+        self.center_x[idx] = x * TILE_SIZE + HALF_TILE
+        self.center_y[idx] = y * TILE_SIZE + HALF_TILE
+
+        self.state[idx] = self.prev_state[idx]
+        self.prev_state[idx] = STATE_NONE
+        self.wait_timer[idx] = 0
@@ -0,0 +1,231 @@
+# modules/sweep.py
+#
+# 몬스터 튜닝 값 일괄 실험 - 봇 플레이어로 헤드리스 게임을 프로세스 풀에서 잔뜩 돌린다
+#
+#   python -m modules.sweep --speed 40,60,80 --wait 1.0,1.5 --seeds 20 --csv sweep.csv
+#
+# 게임 하나 = 한 줄 요약 (궤적은 남기지 않는다). 결과는 끝나는 대로 받아서 누적 집계만 들고 있는다.
+
+import argparse
+import csv
+import itertools
+import multiprocessing
+import os
+import sys
+import time
+
+import modules.monster as monster_module
+from modules.sight import SIGHT_RANGE
+
+# 실험할 수 있는 값: 이름 -> (modules.monster 속성 이름 또는 None, 기본값)
+PARAMETERS = {
+    "chase": ("MAX_CHASE_TILES", monster_module.MAX_CHASE_TILES),
+    "wait": ("WAIT_DURATION", monster_module.WAIT_DURATION),
+    "search": ("SEARCH_DURATION", monster_module.SEARCH_DURATION),
+    "lost": ("LOST_DURATION", monster_module.LOST_DURATION),
+    "speed": (None, 60),          # 몬스터 속도 (픽셀/초) - build_demo_world 인자
+}
+SWEEP_TICKS = 3600        # 게임 하나 최대 틱 수 (잡히면 거기서 끝)
+SWEEP_DT = 1 / 60
+SWEEP_MONSTERS = 2
+RESULT_COLUMNS = ["seed", "caught_tick", "time_to_catch", "chase_ratio", "search_ratio", "ticks", "ticks_per_sec"]
+
+
+# -------------------------------------------------------
+# 워커 (자식 프로세스)
+# -------------------------------------------------------
+def _init_worker():
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"     # SDL 이 SIGTERM 을 가로채면 풀이 워커를 못 끝낸다
+    import pygame
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+
+def apply_params(params):
+    """modules.monster 설정값을 바꾼다 (이 프로세스 안의 Monster 전부에 적용)
+
+    MonsterSwarm / LOD 는 값을 import 할 때 복사해 가므로 바꿔도 소용이 없다 - run_game 은 Monster 객체 월드만 만든다.
+    """
+    for name, value in params.items():
+        attr = PARAMETERS[name][0]
+        if attr is not None:
+            setattr(monster_module, attr, value)
+
+
+def run_game(job):
+    """(params, seed, ticks, monster_count) -> 결과 요약 dict (잡히면 그 틱에서 멈춘다)"""
+    from modules.bot import BotInput
+    from modules.simulation import build_demo_world
+
+    params, seed, ticks, monster_count = job
+    apply_params(params)
+
+    bot = BotInput(seed)
+    # swarm / lod 는 켜지 않는다 (apply_params 가 바꾼 값을 안 읽는다)
+    world = build_demo_world(controls=bot, monster_count=monster_count, monster_speed=params["speed"], seed=seed,
+                             swarm=False, lod=False)
+    bot.attach(world)
+
+    chase = search = 0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        world.step(SWEEP_DT)
+        for monster in world.monsters:
+            if monster.state == "CHASE":
+                chase += 1
+            elif monster.state == "SEARCH":
+                search += 1
+        if world.caught_tick is not None:
+            break
+    elapsed = time.perf_counter() - start
+
+    monster_ticks = max(1, world.tick * len(world.monsters))
+    return {
+        "params": params,
+        "seed": seed,
+        "caught_tick": world.caught_tick,
+        "time_to_catch": None if world.caught_tick is None else world.caught_tick * SWEEP_DT,
+        "chase_ratio": chase / monster_ticks,
+        "search_ratio": search / monster_ticks,
+        "ticks": world.tick,
+        "ticks_per_sec": world.tick / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+# -------------------------------------------------------
+# 집계 (메인 프로세스)
+# -------------------------------------------------------
+class SweepTable:
+    """파라미터 조합별 누적 합계 - 게임 결과를 받는 대로 더하고 버린다"""
+
+    def __init__(self):
+        self.rows = {}            # 파라미터 튜플 -> 합계 dict
+
+    def add(self, result):
+        key = tuple(sorted(result["params"].items()))
+        row = self.rows.get(key)
+        if row is None:
+            row = self.rows[key] = {"games": 0, "caught": 0, "catch_time": 0.0,
+                                    "chase": 0.0, "search": 0.0, "tps": 0.0}
+        row["games"] += 1
+        if result["caught_tick"] is not None:
+            row["caught"] += 1
+            row["catch_time"] += result["time_to_catch"]
+        row["chase"] += result["chase_ratio"]
+        row["search"] += result["search_ratio"]
+        row["tps"] += result["ticks_per_sec"]
+
+    def summary(self):
+        """[(params dict, {games, caught_rate, mean_catch_time, chase_ratio, search_ratio, ticks_per_sec})]"""
+        out = []
+        for key, row in sorted(self.rows.items()):
+            games = row["games"]
+            out.append((dict(key), {
+                "games": games,
+                "caught_rate": row["caught"] / games,
+                "mean_catch_time": row["catch_time"] / row["caught"] if row["caught"] else None,
+                "chase_ratio": row["chase"] / games,
+                "search_ratio": row["search"] / games,
+                "ticks_per_sec": row["tps"] / games,
+            }))
+        return out
+
+    def format(self):
+        names = list(PARAMETERS)
+        header = "".join(f"{n:>8}" for n in names) + f"{'games':>7}{'caught':>8}{'catch_s':>9}{'chase':>7}{'search':>8}{'tick/s':>9}"
+        lines = [header]
+        for params, row in self.summary():
+            catch = "-" if row["mean_catch_time"] is None else f"{row['mean_catch_time']:.1f}"
+            lines.append("".join(f"{params.get(n, '-'):>8}" for n in names) +
+                         f"{row['games']:>7}{row['caught_rate']:>8.0%}{catch:>9}"
+                         f"{row['chase_ratio']:>7.2f}{row['search_ratio']:>8.2f}{row['ticks_per_sec']:>9.0f}")
+        return "\n".join(lines)
+
+
+def sweep_jobs(grid, seeds, ticks=SWEEP_TICKS, monster_count=SWEEP_MONSTERS):
+    """grid = {이름: [값, ...]} -> 모든 조합 x 시드 작업 (제너레이터 - 한꺼번에 만들지 않는다)"""
+    names = list(PARAMETERS)
+    values = [grid.get(name, [PARAMETERS[name][1]]) for name in names]
+    for combo in itertools.product(*values):
+        params = dict(zip(names, combo))
+        for seed in seeds:
+            yield params, seed, ticks, monster_count
+
+
+def run_sweep(jobs, processes=None, on_result=None):
+    """jobs 를 프로세스 풀에서 돌려 SweepTable 로 집계 - on_result(result) 는 게임이 끝날 때마다 호출"""
+    table = SweepTable()
+    pool = multiprocessing.Pool(processes, initializer=_init_worker)
+    try:
+        for result in pool.imap_unordered(run_game, jobs, chunksize=1):
+            table.add(result)
+            if on_result is not None:
+                on_result(result)
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    return table
+
+
+def _values(text, cast):
+    return [cast(v) for v in text.split(",") if v.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="몬스터 튜닝 값 일괄 실험 (봇 플레이어, 프로세스 풀)")
+    for name, (_, default) in PARAMETERS.items():
+        parser.add_argument(f"--{name}", default=None, help=f"쉼표로 나눈 값 목록 (기본 {default})")
+    parser.add_argument("--seeds", type=int, default=10, help="조합마다 돌릴 시드 수")
+    parser.add_argument("--seed-base", type=int, default=0, help="첫 시드")
+    parser.add_argument("--ticks", type=int, default=SWEEP_TICKS, help="게임 하나 최대 틱 수")
+    parser.add_argument("--monsters", type=int, default=SWEEP_MONSTERS, help="몬스터 수")
+    parser.add_argument("--processes", type=int, default=None, help="워커 수 (기본 CPU 코어 수)")
+    parser.add_argument("--csv", metavar="PATH", default=None, help="게임별 결과를 끝나는 대로 PATH 에 한 줄씩 저장")
+    args = parser.parse_args(argv)
+
+    grid = {}
+    for name in PARAMETERS:
+        text = getattr(args, name)
+        if text is not None:
+            grid[name] = _values(text, int if name == "chase" else float)
+    # 시야 창보다 먼 추적 거리는 시야 판정에서 잘려서 SIGHT_RANGE 와 똑같이 돈다 - 조용히 같은 결과를 내지 않게
+    too_far = [v for v in grid.get("chase", []) if not 0 < v <= SIGHT_RANGE]
+    if too_far:
+        parser.error(f"--chase 는 1..{SIGHT_RANGE} (시야 창 반경) 만 가능: {too_far}")
+    seeds = range(args.seed_base, args.seed_base + args.seeds)
+    total = args.seeds
+    for values in grid.values():
+        total *= len(values)
+
+    csv_file = open(args.csv, "w", newline="", encoding="utf-8") if args.csv else None
+    writer = None
+    if csv_file is not None:
+        writer = csv.writer(csv_file)
+        writer.writerow(list(PARAMETERS) + RESULT_COLUMNS)
+
+    done = [0]
+
+    def on_result(result):
+        done[0] += 1
+        if writer is not None:
+            writer.writerow([result["params"][n] for n in PARAMETERS] + [result[c] for c in RESULT_COLUMNS])
+            csv_file.flush()
+        print(f"\r{done[0]}/{total} games", end="", file=sys.stderr, flush=True)
+
+    start = time.perf_counter()
+    try:
+        table = run_sweep(sweep_jobs(grid, seeds, args.ticks, args.monsters), args.processes, on_result)
+    finally:
+        if csv_file is not None:
+            csv_file.close()
+    print(file=sys.stderr)
+    print(table.format())
+    print(f"{done[0]} games in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+# hollowescape/tests/benchmark/hotpathBench.py
+# AI / 이동 / 충돌 핫 패스 벤치마크 (창 없이 dummy SDL 드라이버)
+#
+#   python tests/benchmark/hotpathBench.py                  측정 + baseline.json 과 비교 (느려지면 종료 코드 1)
+#   python tests/benchmark/hotpathBench.py --save-baseline  지금 결과를 기준값으로 저장
+#   python tests/benchmark/hotpathBench.py --out result.json --only monster.
+#
+# 결과는 "호출 1번당 마이크로초" (반복 중 가장 빠른 값 = 잡음이 가장 적은 값)
+# 기준값은 기계마다 다르므로 같은 기계에서 만든 baseline 과 비교할 것
+# (순수 파이썬 기준 작업 시간으로 기계 속도 변화는 어느 정도 보정한다)
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import time
+
+import pygame
+
+pygame.display.init()
+pygame.display.set_mode((1, 1))
+
+from modules.collision import WallIndex
+from modules.controls import ScriptedInput
+from modules.heatmap import SearchHeatmap
+from modules.map_manager import MapManager, TILE_SIZE
+from modules.monster import Monster
+from modules.player import Player
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+TOLERANCE = 0.30          # 기준값보다 30% 넘게 느려지면 실패
+REPEAT = 5                # 측정 반복 횟수 (가장 빠른 값 사용)
+CALIBRATION_CALLS = 20000
+DT = 1 / 60
+
+
+# -------------------------
+# 시나리오 (전부 시드 고정)
+# -------------------------
+def build_map(size, floor_ratio, seed):
+    """size x size 방 - floor_ratio 만큼만 바닥, 나머지는 벽 (테두리는 벽)"""
+    rng = random.Random(seed)
+    rows = []
+    for y in range(size):
+        row = []
+        for x in range(size):
+            border = x in (0, size - 1) or y in (0, size - 1)
+            row.append("#" if border or rng.random() > floor_ratio else ".")
+        rows.append("".join(row))
+    map_manager = MapManager()
+    map_manager.load_room_from_rows("HALL", rows)
+    return map_manager
+
+
+def open_map(size=40):
+    return build_map(size, 1.0, 0)
+
+
+class StillPlayer:
+    def __init__(self, tile, hiding=False):
+        self.tile_x, self.tile_y = tile
+        self.is_hiding = hiding
+        self.current_map = "HALL"
+
+
+def spawned_monster(map_manager, tile, seed=1):
+    monster = Monster(speed=60, map_manager=map_manager, seed=seed)
+    monster.spawn(tile)
+    return monster
+
+
+def bench_monster_state(state):
+    """Monster.update 한 상태만 계속 돌리기 (상태가 바뀌지 않게 매번 되돌린다)
+
+    SEARCH 는 World.step 처럼 틱마다 search_map.update 까지 (2초마다 다시 목격 - 확률을 따라 오른다)
+    """
+    map_manager = open_map()
+    search_map = map_manager.shared(SearchHeatmap)
+    calls = [0]
+    monster = spawned_monster(map_manager, (20, 20))
+    if state == "CHASE":
+        player = StillPlayer((25, 22))          # 보이는 곳
+    else:
+        player = StillPlayer((2, 2), hiding=True)
+    monster.state = state
+    monster.prev_state = "PATROL"
+
+    def run():
+        monster.state = state
+        monster.search_timer = 0
+        monster.wait_timer = 0
+        monster.update(player, DT)
+        if state == "SEARCH":
+            if calls[0] % 120 == 0:
+                search_map.observe("HALL", (24, 22))
+            calls[0] += 1
+            search_map.update(DT)
+    return run
+
+
+def bench_move_towards():
+    map_manager = open_map()
+    monster = spawned_monster(map_manager, (5, 5))
+    corners = [(5 * TILE_SIZE + 16, 5 * TILE_SIZE + 16), (34 * TILE_SIZE + 16, 34 * TILE_SIZE + 16)]
+    target = [0]
+
+    def run():
+        goal = corners[target[0]]
+        if monster.rect.center == goal:
+            target[0] ^= 1
+        monster.move_towards(goal, DT)
+    return run
+
+
+def bench_random_move():
+    monster = spawned_monster(open_map(), (20, 20))
+    return lambda: monster.random_move(DT)
+
+
+def bench_random_walkable(floor_ratio):
+    map_manager = build_map(100, floor_ratio, 1)
+    monster = spawned_monster(map_manager, map_manager.random_walkable_tile("HALL", random.Random(0)))
+    return monster.get_random_walkable_tile
+
+
+def bench_player_move(wall_count):
+    """wall_count 개의 벽 타일이 흩어진 맵에서 Player.move (WallIndex)"""
+    rng = random.Random(wall_count)
+    size = max(40, int((wall_count * 4) ** 0.5))
+    walls = [pygame.Rect(rng.randrange(size) * TILE_SIZE, rng.randrange(size) * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+             for _ in range(wall_count)]
+    index = WallIndex(walls)
+    player = Player(size // 2 * TILE_SIZE, size // 2 * TILE_SIZE, ScriptedInput([]))
+    directions = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+    calls = [0]
+
+    def run():
+        calls[0] += 1
+        dx, dy = directions[calls[0] // 30 % 4]
+        player.move(dx, dy, index, DT)
+    return run
+
+
+BENCHMARKS = {
+    "monster.update.PATROL": (lambda: bench_monster_state("PATROL"), 20000),
+    "monster.update.CHASE": (lambda: bench_monster_state("CHASE"), 20000),
+    "monster.update.SEARCH": (lambda: bench_monster_state("SEARCH"), 20000),
+    "monster.update.WAIT": (lambda: bench_monster_state("WAIT"), 50000),
+    "monster.move_towards": (bench_move_towards, 50000),
+    "monster.random_move": (bench_random_move, 50000),
+    "map.random_walkable.sparse": (lambda: bench_random_walkable(0.1), 50000),
+    "map.random_walkable.dense": (lambda: bench_random_walkable(0.9), 50000),
+    "player.move.10_walls": (lambda: bench_player_move(10), 20000),
+    "player.move.1k_walls": (lambda: bench_player_move(1000), 20000),
+    "player.move.10k_walls": (lambda: bench_player_move(10000), 20000),
+}
+
+
+# -------------------------
+# 측정 / 비교
+# -------------------------
+def measure(setup, number):
+    """setup() 이 돌려준 함수를 number 번 호출 -> 호출당 µs"""
+    run = setup()
+    gc.collect()
+    gc.disable()          # timeit 처럼 측정 중에는 GC 를 끈다 (셋업이 만든 객체 때문에 튀지 않도록)
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        return (time.perf_counter() - start) / number * 1e6
+    finally:
+        gc.enable()
+
+
+def calibration():
+    """기계 속도 기준 - 순수 파이썬 고정 작업 (게임 코드와 무관)"""
+    values = list(range(64))
+    return lambda: sorted(values, key=lambda v: (v * 7919) % 64)
+
+
+def run_benchmarks(only=None, scale=1.0, repeat=REPEAT):
+    """벤치마크를 한 바퀴씩 repeat 번 돌린다 (잠깐 느려지는 구간이 한 항목에만 몰리지 않도록)"""
+    names = [name for name in BENCHMARKS if not only or any(name.startswith(p) for p in only)]
+    samples = {name: [] for name in names}
+    calibration_samples = []
+    for _ in range(repeat):
+        calibration_samples.append(measure(calibration, max(1, int(CALIBRATION_CALLS * scale))))
+        for name in names:
+            setup, number = BENCHMARKS[name]
+            samples[name].append(measure(setup, max(1, int(number * scale))))
+
+    results = {}
+    for name in names:
+        results[name] = {"us_per_call": min(samples[name]), "median_us": statistics.median(samples[name])}
+        print(f"{name:<32}{min(samples[name]):>10.3f} us", flush=True)
+    return results, min(calibration_samples)
+
+
+def compare(results, baseline, tolerance=TOLERANCE, speed=1.0):
+    """-> 기준값보다 tolerance 넘게 느려진 [(이름, 지금, 기준, 비율)]
+
+    speed = 지금 기계 기준 작업 시간 / 기준값 만들 때 기준 작업 시간 (비율을 이만큼 나눠서 보정)
+    """
+    slower = []
+    for name, row in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        ratio = row["us_per_call"] / base["us_per_call"] / speed
+        row["baseline_us"] = base["us_per_call"]
+        row["ratio"] = ratio
+        if ratio > 1 + tolerance:
+            slower.append((name, row["us_per_call"], base["us_per_call"], ratio))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="핫 패스 벤치마크")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="비교할 기준값 JSON")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준값으로 저장 (비교하지 않음)")
+    parser.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="허용 느려짐 비율 (0.3 = 30%%)")
+    parser.add_argument("--only", nargs="*", default=None, help="이름이 이 접두사로 시작하는 것만")
+    parser.add_argument("--scale", type=float, default=1.0, help="호출 횟수 배율 (빠르게 훑을 때 0.1 등)")
+    args = parser.parse_args(argv)
+
+    results, calibration_us = run_benchmarks(args.only, args.scale)
+    report = {"python": platform.python_version(), "machine": platform.machine(),
+              "calibration_us": calibration_us, "results": results}
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"baseline: {args.baseline}")
+        return 0
+
+    slower = []
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        speed = calibration_us / baseline["calibration_us"] if baseline.get("calibration_us") else 1.0
+        report["speed"] = speed
+        slower = compare(results, baseline["results"], args.tolerance, speed)
+    else:
+        print(f"기준값 없음: {args.baseline} (--save-baseline 으로 만들 것)")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    for name, now, base, ratio in slower:
+        print(f"SLOWER {name}: {now:.3f} us (baseline {base:.3f} us, x{ratio:.2f})")
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
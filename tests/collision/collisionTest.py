@@ -0,0 +1,136 @@
+# hollowescape/tests/collision/collisionTest.py
+# WallIndex / EntityIndex == 전부 도는 검사 - 무작위 배치로 비교 (python tests/collision/collisionTest.py)
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import random
+
+import pygame
+
+from modules.collision import WallIndex, EntityIndex
+
+TILE = 32
+ROOMS = ("HALL", "CELLAR")
+
+
+def random_walls(rng, count):
+    """겹치기도 하고 크기 0 / 음수 좌표도 섞인 벽들"""
+    return [pygame.Rect(rng.randrange(-100, 700), rng.randrange(-100, 700),
+                        rng.choice((0, 8, 32, 32, 64, 150)), rng.choice((0, 8, 32, 32, 64, 150)))
+            for _ in range(count)]
+
+
+def push_out(rect, walls, move_x, move_y):
+    """Player.move 처럼 X 축 -> Y 축 순서로 부딪힌 벽 밖으로 밀어낸다 -> 부딪힌 벽 순서
+
+    walls 가 WallIndex 면 colliding(), 리스트면 전부 돈다
+    """
+    hits = []
+    rect.x += move_x
+    found = walls.colliding(rect) if isinstance(walls, WallIndex) else (w for w in walls if rect.colliderect(w))
+    for wall in found:
+        hits.append(tuple(wall))
+        if move_x > 0:
+            rect.right = wall.left
+        elif move_x < 0:
+            rect.left = wall.right
+    rect.y += move_y
+    found = walls.colliding(rect) if isinstance(walls, WallIndex) else (w for w in walls if rect.colliderect(w))
+    for wall in found:
+        hits.append(tuple(wall))
+        if move_y > 0:
+            rect.bottom = wall.top
+        elif move_y < 0:
+            rect.top = wall.bottom
+    return hits
+
+
+def test_wall_index_matches_list_scan():
+    rng = random.Random(4)
+    for cell_size in (16, 64, 200):
+        for _ in range(40):
+            walls = random_walls(rng, rng.randrange(1, 80))
+            index = WallIndex(walls, cell_size)
+            for _ in range(50):
+                start = pygame.Rect(rng.randrange(-50, 650), rng.randrange(-50, 650),
+                                    rng.randrange(1, 80), rng.randrange(1, 80))
+                move = (rng.randrange(-120, 121), rng.randrange(-120, 121))
+                a, b = start.copy(), start.copy()
+                # 밀려난 rect 가 처음 조회한 칸을 벗어나도 순서 / 결과가 같다
+                assert push_out(a, index, *move) == push_out(b, walls, *move), (cell_size, start, move)
+                assert a == b
+
+
+class Thing:
+    def __init__(self, rng, tile_x, tile_y):
+        self.rng = rng
+        self.move(tile_x, tile_y)
+
+    def move(self, tile_x, tile_y):
+        self.tile_x = tile_x
+        self.tile_y = tile_y
+        # 자기 타일에서 한 칸 안쪽으로 삐져나올 수 있다 (overlapping 의 가정)
+        self.rect = pygame.Rect(tile_x * TILE + self.rng.randrange(-TILE + 1, TILE), tile_y * TILE, TILE, TILE)
+
+
+def chebyshev(thing, tile):
+    dx, dy = abs(thing.tile_x - tile[0]), abs(thing.tile_y - tile[1])
+    return max(dx, dy), dx + dy
+
+
+def test_entity_index_matches_brute_force():
+    rng = random.Random(7)
+    for bucket_tiles in (1, 4, 7):
+        index = EntityIndex(bucket_tiles)
+        rooms = {}
+        things = []
+        for _ in range(120):
+            thing = Thing(rng, rng.randrange(-5, 60), rng.randrange(-5, 60))
+            rooms[thing] = rng.choice(ROOMS)
+            index.update(thing, rooms[thing])
+            things.append(thing)
+
+        for round_ in range(30):
+            # 일부는 타일 / 방을 옮기고 일부는 빠진다 (버킷 이동 확인)
+            for thing in rng.sample(things, 30):
+                thing.move(thing.tile_x + rng.randrange(-6, 7), thing.tile_y + rng.randrange(-6, 7))
+                if rng.random() < 0.2:
+                    rooms[thing] = rng.choice(ROOMS)
+                index.update(thing, rooms[thing])
+            if round_ % 10 == 9:
+                gone = things.pop(rng.randrange(len(things)))
+                index.remove(gone)
+                assert gone not in index
+            assert len(index) == len(things)
+
+            for _ in range(20):
+                room = rng.choice(ROOMS)
+                tile = (rng.randrange(-10, 70), rng.randrange(-10, 70))
+                here = [t for t in things if rooms[t] == room]
+
+                tiles = rng.randrange(0, 20)
+                expected = {t for t in here if chebyshev(t, tile)[0] <= tiles}
+                found = index.within(room, tile, tiles)
+                assert len(found) == len(set(found)) and set(found) == expected
+
+                # 거리가 같은 엔티티끼리는 순서가 정해지지 않으므로 거리 열로 비교
+                k = rng.randrange(1, 10)
+                max_tiles = rng.choice((None, 3, 12, 40))
+                ranked = sorted((chebyshev(t, tile) for t in here
+                                 if max_tiles is None or chebyshev(t, tile)[0] <= max_tiles))
+                found = index.nearest(room, tile, k, max_tiles)
+                assert [chebyshev(t, tile) for t in found] == ranked[:k], (bucket_tiles, tile, k, max_tiles)
+                assert all(rooms[t] == room for t in found)
+
+                rect = pygame.Rect(rng.randrange(-200, 2000), rng.randrange(-200, 2000),
+                                   rng.randrange(1, 300), rng.randrange(1, 300))
+                found = index.overlapping(room, rect, TILE)
+                assert len(found) == len(set(found))
+                assert set(found) == {t for t in here if rect.colliderect(t.rect)}
+
+
+if __name__ == "__main__":
+    test_wall_index_matches_list_scan()
+    test_entity_index_matches_brute_force()
+    print("WallIndex / EntityIndex == 전부 도는 검사")
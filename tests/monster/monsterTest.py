@@ -1,33 +1,37 @@
 # hollowescape/tests/monster/monster_test.py
 import sys
 import os
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../modules')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 import pygame
 import math
 import random
 
-from monster import Monster
+from modules.heatmap import SearchHeatmap
+from modules.monster import Monster
+from modules.map_manager import MapManager
 
 pygame.init()
 
 TILE_SIZE = 32
 
 # -------------------------
-# 테스트용 MapManager
+# 테스트용 맵 (20x20, 입구 2개)
 # -------------------------
-class TestMapManager:
-    def __init__(self):
-        # 넓은 맵: 20x20
-        self.width = 20
-        self.height = 20
-        self.room_entrances = [(5, 5), (15, 15)]
-
-    def is_walkable(self, x, y):
-        return 0 <= x < self.width and 0 <= y < self.height
-
-    def move_to_room(self, tile_pos):
-        # 실제 맵 이동 없이 좌표 그대로 반환
-        return tile_pos
+def build_test_map():
+    rows = []
+    for y in range(20):
+        row = ["."] * 20
+        if y == 5:
+            row[5] = "E"
+        if y == 15:
+            row[15] = "E"
+        rows.append("".join(row))
+
+    map_manager = MapManager()
+    map_manager.load_room_from_rows("HALL", rows)
+    # 두 입구를 서로 연결 (같은 방 안에서 순간이동)
+    map_manager.link_entrances("HALL", (5, 5), "HALL", (15, 15))
+    return map_manager
 
 # -------------------------
 # 테스트용 Player
@@ -42,6 +46,7 @@ class TestPlayer:
         self.width = TILE_SIZE
         self.height = TILE_SIZE
         self.is_hiding = False
+        self.current_map = "HALL"
         self.speed = 100  # 픽셀/초
 
     def handle_input(self, dt):
@@ -69,7 +74,7 @@ pygame.display.set_caption("Monster Test")
 clock = pygame.time.Clock()
 
 # 객체 생성
-map_manager = TestMapManager()
+map_manager = build_test_map()
 monster = Monster(speed=50, map_manager=map_manager)
 monster.spawn((0,0))
 player = TestPlayer()
@@ -84,13 +89,14 @@ while running:
     # 플레이어 입력 처리
     player.handle_input(dt)
 
-    # 몬스터 업데이트
+    # 몬스터 업데이트 (SEARCH 확률 지도는 World.step 처럼 틱 끝에 한 번)
     monster.update(player, dt)
+    map_manager.shared(SearchHeatmap).update(dt)
 
     # 화면 렌더링
     screen.fill((0,0,0))
     # entrance 표시
-    for ex, ey in map_manager.room_entrances:
+    for ex, ey in map_manager.room_entrances["HALL"]:
         pygame.draw.rect(screen, (255,0,0), pygame.Rect(ex*TILE_SIZE, ey*TILE_SIZE, TILE_SIZE, TILE_SIZE))
     screen.blit(monster.image, monster.rect)
     pygame.draw.rect(screen, (0,0,255), player.rect)  # 플레이어 파란색
@@ -0,0 +1,39 @@
+# hollowescape/tests/monster/roomGraphTest.py
+# RoomGraph - 입구 연결을 바꾸면 (연결 수가 그대로여도) 길을 다시 만든다 (python tests/monster/roomGraphTest.py)
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from modules.map_manager import MapManager
+from modules.roomgraph import RoomGraph
+from modules.simulation import DEMO_ROOMS, DEMO_LINKS
+
+
+def demo_map():
+    map_manager = MapManager()
+    for name, rows in DEMO_ROOMS.items():
+        map_manager.load_room_from_rows(name, rows)
+    for (room_a, pos_a), (room_b, pos_b) in DEMO_LINKS:
+        map_manager.link_entrances(room_a, pos_a, room_b, pos_b)
+    return map_manager
+
+
+def test_route_follows_relinked_entrance():
+    map_manager = demo_map()
+    graph = map_manager.shared(RoomGraph)
+    assert graph.route("HALL", (1, 1), "CELLAR") == [("HALL", (24, 6))]
+    assert graph.distance_to_room("HALL", (1, 1), "CELLAR") < float("inf")
+
+    # HALL 입구를 자기 자신으로 다시 잇는다 - 연결 수는 그대로, CELLAR 로는 더 못 간다
+    links = len(map_manager.room_links)
+    map_manager.link_entrances("HALL", (24, 6), "HALL", (24, 6), both_ways=False)
+    assert len(map_manager.room_links) == links
+    assert graph.route("HALL", (1, 1), "CELLAR") is None
+    assert graph.distance_to_room("HALL", (1, 1), "CELLAR") == float("inf")
+    # 반대쪽 연결은 그대로
+    assert graph.route("CELLAR", (1, 1), "HALL") == [("CELLAR", (0, 5))]
+
+
+if __name__ == "__main__":
+    test_route_follows_relinked_entrance()
+    print("방 그래프 연결 변경 OK")
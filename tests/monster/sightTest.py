@@ -0,0 +1,92 @@
+# hollowescape/tests/monster/sightTest.py
+# 몬스터 시야는 같은 방의 플레이어만 본다 - Monster / MonsterSwarm 둘 다 (python tests/monster/sightTest.py)
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+pygame.display.init()
+pygame.display.set_mode((1, 1))
+
+from modules.heatmap import SearchHeatmap
+from modules.monster import Monster
+from modules.simulation import build_demo_world
+from modules.swarm import MonsterSwarm, STATE_CHASE
+
+DT = 1 / 60
+
+
+class StandingPlayer:
+    def __init__(self, map_name, tile):
+        self.current_map = map_name
+        self.tile_x, self.tile_y = tile
+        self.is_hiding = False
+
+
+def cellar_monster(map_manager):
+    # CELLAR (7, 3) 에서 오른쪽 (8, 3) 은 트인 바닥 - HALL 의 (8, 3) 도 바닥
+    monster = Monster(speed=60, map_manager=map_manager, seed=1)
+    monster.current_map = "CELLAR"
+    monster.spawn((7, 3))
+    return monster
+
+
+def test_monster_ignores_player_in_other_room():
+    map_manager = build_demo_world(monster_count=0, seed=1).map_manager
+    monster = cellar_monster(map_manager)
+
+    assert monster.can_see_player(StandingPlayer("CELLAR", (8, 3)))
+    elsewhere = StandingPlayer("HALL", (8, 3))
+    assert not monster.can_see_player(elsewhere)
+
+    monster.update(elsewhere, DT)
+    assert monster.state == "PATROL", monster.state
+
+    # 추적 중에 플레이어가 방을 나가면 바로 SEARCH (다른 방 좌표로 흐름장을 따라가지 않는다)
+    monster.set_state("CHASE")
+    monster.update(elsewhere, DT)
+    assert monster.state == "SEARCH", monster.state
+
+
+def test_swarm_ignores_player_in_other_room():
+    map_manager = build_demo_world(monster_count=0, seed=1).map_manager
+    swarm = MonsterSwarm.from_monsters([cellar_monster(map_manager), cellar_monster(map_manager)], map_manager)
+    swarm.state[1] = STATE_CHASE
+
+    swarm.update(StandingPlayer("HALL", (8, 3)), DT)
+    assert [swarm.state_name(i) for i in range(2)] == ["PATROL", "SEARCH"]
+
+    swarm.update(StandingPlayer("CELLAR", (8, 3)), DT)
+    assert swarm.state_name(0) == "CHASE"
+
+
+def test_search_map_ignores_player_in_other_room():
+    # 다른 방 플레이어를 CELLAR 좌표로 찍어 두면 SEARCH 가 엉뚱한 곳을 찾는다
+    map_manager = build_demo_world(monster_count=0, seed=1).map_manager
+    search_map = map_manager.shared(SearchHeatmap)
+    monster = cellar_monster(map_manager)
+    swarm = MonsterSwarm.from_monsters([cellar_monster(map_manager)], map_manager)
+    swarm.state[0] = STATE_CHASE
+    elsewhere = StandingPlayer("HALL", (8, 3))
+
+    for state in ("PATROL", "CHASE", "SEARCH"):
+        monster.set_state(state)
+        monster.update(elsewhere, DT)
+    swarm.update(elsewhere, DT)
+    swarm.update(elsewhere, DT)
+    assert not search_map.sightings, search_map.sightings
+    search_map.update(DT)
+    assert not search_map.traces, list(search_map.traces)
+
+    monster.set_state("PATROL")
+    monster.update(StandingPlayer("CELLAR", (8, 3)), DT)
+    assert search_map.sightings == {"CELLAR": (8, 3)}, search_map.sightings
+
+
+if __name__ == "__main__":
+    test_monster_ignores_player_in_other_room()
+    test_swarm_ignores_player_in_other_room()
+    test_search_map_ignores_player_in_other_room()
+    print("시야는 같은 방만")
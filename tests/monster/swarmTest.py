@@ -0,0 +1,194 @@
+# hollowescape/tests/monster/swarmTest.py
+# MonsterSwarm 이 Monster.update 를 한 마리씩 돌린 결과와 같은지 비교 (python tests/monster/swarmTest.py)
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import random
+import time
+
+from modules.heatmap import SearchHeatmap
+from modules.map_manager import MapManager
+from modules.monster import Monster
+from modules.simulation import build_demo_world
+from modules.swarm import MonsterSwarm
+
+
+# -------------------------
+# 테스트용 맵 (40x40, 입구 2개 - 몬스터가 지나가다 WAIT 에 들어간다)
+# -------------------------
+ENTRANCES = [(5, 5), (35, 35)]
+
+
+def build_open_map():
+    rows = []
+    for y in range(40):
+        row = ["."] * 40
+        for ex, ey in ENTRANCES:
+            if y == ey:
+                row[ex] = "E"
+        rows.append("".join(row))
+
+    map_manager = MapManager()
+    map_manager.load_room_from_rows("HALL", rows)
+    map_manager.link_entrances("HALL", ENTRANCES[0], "HALL", ENTRANCES[1])
+    return map_manager
+
+
+# -------------------------
+# 정해진 경로를 도는 플레이어 (가끔 숨는다)
+# -------------------------
+class ScriptedPlayer:
+    def __init__(self, waypoints, hide_every=400, hide_for=150, map_name="HALL"):
+        self.waypoints = waypoints
+        self.hide_every = hide_every
+        self.hide_for = hide_for
+        self.tick = 0
+        self.tile_x, self.tile_y = waypoints[0]
+        self.is_hiding = False
+        self.current_map = map_name
+
+    def advance(self):
+        self.tick += 1
+        leg = (self.tick // 20) % len(self.waypoints)
+        self.tile_x, self.tile_y = self.waypoints[leg]
+        self.is_hiding = self.tick % self.hide_every >= self.hide_every - self.hide_for
+
+
+def monster_snapshot(monster):
+    return (monster.current_map, monster.tile_x, monster.tile_y, monster.rect.center,
+            monster.state, monster.target_tile,
+            round(monster.lost_timer, 9), round(monster.search_timer, 9), round(monster.wait_timer, 9),
+            monster.goal_room, monster.rng.getstate())
+
+
+def swarm_snapshot(swarm, i):
+    target = None
+    if swarm.has_target[i]:
+        target = (int(swarm.target_x[i]), int(swarm.target_y[i]))
+    return (swarm.map_name(i), int(swarm.tile_x[i]), int(swarm.tile_y[i]),
+            (int(swarm.center_x[i]), int(swarm.center_y[i])),
+            swarm.state_name(i), target,
+            round(float(swarm.lost_timer[i]), 9), round(float(swarm.search_timer[i]), 9),
+            round(float(swarm.wait_timer[i]), 9),
+            swarm.room_names[swarm.goal_room[i]] if swarm.goal_room[i] >= 0 else None, int(swarm.dice[i]))
+
+
+def run_parity(map_manager, monsters, waypoints, ticks, dt=1 / 60, player_map="HALL"):
+    """같은 상태(몬스터별 난수 포함)에서 Monster 리스트와 MonsterSwarm 을 따로 돌려 매 틱 비교
+
+    SEARCH 확률 지도는 공유 서비스라 두 번째 실행 전에 비우고, 틱마다 World.step 처럼 끝에 갱신
+    """
+    swarm = MonsterSwarm.from_monsters(monsters, map_manager)
+    search_map = map_manager.shared(SearchHeatmap)
+
+    search_map.reset()
+    player = ScriptedPlayer(waypoints, map_name=player_map)
+    expected = []
+    for _ in range(ticks):
+        for monster in monsters:
+            monster.update(player, dt)
+        search_map.update(dt)
+        expected.append([monster_snapshot(monster) for monster in monsters])
+        player.advance()
+
+    search_map.reset()
+    player = ScriptedPlayer(waypoints, map_name=player_map)
+    seen_states = set()
+    for tick in range(ticks):
+        swarm.update(player, dt)
+        search_map.update(dt)
+        actual = [swarm_snapshot(swarm, i) for i in range(len(swarm))]
+        for i, (want, got) in enumerate(zip(expected[tick], actual)):
+            assert want == got, f"tick {tick} monster {i}: {want} != {got}"
+            seen_states.add(got[4])
+        player.advance()
+    return seen_states
+
+
+def test_swarm_matches_monsters_open_room():
+    rng = random.Random(7)
+    map_manager = build_open_map()
+    monsters = []
+    for i in range(30):
+        monster = Monster(speed=50 + i % 4 * 10, map_manager=map_manager, seed=i)
+        # 몇 마리는 입구 위에서 시작 (바로 WAIT -> 방 이동)
+        monster.spawn(ENTRANCES[i % 2] if i % 10 == 0 else map_manager.random_walkable_tile("HALL", rng))
+        monsters.append(monster)
+
+    waypoints = [(2, 2), (8, 2), (8, 8), (17, 8), (17, 17), (2, 17)]
+    seen = run_parity(map_manager, monsters, waypoints, ticks=2400)
+    assert {"PATROL", "CHASE", "SEARCH", "WAIT"} <= seen, seen
+
+
+def test_swarm_matches_monsters_demo_world():
+    world = build_demo_world(monster_count=12, seed=3)
+    waypoints = [(1, 1), (6, 1), (6, 7), (11, 7), (22, 5), (22, 16), (2, 16)]
+    run_parity(world.map_manager, world.monsters, waypoints, ticks=2400)
+
+
+def test_swarm_matches_monsters_goal_room():
+    # 몇 마리는 순찰 대신 CELLAR 로 (방 그래프 길찾기 -> 입구에서 WAIT -> 방 이동) - 플레이어는 CELLAR 에
+    world = build_demo_world(monster_count=12, seed=3)
+    for monster in world.monsters[::2]:
+        monster.goal_room = "CELLAR"
+    waypoints = [(1, 1), (8, 1), (8, 5), (12, 5), (12, 1)]
+    run_parity(world.map_manager, world.monsters, waypoints, ticks=1800, player_map="CELLAR")
+    assert any(monster.current_map == "CELLAR" for monster in world.monsters)
+
+
+def test_swarm_exits_follow_relinked_entrance():
+    # 입구를 다른 곳으로 다시 이어도 (연결 수는 그대로) 출구 표가 새 연결을 따른다
+    map_manager = build_open_map()
+    swarm = MonsterSwarm(map_manager)
+
+    def exit_of(tile):
+        swarm._sync_tiles()
+        flat = tile[1] * 40 + tile[0]
+        return swarm.room_names[swarm._exit_room[flat]], int(swarm._exit_x[flat]), int(swarm._exit_y[flat])
+
+    assert exit_of(ENTRANCES[0]) == map_manager.move_to_room(ENTRANCES[0], "HALL")
+    links = len(map_manager.room_links)
+    map_manager.link_entrances("HALL", ENTRANCES[0], "HALL", ENTRANCES[0], both_ways=False)
+    assert len(map_manager.room_links) == links
+    assert exit_of(ENTRANCES[0]) == map_manager.move_to_room(ENTRANCES[0], "HALL") == ("HALL", 6, 5)
+
+
+def best_time(run, ticks, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(ticks):
+            run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_swarm_is_faster_with_many_monsters():
+    # 스웜을 쓰는 이유 - 몬스터가 많으면 Monster.update 를 한 마리씩 도는 것보다 빨라야 한다
+    # (기계 잡음에 흔들리지 않게 여유를 크게 - 보통은 3배 넘게 빠르다)
+    world = build_demo_world(monster_count=400, seed=3)
+    swarm = MonsterSwarm.from_monsters(world.monsters, world.map_manager)
+    player = ScriptedPlayer([(1, 1), (6, 1), (6, 7), (11, 7), (22, 5), (22, 16), (2, 16)])
+    dt = 1 / 60
+
+    def monsters_tick():
+        for monster in world.monsters:
+            monster.update(player, dt)
+        player.advance()
+
+    def swarm_tick():
+        swarm.update(player, dt)
+        player.advance()
+
+    objects = best_time(monsters_tick, 60)
+    arrays = best_time(swarm_tick, 60)
+    assert arrays * 1.5 < objects, f"swarm {arrays * 1e3 / 60:.2f} ms/tick, Monster {objects * 1e3 / 60:.2f} ms/tick"
+
+
+if __name__ == "__main__":
+    test_swarm_matches_monsters_open_room()
+    test_swarm_matches_monsters_demo_world()
+    test_swarm_matches_monsters_goal_room()
+    test_swarm_exits_follow_relinked_entrance()
+    test_swarm_is_faster_with_many_monsters()
+    print("MonsterSwarm == Monster.update")
@@ -0,0 +1,98 @@
+# hollowescape/tests/render/renderTest.py
+# 카메라가 멈춘 프레임의 바뀐 곳만 그리기 - 조명 없이 / 조명 켜고 모두 전체 다시 그리기와 같은 화면 (python tests/render/renderTest.py)
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+pygame.display.init()
+pygame.display.set_mode((1, 1))
+
+from modules.controls import ScriptedInput
+from modules.lighting import LightingLayer
+from modules.map_manager import TILE_SIZE
+from modules.render import TileMapRenderer
+from modules.simulation import build_demo_world
+
+VIEW = (480, 320)
+SPRITE = pygame.Surface((TILE_SIZE, TILE_SIZE))
+SPRITE.fill((200, 40, 40))
+
+
+def demo_world():
+    """몬스터 없는 데모 월드 - 플레이어는 HALL (10, 6)"""
+    world = build_demo_world(ScriptedInput.parse("NONE:1"), monster_count=0, seed=1)
+    world.player.place(10 * TILE_SIZE, 6 * TILE_SIZE)
+    return world
+
+
+def camera_on(player):
+    return (player.rect.centerx - VIEW[0] // 2, player.rect.centery - VIEW[1] // 2)
+
+
+def sprite_rects(step):
+    """프레임마다 4px 씩 움직이는 스프라이트 둘 (지난 자리와 겹친다)"""
+    return [pygame.Rect(8 * TILE_SIZE + 4 * step, 5 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+            pygame.Rect(12 * TILE_SIZE, 7 * TILE_SIZE + 4 * step, TILE_SIZE, TILE_SIZE)]
+
+
+def full_frame(world, camera, step, lighting=None):
+    """같은 프레임을 새 렌더러로 처음부터 그린 화면"""
+    screen = pygame.Surface(VIEW)
+    renderer = TileMapRenderer(world.map_manager)
+    renderer.begin(screen, "HALL", camera)
+    renderer.blits([(SPRITE, rect) for rect in sprite_rects(step)])
+    if lighting is not None:
+        LightingLayer(world.map_manager, "HALL").draw(screen, world.player, camera)
+    return screen
+
+
+def same_pixels(a, b):
+    return pygame.image.tobytes(a, "RGB") == pygame.image.tobytes(b, "RGB")
+
+
+def test_dirty_frames_match_full_redraw():
+    world = demo_world()
+    camera = camera_on(world.player)
+    screen = pygame.Surface(VIEW)
+    renderer = TileMapRenderer(world.map_manager)
+
+    for step in range(4):
+        renderer.begin(screen, "HALL", camera)
+        renderer.blits([(SPRITE, rect) for rect in sprite_rects(step)])
+        assert renderer.full_redraw == (step == 0)
+        if step:
+            # 지난 자리 둘 + 새 자리 둘만 화면에 올린다
+            assert len(renderer.dirty) == 4, renderer.dirty
+        assert same_pixels(screen, full_frame(world, camera, step)), step
+
+
+def test_dirty_frames_with_lighting_match_full_redraw():
+    world = demo_world()
+    camera = camera_on(world.player)
+    screen = pygame.Surface(VIEW)
+    scene = pygame.Surface(VIEW)
+    renderer = TileMapRenderer(world.map_manager)
+    lighting = LightingLayer(world.map_manager, "HALL")
+
+    for step in range(4):
+        relight = lighting.prepare(VIEW, world.player, camera)
+        assert relight == (step == 0)
+        renderer.begin(scene, "HALL", camera, full=relight)
+        renderer.blits([(SPRITE, rect) for rect in sprite_rects(step)])
+        assert renderer.full_redraw == (step == 0)
+        lighting.compose(screen, scene, None if renderer.full_redraw else renderer.dirty)
+        # 겹치는 사각형도 두 번 어두워지지 않는다
+        assert same_pixels(screen, full_frame(world, camera, step, lighting=True)), step
+
+    # 플레이어가 타일을 옮기면 마스크가 바뀌어 전체를 다시 입힌다
+    world.player.place(11 * TILE_SIZE, 6 * TILE_SIZE)
+    assert lighting.prepare(VIEW, world.player, camera)
+
+
+if __name__ == "__main__":
+    test_dirty_frames_match_full_redraw()
+    test_dirty_frames_with_lighting_match_full_redraw()
+    print("바뀐 곳만 그리기 == 전체 다시 그리기 (조명 포함)")
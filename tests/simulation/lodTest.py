@@ -0,0 +1,63 @@
+# hollowescape/tests/simulation/lodTest.py
+# LOD - 플레이어가 방에 들어가면 그 방의 거친 몬스터가 제자리에서 정밀 몬스터로 (python tests/simulation/lodTest.py)
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+pygame.display.init()
+pygame.display.set_mode((1, 1))
+
+from modules.controls import ScriptedInput
+from modules.map_manager import TILE_SIZE
+from modules.simulation import build_demo_world
+
+DT = 1 / 60
+CELLAR_TILES = [(2, 8), (12, 1)]    # CELLAR 바닥
+
+
+def lod_world():
+    """몬스터 3 마리 LOD 월드 - 두 마리는 CELLAR, 한 마리는 HALL. 플레이어는 HALL 입구 앞에서 오른쪽으로"""
+    world = build_demo_world(ScriptedInput.parse("RIGHT:10,NONE:30"), monster_count=3, seed=1, lod=True)
+    world.player.place(23 * TILE_SIZE, 6 * TILE_SIZE)
+    for monster, tile in zip(world.monsters, CELLAR_TILES):
+        monster.current_map = "CELLAR"
+        monster.speed = 0             # 거친 모델에서 방을 옮기지 않고, 올라온 뒤에도 제자리
+        monster.spawn(tile)
+    return world
+
+
+def test_player_entering_room_promotes_coarse_monsters():
+    world = lod_world()
+    lod = world.lod
+    cellar = world.monsters[:2]
+    hall = world.monsters[2]
+
+    world.step(DT)
+    assert all(lod.is_coarse(monster) for monster in cellar)
+    assert not lod.is_coarse(hall)
+    assert world.monsters_near(40) == [hall]
+
+    for _ in range(20):
+        world.step(DT)
+        if world.player_map == "CELLAR":
+            break
+    assert world.player_map == "CELLAR", world.player_map
+
+    # CELLAR 몬스터는 마지막 타일 중앙에서 정밀 갱신, HALL 몬스터는 거친 모델로
+    for monster, tile in zip(cellar, CELLAR_TILES):
+        assert not lod.is_coarse(monster)
+        assert monster in lod.full
+        assert (monster.current_map, monster.tile_x, monster.tile_y) == ("CELLAR",) + tile
+        assert monster.rect.center == (tile[0] * TILE_SIZE + TILE_SIZE // 2, tile[1] * TILE_SIZE + TILE_SIZE // 2)
+        assert monster.state in ("PATROL", "CHASE"), monster.state
+    assert lod.is_coarse(hall)
+    assert lod.full == cellar
+    assert sorted(world.monsters_near(40), key=cellar.index) == cellar
+
+
+if __name__ == "__main__":
+    test_player_entering_room_promotes_coarse_monsters()
+    print("LOD 방 입장 승격 OK")
@@ -0,0 +1,68 @@
+# hollowescape/tests/simulation/replayTest.py
+# 입력 기록에 미로 크기 / 레벨이 같이 저장되고, 재생할 때 명령줄이 다르면 멈추는지 (python tests/simulation/replayTest.py)
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import tempfile
+
+import pygame
+
+pygame.display.init()
+pygame.display.set_mode((1, 1))
+
+from main import parse_args, replay_layout
+from modules.controls import InputLog
+
+LEVEL = """[HALL]
+##########
+#........#
+#..H.....#
+#........E
+##########
+"""
+
+
+def saved(log, directory):
+    path = os.path.join(directory, "run.log")
+    log.save(path)
+    return path
+
+
+def expect_exit(args, replay):
+    try:
+        replay_layout(args, replay)
+    except SystemExit as e:
+        return str(e.code)
+    raise AssertionError("기록과 다른 명령줄인데 재생이 시작됨")
+
+
+def test_log_keeps_maze_and_level():
+    with tempfile.TemporaryDirectory() as directory:
+        level = os.path.join(directory, "level.txt")
+        with open(level, "w") as f:
+            f.write(LEVEL)
+
+        path = saved(InputLog(3, 1 / 60, 2, maze=(21, 21)), directory)
+        replay = InputLog.load(path)
+        assert (replay.seed, replay.maze, replay.level) == (3, (21, 21), None)
+        assert replay_layout(parse_args(["--replay", path]), replay) == (None, (21, 21))
+        assert "23x21" in expect_exit(parse_args(["--replay", path, "--maze", "23x21"]), replay)
+        assert level in expect_exit(parse_args(["--replay", path, "--level", level]), replay)
+
+        path = saved(InputLog(3, 1 / 60, 2, level=level), directory)
+        replay = InputLog.load(path)
+        assert (replay.maze, replay.level) == (None, level)
+        assert replay_layout(parse_args(["--replay", path]), replay) == (level, None)
+        expect_exit(parse_args(["--replay", path, "--maze", "21x21"]), replay)
+
+        # 기록 뒤에 레벨 내용이 바뀌면 같은 경로여도 멈춘다
+        with open(level, "a") as f:
+            f.write("#........#\n")
+        expect_exit(parse_args(["--replay", path]), replay)
+
+
+if __name__ == "__main__":
+    test_log_keeps_maze_and_level()
+    print("입력 기록 미로 / 레벨 OK")
@@ -0,0 +1,60 @@
+# hollowescape/tests/simulation/worldTest.py
+# World.step 방 이동 확인 - 플레이어가 입구를 밟으면 연결된 방으로 (python tests/simulation/worldTest.py)
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+pygame.display.init()
+pygame.display.set_mode((1, 1))
+
+from modules.controls import ScriptedInput
+from modules.events import RoomChanged
+from modules.map_manager import TILE_SIZE
+from modules.simulation import build_demo_world
+
+DT = 1 / 60
+
+
+def world_at(tile, script):
+    """몬스터 없는 데모 월드, 플레이어를 HALL 의 tile 에 두고 script 대로 움직인다"""
+    world = build_demo_world(ScriptedInput.parse(script), monster_count=0, seed=1)
+    world.player.place(tile[0] * TILE_SIZE, tile[1] * TILE_SIZE)
+    return world
+
+
+def test_player_walks_through_entrance():
+    # HALL (24, 6) 입구 <-> CELLAR (0, 5) 입구
+    world = world_at((23, 6), "RIGHT:10,NONE:10,LEFT:30")
+    moves = []
+    world.events.subscribe(moves.append, RoomChanged)
+
+    for _ in range(20):
+        world.step(DT)
+    world.events.dispatch()
+    assert world.player_map == "CELLAR", world.player_map
+    assert [(e.old_map, e.new_map, e.tile) for e in moves] == [("HALL", "CELLAR", (1, 5))]
+
+    # CELLAR 벽 색인으로 충돌 - 벽 타일에 들어가지 않고 입구로 되돌아간다
+    for _ in range(30):
+        world.step(DT)
+        assert world.map_manager.is_walkable(world.player.tile_x, world.player.tile_y, world.player_map)
+    world.events.dispatch()
+    assert world.player_map == "HALL", world.player_map
+    assert [(e.old_map, e.new_map, e.tile) for e in moves[1:]] == [("CELLAR", "HALL", (23, 6))]
+
+
+def test_player_stays_off_unlinked_rooms():
+    # 입구가 아닌 곳은 방이 바뀌지 않는다
+    world = world_at((1, 1), "RIGHT:30,DOWN:30")
+    for _ in range(60):
+        world.step(DT)
+    assert world.player_map == "HALL"
+
+
+if __name__ == "__main__":
+    test_player_walks_through_entrance()
+    test_player_stays_off_unlinked_rooms()
+    print("World.step 방 이동 OK")